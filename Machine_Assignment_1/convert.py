@@ -1,7 +1,20 @@
 import sys
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 MAX_DIGITS = 8
 
+# Number of characters read at a time when streaming input
+CHUNK_SIZE = 64 * 1024
+
+# Width of the "Base 10" column when streaming from stdin. Wide enough for
+# any float written in scientific notation, e.g., -1.2345678901234567e-308
+FIXED_DECIMAL_WIDTH = 24
+
+# Number of values handed to a worker process at a time with --jobs
+JOB_CHUNK_SIZE = 10000
+
 
 def decimal_to_binary_fraction(x):
     """
@@ -40,28 +53,270 @@ def convert(x):
         return decimal_to_binary_fraction(x)
 
 
-def main():
-    inputs = sys.argv[1:]
-    
-    # Convert all inputs first so we can calculate column widths
-    results = []
-    for arg in inputs:
+def read_values(stream, chunk_size=CHUNK_SIZE):
+    """
+    Yield whitespace separated values from a text stream.
+
+    The stream is read chunk_size characters at a time, so only one chunk
+    is held in memory no matter how large the input is.
+    """
+    leftover = ""
+
+    while True:
+        chunk = stream.read(chunk_size)
+
+        if not chunk:
+            break
+
+        tokens = (leftover + chunk).split()
+
+        # The last token may continue in the next chunk
+        leftover = ""
+        if tokens and not chunk[-1].isspace():
+            leftover = tokens.pop()
+
+        yield from tokens
+
+    if leftover:
+        yield leftover
+
+
+def convert_values(values, jobs=1):
+    """
+    Convert a sequence of numeric strings one at a time.
+
+    If jobs is greater than one, the work is spread across that many
+    processes (see parallel_convert_values).
+
+    Yields (original string, binary string) pairs.
+    """
+    if jobs > 1:
+        yield from parallel_convert_values(values, jobs)
+        return
+
+    for arg in values:
         decimal_value = float(arg)
-        binary_value = convert(decimal_value)
-        results.append((arg, binary_value))
-    
-    # Calculate column widths (minimum width for headers)
-    col1_width = max(len("Base 10"), max(len(r[0]) for r in results))
-    col2_width = max(len("Base 2"), max(len(r[1]) for r in results))
-    
+        yield (arg, convert(decimal_value))
+
+
+def chunked(values, chunk_size):
+    """
+    Group a sequence of values into lists of (at most) chunk_size values.
+    """
+    chunk = []
+
+    for value in values:
+        chunk.append(value)
+
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def convert_chunk(chunk):
+    """
+    Convert one chunk of numeric strings. This is the unit of work run by
+    each worker process.
+
+    Returns a list of (original string, binary string) pairs.
+    """
+    return list(convert_values(chunk))
+
+
+def parallel_convert_values(values, jobs, chunk_size=JOB_CHUNK_SIZE):
+    """
+    Convert a sequence of numeric strings using a pool of jobs worker
+    processes.
+
+    The input is split into chunks which are converted with convert_chunk.
+    At most 2 * jobs chunks are in flight at once, so memory stays bounded
+    for streamed input. Results are yielded in input order.
+
+    Yields (original string, binary string) pairs.
+    """
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+
+        for chunk in chunked(values, chunk_size):
+            pending.append(executor.submit(convert_chunk, chunk))
+
+            if len(pending) >= 2 * jobs:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def column_widths(results):
+    """
+    Return the (col1_width, col2_width) needed to align every row in
+    results. The headers set the minimum width.
+    """
+    col1_width = len("Base 10")
+    col2_width = len("Base 2")
+
+    for decimal_str, binary_str in results:
+        col1_width = max(col1_width, len(decimal_str))
+        col2_width = max(col2_width, len(binary_str))
+
+    return (col1_width, col2_width)
+
+
+def fixed_column_widths():
+    """
+    Return column widths that do not depend on the input.
+
+    Used when the input can only be read once (e.g., stdin). The widths fit
+    any float written in scientific notation and a truncated fraction with
+    MAX_DIGITS digits.
+    """
+    col1_width = max(len("Base 10"), FIXED_DECIMAL_WIDTH)
+    col2_width = max(len("Base 2"), len("0.") + MAX_DIGITS + len("..."))
+
+    return (col1_width, col2_width)
+
+
+def print_table(results, col1_width, col2_width):
+    """
+    Print the Markdown table, writing each row as soon as it is available.
+    """
     # Print header
     print(f"| {'Base 10':<{col1_width}} | {'Base 2':<{col2_width}} |")
     print(f"| {':':-<{col1_width}} | {':':-<{col2_width}} |")
-    
+
     # Print data rows
     for decimal_str, binary_str in results:
         print(f"| {decimal_str:<{col1_width}} | {binary_str:<{col2_width}} |")
 
 
+def spool_results(results, spool):
+    """
+    Write each (decimal, binary) pair to spool as a tab separated line and
+    yield the pair, so the caller can measure it on the way through.
+    """
+    for decimal_str, binary_str in results:
+        spool.write(f"{decimal_str}\t{binary_str}\n")
+        yield (decimal_str, binary_str)
+
+
+def read_spool(spool):
+    """
+    Yield the (decimal, binary) pairs written by spool_results.
+    """
+    for line in spool:
+        decimal_str, binary_str = line.rstrip("\n").split("\t", 1)
+        yield (decimal_str, binary_str)
+
+
+def stream_file(path, jobs=1):
+    """
+    Convert every value in a file in a single pass. The rows are spooled
+    to a temporary file while the column widths are computed, then printed
+    from the spool, so every value is converted once and memory use does
+    not grow with the size of the file.
+    """
+    with open(path) as stream, tempfile.TemporaryFile("w+") as spool:
+        col1_width, col2_width = column_widths(
+            spool_results(convert_values(read_values(stream), jobs), spool)
+        )
+
+        spool.seek(0)
+        print_table(read_spool(spool), col1_width, col2_width)
+
+
+def stream_stdin(jobs=1):
+    """
+    Convert every value read from stdin in a single pass using fixed
+    column widths.
+    """
+    col1_width, col2_width = fixed_column_widths()
+    print_table(convert_values(read_values(sys.stdin), jobs),
+                col1_width, col2_width)
+
+
+USAGE = "Usage: convert.py [--file PATH] [--jobs N] [value ...]"
+
+
+def usage_error(message):
+    """
+    Print message and the usage line to stderr and exit with status 2.
+    """
+    print(f"convert.py: {message}", file=sys.stderr)
+    print(USAGE, file=sys.stderr)
+    sys.exit(2)
+
+
+def option_value(name, args):
+    """
+    Return the argument that follows option name, or report a usage error
+    if the command line ends first.
+    """
+    try:
+        return next(args)
+    except StopIteration:
+        usage_error(f"{name} needs a value")
+
+
+def int_option_value(name, args, minimum=0):
+    """
+    Return the integer that follows option name, or report a usage error if
+    it is missing, not an integer or smaller than minimum.
+    """
+    text = option_value(name, args)
+
+    try:
+        value = int(text)
+    except ValueError:
+        usage_error(f"{name} needs an integer, not '{text}'")
+
+    if value < minimum:
+        usage_error(f"{name} must be at least {minimum}")
+
+    return value
+
+
+def parse_args(argv):
+    """
+    Split the command line into (values, input_file, jobs).
+
+    Usage: convert.py [--file PATH] [--jobs N] [value ...]
+    """
+    values = []
+    input_file = None
+    jobs = 1
+
+    args = iter(argv)
+    for arg in args:
+        if arg == "--file":
+            input_file = option_value(arg, args)
+        elif arg == "--jobs":
+            jobs = int_option_value(arg, args, minimum=1)
+        else:
+            values.append(arg)
+
+    return (values, input_file, jobs)
+
+
+def main():
+    inputs, input_file, jobs = parse_args(sys.argv[1:])
+
+    if input_file is not None:
+        stream_file(input_file, jobs)
+        return
+
+    if not inputs:
+        stream_stdin(jobs)
+        return
+
+    # Convert all inputs first so we can calculate column widths
+    results = list(convert_values(inputs, jobs))
+    col1_width, col2_width = column_widths(results)
+
+    print_table(results, col1_width, col2_width)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -95,6 +95,8 @@ run_specific() {
     echo "  4) TestAlgorithmDirectly"
     echo "  5) TestMaxDigitsRespected"
     echo "  6) TestMainFunction"
+    echo "  7) TestStreaming"
+    echo "  8) TestParallel"
     echo ""
     read -p "Enter the number of the test class to run: " choice
     
@@ -105,6 +107,8 @@ run_specific() {
         4) class="TestAlgorithmDirectly" ;;
         5) class="TestMaxDigitsRespected" ;;
         6) class="TestMainFunction" ;;
+        7) class="TestStreaming" ;;
+        8) class="TestParallel" ;;
         *)
             echo -e "${YELLOW}Invalid choice. Running all tests.${NC}"
             run_verbose
@@ -1,5 +1,9 @@
+import io
 import sys
-from convert import decimal_to_binary_fraction, convert, main, MAX_DIGITS
+import pytest
+import convert as convert_module
+from convert import (decimal_to_binary_fraction, convert, convert_values, main, read_values,
+                     parallel_convert_values, MAX_DIGITS)
 
 
 class TestSpecialCases:
@@ -132,4 +136,108 @@ class TestMainFunction:
         
         # All lines should have the same length if columns are aligned
         line_lengths = [len(line) for line in lines]
-        assert all(length == line_lengths[0] for length in line_lengths)
\ No newline at end of file
+        assert all(length == line_lengths[0] for length in line_lengths)
+
+class TestStreaming:
+    def test_read_values_splits_on_whitespace(self):
+        stream = io.StringIO("0.5 0.25\n0.125\n")
+        assert list(read_values(stream)) == ["0.5", "0.25", "0.125"]
+    
+    def test_read_values_joins_tokens_across_chunks(self):
+        stream = io.StringIO("0.625 0.125\n0.75")
+        assert list(read_values(stream, chunk_size=3)) == ["0.625", "0.125", "0.75"]
+    
+    def test_convert_values_is_lazy(self):
+        results = convert_values(iter(["0.5", "not-a-number"]))
+        assert next(results) == ("0.5", "0.1")
+    
+    def test_main_reads_file(self, monkeypatch, capsys, tmp_path):
+        input_file = tmp_path / "values.txt"
+        input_file.write_text("0.5\n0.25\n0.123456789\n")
+        monkeypatch.setattr(sys, 'argv', ['convert.py', '--file', str(input_file)])
+        
+        main()
+        
+        captured = capsys.readouterr()
+        lines = captured.out.strip().split('\n')
+        
+        assert len(lines) == 5
+        assert "0.01" in captured.out
+        line_lengths = [len(line) for line in lines]
+        assert all(length == line_lengths[0] for length in line_lengths)
+    
+    def test_main_reads_stdin_without_arguments(self, monkeypatch, capsys):
+        monkeypatch.setattr(sys, 'argv', ['convert.py'])
+        monkeypatch.setattr(sys, 'stdin', io.StringIO("0.5 0.2\n"))
+        
+        main()
+        
+        captured = capsys.readouterr()
+        lines = captured.out.strip().split('\n')
+        
+        assert "0.00110011..." in captured.out
+        line_lengths = [len(line) for line in lines]
+        assert all(length == line_lengths[0] for length in line_lengths)
+    
+    def test_main_converts_each_file_value_once(self, monkeypatch, capsys, tmp_path):
+        input_file = tmp_path / "values.txt"
+        input_file.write_text("0.5\n0.25\n0.1\n")
+        calls = []
+        
+        def counting_convert(value):
+            calls.append(value)
+            return convert(value)
+        
+        monkeypatch.setattr(convert_module, 'convert', counting_convert)
+        monkeypatch.setattr(sys, 'argv', ['convert.py', '--file', str(input_file)])
+        
+        main()
+        
+        assert calls == [0.5, 0.25, 0.1]
+        assert "| 0.1 " in capsys.readouterr().out
+    
+    def test_option_without_value_is_a_usage_error(self, monkeypatch, capsys):
+        monkeypatch.setattr(sys, 'argv', ['convert.py', '0.5', '--file'])
+        
+        with pytest.raises(SystemExit) as exit_info:
+            main()
+        
+        assert exit_info.value.code == 2
+        assert "--file needs a value" in capsys.readouterr().err
+    
+    @pytest.mark.parametrize("jobs, message", [
+        ('two', "--jobs needs an integer"),
+        ('0', "--jobs must be at least 1"),
+    ])
+    def test_bad_jobs_is_a_usage_error(self, monkeypatch, capsys, jobs, message):
+        monkeypatch.setattr(sys, 'argv', ['convert.py', '0.5', '--jobs', jobs])
+        
+        with pytest.raises(SystemExit) as exit_info:
+            main()
+        
+        err = capsys.readouterr().err
+        assert exit_info.value.code == 2
+        assert message in err
+        assert "Usage:" in err
+
+
+class TestParallel:
+    def test_parallel_results_keep_input_order(self):
+        values = [str(i / 64) for i in range(64)]
+        
+        results = list(parallel_convert_values(values, jobs=2, chunk_size=5))
+        
+        assert results == list(convert_values(values))
+    
+    def test_main_with_jobs_matches_serial(self, monkeypatch, capsys):
+        values = ['0.5', '0.2', '0.125', '0.1', '1', '0']
+        
+        monkeypatch.setattr(sys, 'argv', ['convert.py'] + values)
+        main()
+        serial = capsys.readouterr().out
+        
+        monkeypatch.setattr(sys, 'argv', ['convert.py', '--jobs', '2'] + values)
+        main()
+        parallel = capsys.readouterr().out
+        
+        assert parallel == serial
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Batch (vectorized) version of the decimal to any base conversion in
+convert.py.
+
+Every digit column is computed for the entire array at once using NumPy
+array operations instead of one Python-level loop per value. Integer parts
+are split into multi-digit chunks, one division per chunk, and each chunk
+is expanded into its digits with a table lookup. The strings are written
+into one byte matrix and decoded together. The results match
+convert.convert() exactly, including the '...' truncation marker.
+"""
+
+import numpy as np
+
+from convert import MAX_DIGITS, integer_to_base
+
+# Largest magnitude whose integer part fits in an int64 lane. Anything at or
+# above this is handed back to the scalar integer_to_base.
+INT64_LIMIT = 2.0 ** 63
+
+# Marker used in the digit matrices for "no digit in this column"
+NO_DIGIT = -1
+
+# Largest number of entries in a chunk lookup table. A chunk holds as many
+# digits as fit, e.g., 12 in base 2, 3 in base 10 and 2 in base 60.
+CHUNK_TABLE_SIZE = 4096
+
+
+def chunk_table(base):
+    """
+    Return (digits per chunk, table) for the given base.
+
+    Row i of the table holds the digits of chunk i, most significant
+    first and padded with leading zeros.
+    """
+    chunk_size = 1
+    while base ** (chunk_size + 1) <= CHUNK_TABLE_SIZE:
+        chunk_size += 1
+
+    place_values = base ** np.arange(chunk_size - 1, -1, -1, dtype=np.int64)
+    table = np.arange(base ** chunk_size, dtype=np.int64)[:, None] // place_values % base
+
+    return chunk_size, table
+
+
+def digit_matrices(values, base, max_digits=MAX_DIGITS):
+    """
+    Compute the digits of every value in the given base.
+
+    Returns a tuple (negative, int_digits, frac_digits, truncated):
+      - negative     bool array, True where the value is negative
+      - int_digits   2-D int array, integer digits right-aligned (most
+                     significant digit first), padded on the left with -1
+      - frac_digits  2-D int array with max_digits columns, fractional digits
+                     left-aligned, padded on the right with -1
+      - truncated    bool array, True where the fraction did not terminate
+                     within max_digits digits
+
+    Values whose integer part does not fit in an int64 get an empty row in
+    int_digits (all -1); batch_convert() falls back to the scalar code for
+    those rows.
+    """
+    x = np.asarray(values, dtype=np.float64).ravel()
+
+    if not np.all(np.isfinite(x)):
+        raise ValueError("Only finite values can be converted")
+
+    negative = x < 0
+    magnitude = np.abs(x)
+
+    # Split into integer and fractional parts
+    int_float = np.trunc(magnitude)
+    frac = magnitude - int_float
+
+    # -------------------------------------------------------------------------
+    # Integer part - repeated % and // by base^chunk_size on every lane at
+    # once, then one table lookup per chunk
+    # -------------------------------------------------------------------------
+    small = int_float < INT64_LIMIT
+    n = np.where(small, int_float, 0.0).astype(np.int64)
+
+    chunk_size, table = chunk_table(base)
+    chunk_base = base ** chunk_size
+
+    chunks = []
+    while True:
+        chunks.append(n % chunk_base)
+        n = n // chunk_base
+
+        if not n.any():
+            break
+
+    # Chunks come out least significant first, so flip them
+    int_digits = table[np.stack(chunks[::-1], axis=1)].reshape(
+        x.size, len(chunks) * chunk_size
+    )
+
+    # Left-pad: every leading zero except the last column is padding
+    significant = np.cumsum(int_digits != 0, axis=1) > 0
+    significant[:, -1] = True
+    int_digits[~significant] = NO_DIGIT
+    int_digits[~small] = NO_DIGIT
+
+    # Drop the columns that are padding in every row
+    int_digits = int_digits[:, np.argmax(significant.any(axis=0)):]
+
+    # -------------------------------------------------------------------------
+    # Fractional part - same multiply/truncate loop as fraction_to_base
+    # -------------------------------------------------------------------------
+    # Lanes that have terminated hold c == 0, which stays 0
+    columns = []
+    active = frac != 0
+    c = frac.copy()
+
+    for i in range(max_digits):
+        if not active.any():
+            break
+
+        c *= base
+        digit = np.trunc(c)
+        columns.append(np.where(active, digit, NO_DIGIT).astype(np.int64))
+        c -= digit
+
+        active &= c != 0
+
+    columns += [np.full(x.size, NO_DIGIT, dtype=np.int64)] * (max_digits - len(columns))
+    frac_digits = np.stack(columns, axis=1).reshape(x.size, max_digits)
+
+    truncated = active
+
+    return negative, int_digits, frac_digits, truncated
+
+
+def _digit_cells(base):
+    """
+    Build the table of digit cells for a base.
+
+    A cell holds a digit's string form in a fixed number of bytes (padded
+    with zero bytes) viewed as one unsigned integer, so a whole digit
+    matrix is translated with a single np.take. The table has three
+    blocks of base + 1 cells, one per prefix: none (the first digit), ';'
+    and '.'. Index 0 of each block (NO_DIGIT) is all zero bytes.
+    """
+    width = 1 + len(str(base - 1))
+    cell_type = next(t for t in (np.uint16, np.uint32, np.uint64)
+                     if np.dtype(t).itemsize >= width)
+    cell_bytes = np.dtype(cell_type).itemsize
+
+    table = np.zeros((3, base + 1, cell_bytes), dtype=np.uint8)
+
+    for block, prefix in enumerate(("", ";", ".")):
+        for d in range(base):
+            text = (prefix + str(d)).encode("ascii")
+            table[block, d + 1, :len(text)] = np.frombuffer(text, dtype=np.uint8)
+
+    return table.view(cell_type).ravel()
+
+
+def batch_convert(values, base, max_digits=MAX_DIGITS):
+    """
+    Convert every value in an array to the given base.
+
+    Returns a list of strings identical to calling convert(x, base) on each
+    value.
+    """
+    x = np.asarray(values, dtype=np.float64).ravel()
+    negative, int_digits, frac_digits, truncated = digit_matrices(
+        x, base, max_digits
+    )
+
+    # Index every digit into the cell table: the first integer digit of a
+    # row has no prefix, the first fractional digit follows a '.', and
+    # every other digit follows a ';'
+    semicolon, point = base + 1, 2 * (base + 1)
+    int_columns = int_digits.shape[1]
+
+    # Fractional columns that are empty in every row (e.g., for whole
+    # numbers) would only add padding
+    frac_digits = frac_digits[:, :np.count_nonzero((frac_digits != NO_DIGIT).any(axis=0))]
+    frac_columns = frac_digits.shape[1]
+
+    codes = np.empty((x.size, int_columns + frac_columns), dtype=np.intp)
+    np.add(int_digits, 1, out=codes[:, :int_columns])
+    codes[:, 1:int_columns] += semicolon * (int_digits[:, :-1] != NO_DIGIT)
+
+    if frac_columns:
+        np.add(frac_digits, 1 + semicolon, out=codes[:, int_columns:])
+        codes[:, int_columns] += point - semicolon
+
+    cells = _digit_cells(base).take(codes)
+
+    sign = np.where(negative, ord("-"), 0).astype(np.uint8)
+    dots = np.where(truncated[:, None], np.frombuffer(b"...", dtype=np.uint8), 0)
+    newline = np.full(x.size, ord("\n"), dtype=np.uint8)
+
+    # One row of characters per value, ending in a newline; the zero bytes
+    # that pad the cells are dropped before decoding
+    chars = np.concatenate([sign[:, None],
+                            cells.view(np.uint8),
+                            dots.astype(np.uint8),
+                            newline[:, None]], axis=1).ravel()
+
+    results = chars[chars != 0].tobytes().decode("ascii").split("\n")[:-1]
+
+    # Integer parts too large for an int64 lane use the scalar conversion
+    for i in np.flatnonzero(int_digits[:, -1] == NO_DIGIT).tolist():
+        value = abs(float(x[i]))
+        int_str = integer_to_base(int(value), base)
+
+        if negative[i]:
+            int_str = "-" + int_str
+
+        results[i] = int_str + results[i][1 if negative[i] else 0:]
+
+    return results
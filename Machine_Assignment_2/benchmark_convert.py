@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the decimal to any base converters.
+
+Times every conversion path across bases, value distributions and input
+sizes:
+  - scalar      convert.convert() called in a loop
+  - batch       batch_convert.batch_convert() on a NumPy array
+  - streaming   convert.convert_values() fed by convert.read_values()
+  - binary      Machine_Assignment_1 convert.convert() (base 2, values in
+                [0, 1) only)
+
+Results are written as JSON. If a baseline file is given, the run fails
+(exit status 1) when the throughput of any case drops more than the
+allowed percentage below the baseline.
+
+Usage:
+    benchmark_convert.py [--bases 2-36] [--sizes 1000,10000] [--repeats 3]
+                         [--output results.json] [--baseline baseline.json]
+                         [--threshold 10]
+"""
+
+import argparse
+import importlib.util
+import io
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+from batch_convert import batch_convert
+from convert import convert, convert_values, read_values
+
+DISTRIBUTIONS = ("fraction", "wide", "dyadic", "integer")
+
+DEFAULT_BASES = "2-36"
+DEFAULT_SIZES = "1000"
+DEFAULT_REPEATS = 3
+DEFAULT_THRESHOLD = 10.0
+
+BINARY_CONVERT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                   "..", "Machine_Assignment_1", "convert.py")
+
+
+def load_binary_convert():
+    """
+    Load Machine_Assignment_1/convert.py under a different module name (it
+    would otherwise clash with this directory's convert.py).
+
+    Returns None if the file is not available.
+    """
+    if not os.path.exists(BINARY_CONVERT_PATH):
+        return None
+
+    spec = importlib.util.spec_from_file_location("binary_convert",
+                                                  BINARY_CONVERT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+def generate_values(distribution, size, seed=417):
+    """
+    Return a NumPy array of size values drawn from the named distribution:
+      - fraction   uniform on [0, 1)
+      - wide       uniform on [-10^6, 10^6)
+      - dyadic     k / 2^10, i.e., fractions that terminate in base 2
+      - integer    whole numbers in [0, 10^9)
+    """
+    rng = np.random.default_rng(seed)
+
+    if distribution == "fraction":
+        return rng.random(size)
+
+    if distribution == "wide":
+        return rng.uniform(-1e6, 1e6, size)
+
+    if distribution == "dyadic":
+        return rng.integers(0, 2 ** 10, size) / 2 ** 10
+
+    if distribution == "integer":
+        return rng.integers(0, 10 ** 9, size).astype(np.float64)
+
+    raise ValueError(f"Unknown distribution '{distribution}'")
+
+
+def best_time(function, repeats):
+    """
+    Return the fastest of several runs of function() in seconds.
+    """
+    times = []
+
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start_time)
+
+    return min(times)
+
+
+def benchmark_cases(values, base, binary_module=None):
+    """
+    Return a dictionary mapping a mode name to a zero-argument function
+    that converts every value in values.
+
+    The binary case is only included for base 2 when every value lies in
+    [0, 1], the only inputs Machine_Assignment_1 handles.
+    """
+    value_list = values.tolist()
+    text = "\n".join(repr(x) for x in value_list)
+
+    cases = {
+        "scalar": lambda: [convert(x, base) for x in value_list],
+        "batch": lambda: batch_convert(values, base),
+        "streaming": lambda: list(convert_values(read_values(io.StringIO(text)),
+                                                 base)),
+    }
+
+    if (binary_module is not None and base == 2
+            and all(0 <= x <= 1 for x in value_list)):
+        cases["binary"] = lambda: [binary_module.convert(x) for x in value_list]
+
+    return cases
+
+
+def case_key(mode, base, distribution, size):
+    """
+    Return the string used to identify one benchmark case in the JSON.
+    """
+    return f"{mode}/base={base}/{distribution}/n={size}"
+
+
+def run_benchmarks(bases, sizes, distributions=DISTRIBUTIONS,
+                   repeats=DEFAULT_REPEATS, binary_module=None):
+    """
+    Run every combination of base, distribution, size and mode.
+
+    Returns a dictionary mapping each case key to
+    {"seconds": best time, "values_per_second": throughput}.
+    """
+    results = {}
+
+    for size in sizes:
+        for distribution in distributions:
+            values = generate_values(distribution, size)
+
+            for base in bases:
+                cases = benchmark_cases(values, base, binary_module)
+
+                for mode, function in cases.items():
+                    seconds = best_time(function, repeats)
+                    results[case_key(mode, base, distribution, size)] = {
+                        "seconds": seconds,
+                        "values_per_second": size / seconds if seconds else 0.0,
+                    }
+
+    return results
+
+
+def find_regressions(results, baseline, threshold):
+    """
+    Compare results against a baseline.
+
+    Returns a list of (case key, baseline throughput, current throughput,
+    percent change) for every case whose throughput dropped by more than
+    threshold percent. Cases missing from either side are ignored.
+    """
+    regressions = []
+
+    for key, current in results.items():
+        if key not in baseline:
+            continue
+
+        before = baseline[key]["values_per_second"]
+        after = current["values_per_second"]
+
+        if before <= 0:
+            continue
+
+        change = 100.0 * (after - before) / before
+
+        if change < -threshold:
+            regressions.append((key, before, after, change))
+
+    return regressions
+
+
+def parse_range(text):
+    """
+    Parse a list like "2,8,10" or a range like "2-36" (or a mix of both).
+    """
+    numbers = []
+
+    for part in text.split(","):
+        if "-" in part:
+            start, stop = part.split("-")
+            numbers.extend(range(int(start), int(stop) + 1))
+        else:
+            numbers.append(int(part))
+
+    return numbers
+
+
+def print_summary(results):
+    """
+    Print the throughput of every case as a Markdown table.
+    """
+    key_width = max([len("Case")] + [len(key) for key in results])
+
+    print(f"| {'Case':<{key_width}} | {'Values/s':>14} |")
+    print(f"| {':':-<{key_width}} | {':':->14} |")
+
+    for key, result in results.items():
+        print(f"| {key:<{key_width}} | {result['values_per_second']:>14,.0f} |")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the decimal to any base converters")
+
+    parser.add_argument("--bases", default=DEFAULT_BASES,
+                        help="bases to benchmark, e.g., 2-36 or 2,10,16")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help="input sizes, e.g., 1000,10000")
+    parser.add_argument("--distributions", default=",".join(DISTRIBUTIONS),
+                        help="value distributions to benchmark")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS,
+                        help="runs per case; the fastest one is kept")
+    parser.add_argument("--output", default="benchmark_results.json",
+                        help="where to write the JSON results")
+    parser.add_argument("--baseline",
+                        help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed throughput drop in percent")
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    results = run_benchmarks(parse_range(args.bases),
+                             parse_range(args.sizes),
+                             args.distributions.split(","),
+                             args.repeats,
+                             load_binary_convert())
+
+    report = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+    with open(args.output, "w") as output_file:
+        json.dump(report, output_file, indent=2)
+
+    print_summary(results)
+    print()
+    print(f"Results written to: {args.output}")
+
+    if args.baseline is None:
+        return 0
+
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)["results"]
+
+    regressions = find_regressions(results, baseline, args.threshold)
+
+    if not regressions:
+        print(f"No case slower than the baseline by more than {args.threshold}%")
+        return 0
+
+    print()
+    print(f"{len(regressions)} case(s) regressed by more than {args.threshold}%:")
+    for key, before, after, change in regressions:
+        print(f"  {key}: {before:,.0f} -> {after:,.0f} values/s ({change:+.1f}%)")
+
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
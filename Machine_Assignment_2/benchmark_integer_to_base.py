@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Compare the digit-by-digit integer conversion (slow_integer_to_base) with
+recursive splitting (split_integer_to_base) for growing integer sizes.
+
+Prints a Markdown table of the median time for each method and the
+crossover: the smallest size from which splitting wins at every larger
+size too. Medians and the "every larger size" rule keep one noisy
+measurement from moving the crossover. SPLIT_MIN_BITS in convert.py
+records the value this measured.
+
+Usage: benchmark_integer_to_base.py [BASE] [REPEATS]
+"""
+
+import random
+import statistics
+import sys
+import time
+
+from convert import slow_integer_to_base, split_integer_to_base
+
+BIT_SIZES = [64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768, 65536]
+
+
+def median_time(function, *args, repeats=5):
+    """
+    Return the median of several runs of function(*args) in seconds.
+    """
+    times = []
+
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        function(*args)
+        times.append(time.perf_counter() - start_time)
+
+    return statistics.median(times)
+
+
+def main():
+    base = int(sys.argv[1]) if len(sys.argv) >= 2 else 10
+    repeats = int(sys.argv[2]) if len(sys.argv) >= 3 else 5
+
+    rng = random.Random(417)
+    crossover = None
+
+    print(f"| {'Bits':>8} | {'Loop (s)':>12} | {'Split (s)':>12} | {'Speedup':>8} |")
+    print(f"| {':':->8} | {':':->12} | {':':->12} | {':':->8} |")
+
+    for bits in BIT_SIZES:
+        n = rng.getrandbits(bits) | (1 << (bits - 1))
+
+        assert slow_integer_to_base(n, base) == split_integer_to_base(n, base)
+
+        loop_time = median_time(slow_integer_to_base, n, base, repeats=repeats)
+        split_time = median_time(split_integer_to_base, n, base, repeats=repeats)
+        speedup = loop_time / split_time
+
+        # Reset whenever the loop wins again, so the crossover is the
+        # start of the final run of sizes where splitting wins
+        if split_time >= loop_time:
+            crossover = None
+        elif crossover is None:
+            crossover = bits
+
+        print(f"| {bits:>8} | {loop_time:>12.6f} | {split_time:>12.6f} | {speedup:>7.1f}x |")
+
+    print()
+    print(f"Crossover (base {base}): {crossover} bits")
+
+
+if __name__ == "__main__":
+    main()
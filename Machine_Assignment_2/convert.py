@@ -1,13 +1,216 @@
 #!/usr/bin/env python3
 import sys
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from functools import lru_cache, partial
+from math import gcd
 
 MAX_DIGITS = 8
 
+# Number of characters read at a time when streaming input
+CHUNK_SIZE = 64 * 1024
+
+# Width of the "Base 10" column when streaming from stdin. Wide enough for
+# any float written in scientific notation, e.g., -1.2345678901234567e-308
+FIXED_DECIMAL_WIDTH = 24
+
+# Number of values handed to a worker process at a time with --jobs
+JOB_CHUNK_SIZE = 10000
+
+# Default number of distinct (value, base, max_digits) results kept by
+# cached_convert()
+CACHE_SIZE = 4096
+
+# Memoized versions of convert(), one per cache size, created on first use
+_cached_converts = {}
+
+# Bits per digit for each power-of-two base that has a fast path
+POWER_OF_TWO_BASES = {2: 1, 4: 2, 8: 3, 16: 4, 32: 5}
+
+# Bits looked up per table entry for each power-of-two base. Each entry
+# holds a whole number of digits and the table has at most 2^12 entries.
+LOOKUP_BITS = {2: 12, 4: 12, 8: 12, 16: 12, 32: 10}
+
+# Integers shorter than this many bits are converted with the plain loop,
+# which is as fast for them even once the table is filled in
+POWER_OF_TWO_MIN_BITS = 256
+
+# Digit lookup tables for power-of-two bases, filled in as chunks are seen
+_digit_tables = {}
+
+# Integers with at least this many bits are converted by recursive
+# splitting in other bases. benchmark_integer_to_base.py (median of 5
+# runs) measured the crossover at 1024 bits in bases 3, 10 and 36.
+SPLIT_MIN_BITS = 1024
+
+# Number of digits produced by each leaf of the recursive split
+SPLIT_LEAF_DIGITS = 64
+
+
+def chunk_digits(value, base):
+    """
+    Write a LOOKUP_BITS[base] bit chunk as a fixed number of digits
+    (padded with leading zeros) separated by semicolons, e.g., for base 2
+    chunk 5 is "0;0;...;1;0;1".
+    """
+    bits_per_digit = POWER_OF_TWO_BASES[base]
+    num_digits = LOOKUP_BITS[base] // bits_per_digit
+    mask = base - 1
+
+    return ";".join(str((value >> (bits_per_digit * i)) & mask)
+                    for i in reversed(range(num_digits)))
+
+
+def digit_table(base):
+    """
+    Return the lookup table for a power-of-two base.
+
+    Entry i of the table is chunk_digits(i, base), or None until chunk i is
+    first converted. Filling the table in as chunks are seen (instead of
+    building all 2^LOOKUP_BITS entries up front) keeps the first conversion
+    as cheap as the plain loop; later conversions reuse the entries.
+    """
+    if base not in _digit_tables:
+        _digit_tables[base] = [None] * (1 << LOOKUP_BITS[base])
+
+    return _digit_tables[base]
+
+
+def power_of_two_to_base(n, base):
+    """
+    Convert a positive integer to a power-of-two base (2, 4, 8, 16, 32)
+    using table lookups instead of % and //.
+
+    The bits of n are taken out with a single to_bytes() call and split
+    into LOOKUP_BITS[base] bit chunks, each of which is translated by one
+    lookup in digit_table(base). The work is proportional to the number of
+    chunks, which keeps huge integers (thousands of bits) fast.
+
+    Returns the same string as integer_to_base.
+    """
+    table = digit_table(base)
+    chunk_bits = LOOKUP_BITS[base]
+    mask = (1 << chunk_bits) - 1
+
+    # Pull whole chunks out of groups of bytes. Each group holds
+    # group_bits bits, a multiple of both 8 and chunk_bits.
+    group_bits = chunk_bits * 8 // gcd(chunk_bits, 8)
+    group_bytes = group_bits // 8
+    chunks_per_group = group_bits // chunk_bits
+
+    num_groups = -(-n.bit_length() // group_bits)
+    raw = n.to_bytes(num_groups * group_bytes, "big")
+
+    chunks = []
+    for start in range(0, len(raw), group_bytes):
+        group = int.from_bytes(raw[start:start + group_bytes], "big")
+
+        for shift in range(group_bits - chunk_bits, -1, -chunk_bits):
+            chunks.append((group >> shift) & mask)
+
+    # Drop leading zero chunks; the first non-zero chunk is written
+    # without its padding
+    first = 0
+    while chunks[first] == 0:
+        first += 1
+
+    parts = [slow_integer_to_base(chunks[first], base)]
+
+    for chunk in chunks[first + 1:]:
+        digits = table[chunk]
+
+        if digits is None:
+            digits = table[chunk] = chunk_digits(chunk, base)
+
+        parts.append(digits)
+
+    return ";".join(parts)
+
 
 def integer_to_base(n, base):
     """
     Convert a positive integer to representation in given base.
     Returns a string of digits separated by semicolons.
+
+    Large integers are handed to power_of_two_to_base (bases 2, 4, 8, 16
+    and 32) or split_integer_to_base (every other base).
+    """
+    if n == 0:
+        return "0"
+    
+    bits = n.bit_length()
+    
+    if base in POWER_OF_TWO_BASES and bits >= POWER_OF_TWO_MIN_BITS:
+        return power_of_two_to_base(n, base)
+    
+    if bits >= SPLIT_MIN_BITS:
+        return split_integer_to_base(n, base)
+    
+    return slow_integer_to_base(n, base)
+
+
+def split_integer_to_base(n, base, leaf_digits=SPLIT_LEAF_DIGITS):
+    """
+    Convert a positive integer to representation in given base by
+    recursive splitting.
+
+    With P_k = base^(leaf_digits * 2^k), n is split as n = hi * P_k + lo,
+    where lo becomes exactly leaf_digits * 2^k digits (zero padded) and
+    both halves are split again with P_(k-1). Once a piece is below
+    base^leaf_digits it is finished with the digit-by-digit loop, which
+    is cheap on such small values. Every % and // in the plain loop touches
+    the whole number; here each level only divides by a power half the
+    size of the piece being split.
+
+    Returns the same string as integer_to_base.
+    """
+    # powers[k] = base^(leaf_digits * 2^k)
+    powers = [base ** leaf_digits]
+    while powers[-1] * powers[-1] <= n:
+        powers.append(powers[-1] * powers[-1])
+    
+    digits = []
+    
+    def leaf(m, width):
+        leaf_digits_out = []
+        
+        while m > 0:
+            m, remainder = divmod(m, base)
+            leaf_digits_out.append(str(remainder))
+        
+        # Pad the lower halves out to their full width
+        if width is not None:
+            leaf_digits_out.extend(["0"] * (width - len(leaf_digits_out)))
+        
+        leaf_digits_out.reverse()
+        digits.extend(leaf_digits_out)
+    
+    def split(m, k, width):
+        if k < 0:
+            leaf(m, width)
+            return
+        
+        hi, lo = divmod(m, powers[k])
+        lo_width = leaf_digits << k
+        
+        if width is None and hi == 0:
+            split(lo, k - 1, None)
+        else:
+            split(hi, k - 1, None if width is None else width - lo_width)
+            split(lo, k - 1, lo_width)
+    
+    split(n, len(powers) - 1, None)
+    
+    return ";".join(digits)
+
+
+def slow_integer_to_base(n, base):
+    """
+    Convert a positive integer to representation in given base one digit
+    at a time using % and //.
+    Returns a string of digits separated by semicolons.
     """
     if n == 0:
         return "0"
@@ -25,16 +228,16 @@ def integer_to_base(n, base):
     return ";".join(digits)
 
 
-def fraction_to_base(x, base):
+def fraction_to_base(x, base, max_digits=MAX_DIGITS):
     """
     Convert a decimal fraction (0 < x < 1) to representation in given base.
     Returns a string of digits separated by semicolons.
-    May end with '...' if truncated.
+    May end with '...' if truncated after max_digits digits.
     """
     digits = []
     c = x
     
-    for i in range(MAX_DIGITS):
+    for i in range(max_digits):
         c = c * base
         digit = int(c)
         digits.append(str(digit))
@@ -51,7 +254,7 @@ def fraction_to_base(x, base):
     return result
 
 
-def decimal_to_base(x, base):
+def decimal_to_base(x, base, max_digits=MAX_DIGITS):
     """
     Convert any decimal number to representation in given base.
     Handles negative numbers and numbers >= 1.
@@ -59,7 +262,7 @@ def decimal_to_base(x, base):
     """
     # Handle negative numbers
     if x < 0:
-        return "-" + decimal_to_base(-x, base)
+        return "-" + decimal_to_base(-x, base, max_digits)
     
     # Split into integer and fractional parts
     int_part = int(x)
@@ -72,43 +275,453 @@ def decimal_to_base(x, base):
     if frac_part == 0:
         return int_str
     
-    frac_str = fraction_to_base(frac_part, base)
+    frac_str = fraction_to_base(frac_part, base, max_digits)
     
     return int_str + "." + frac_str
 
 
-def convert(x, base):
+def exact_fraction_digits(numerator, denominator, base, max_digits=MAX_DIGITS):
     """
-    Main conversion function.
+    Compute the digits of numerator / denominator (0 <= numerator <
+    denominator) in given base using only integer arithmetic.
+
+    Long division is carried out on the remainder. The index at which each
+    remainder was first seen is recorded; as soon as a remainder repeats,
+    the digits since that index form the repetend.
+
+    Returns a tuple (prefix, repetend, truncated):
+      - prefix      list of digits before the repeating part
+      - repetend    list of repeating digits (empty if the expansion ends)
+      - truncated   True if max_digits digits were produced before the
+                    expansion ended or started repeating
     """
-    return decimal_to_base(x, base)
+    digits = []
+    seen = {}
+    remainder = numerator
+    
+    while remainder != 0 and remainder not in seen:
+        if len(digits) == max_digits:
+            return (digits, [], True)
+        
+        seen[remainder] = len(digits)
+        digit, remainder = divmod(remainder * base, denominator)
+        digits.append(digit)
+    
+    if remainder == 0:
+        return (digits, [], False)
+    
+    start = seen[remainder]
+    return (digits[:start], digits[start:], False)
 
 
-def main():
-    # First argument is the base, rest are numbers to convert
-    base = int(sys.argv[1])
-    inputs = sys.argv[2:]
+def exact_decimal_to_base(x, base, max_digits=MAX_DIGITS):
+    """
+    Convert any number to representation in given base without rounding.
+
+    x may be anything fractions.Fraction accepts. A string such as "0.1" is
+    taken as the exact decimal value 1/10; a float is taken as the exact
+    binary value it stores.
+
+    Repeating digits are wrapped in parentheses, e.g., 1/10 in base 2 is
+    "0.0;(0;0;1;1)". The fraction is truncated with '...' only if neither
+    the end of the expansion nor its period is found within max_digits
+    digits.
+    """
+    x = Fraction(x)
     
-    # Convert all inputs first so we can calculate column widths
-    results = []
-    for arg in inputs:
-        decimal_value = float(arg)
-        converted_value = convert(decimal_value, base)
-        results.append((arg, converted_value))
+    # Handle negative numbers
+    if x < 0:
+        return "-" + exact_decimal_to_base(-x, base, max_digits)
     
-    # Calculate column widths (minimum width for headers)
-    base_header = f"Base {base}"
-    col1_width = max(len("Base 10"), max(len(r[0]) for r in results))
-    col2_width = max(len(base_header), max(len(r[1]) for r in results))
+    int_part, remainder = divmod(x.numerator, x.denominator)
+    int_str = integer_to_base(int_part, base)
+    
+    if remainder == 0:
+        return int_str
+    
+    prefix, repetend, truncated = exact_fraction_digits(
+        remainder, x.denominator, base, max_digits
+    )
+    
+    frac_digits = [str(d) for d in prefix]
+    
+    if repetend:
+        frac_digits.append("(" + ";".join(str(d) for d in repetend) + ")")
     
+    frac_str = ";".join(frac_digits)
+    
+    if truncated:
+        frac_str = frac_str + "..."
+    
+    return int_str + "." + frac_str
+
+
+def convert(x, base, max_digits=MAX_DIGITS):
+    """
+    Main conversion function.
+    """
+    return decimal_to_base(x, base, max_digits)
+
+
+def cached_convert(maxsize=CACHE_SIZE):
+    """
+    Return a version of convert() memoized by a bounded LRU cache keyed by
+    (x, base, max_digits).
+
+    The same cached function is returned for the same maxsize, so every
+    caller in a process shares one cache. Hit/miss statistics are available
+    through its cache_info() method.
+    """
+    if maxsize not in _cached_converts:
+        _cached_converts[maxsize] = lru_cache(maxsize=maxsize)(convert)
+
+    return _cached_converts[maxsize]
+
+
+def format_cache_info(info):
+    """
+    Return a one line summary of a functools cache_info() tuple.
+    """
+    lookups = info.hits + info.misses
+    hit_rate = 100.0 * info.hits / lookups if lookups else 0.0
+
+    return (f"Cache: {info.hits} hits, {info.misses} misses "
+            f"({hit_rate:.1f}% hit rate), "
+            f"{info.currsize}/{info.maxsize} entries")
+
+
+def read_values(stream, chunk_size=CHUNK_SIZE):
+    """
+    Yield whitespace separated values from a text stream.
+
+    The stream is read chunk_size characters at a time, so only one chunk
+    is held in memory no matter how large the input is.
+    """
+    leftover = ""
+
+    while True:
+        chunk = stream.read(chunk_size)
+
+        if not chunk:
+            break
+
+        tokens = (leftover + chunk).split()
+
+        # The last token may continue in the next chunk
+        leftover = ""
+        if tokens and not chunk[-1].isspace():
+            leftover = tokens.pop()
+
+        yield from tokens
+
+    if leftover:
+        yield leftover
+
+
+def convert_values(values, base, max_digits=MAX_DIGITS, exact=False, jobs=1,
+                   cache_size=0):
+    """
+    Convert a sequence of numeric strings one at a time.
+
+    If exact is True, each string is converted with exact_decimal_to_base
+    instead of being parsed as a float first. If jobs is greater than one,
+    the work is spread across that many processes (see
+    parallel_convert_values). If cache_size is non-zero, float conversions
+    go through cached_convert(cache_size); each worker process keeps its
+    own cache.
+
+    Yields (original string, converted string) pairs.
+    """
+    if jobs > 1:
+        yield from parallel_convert_values(values, base, jobs,
+                                           max_digits=max_digits, exact=exact,
+                                           cache_size=cache_size)
+        return
+
+    convert_fn = cached_convert(cache_size) if cache_size else convert
+
+    for arg in values:
+        if exact:
+            yield (arg, exact_decimal_to_base(arg, base, max_digits))
+        else:
+            decimal_value = float(arg)
+            yield (arg, convert_fn(decimal_value, base, max_digits))
+
+
+def chunked(values, chunk_size):
+    """
+    Group a sequence of values into lists of (at most) chunk_size values.
+    """
+    chunk = []
+
+    for value in values:
+        chunk.append(value)
+
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def convert_chunk(chunk, base, **convert_options):
+    """
+    Convert one chunk of numeric strings. This is the unit of work run by
+    each worker process.
+
+    Returns a list of (original string, converted string) pairs.
+    """
+    return list(convert_values(chunk, base, **convert_options))
+
+
+def parallel_convert_values(values, base, jobs, chunk_size=JOB_CHUNK_SIZE,
+                            **convert_options):
+    """
+    Convert a sequence of numeric strings using a pool of jobs worker
+    processes.
+
+    The input is split into chunks which are converted with convert_chunk.
+    At most 2 * jobs chunks are in flight at once, so memory stays bounded
+    for streamed input. Results are yielded in input order.
+
+    Yields (original string, converted string) pairs.
+    """
+    worker = partial(convert_chunk, base=base, **convert_options)
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+
+        for chunk in chunked(values, chunk_size):
+            pending.append(executor.submit(worker, chunk))
+
+            if len(pending) >= 2 * jobs:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def column_widths(results, base):
+    """
+    Return the (col1_width, col2_width) needed to align every row in
+    results. The headers set the minimum width.
+    """
+    col1_width = len("Base 10")
+    col2_width = len(f"Base {base}")
+
+    for decimal_str, converted_str in results:
+        col1_width = max(col1_width, len(decimal_str))
+        col2_width = max(col2_width, len(converted_str))
+
+    return (col1_width, col2_width)
+
+
+def fixed_column_widths(base, max_digits=MAX_DIGITS):
+    """
+    Return column widths that do not depend on the input.
+
+    Used when the input can only be read once (e.g., stdin). The widths fit
+    any float written in scientific notation and a number with up to
+    max_digits integer and fractional digits. Wider rows are still printed,
+    they just do not line up.
+    """
+    digit_width = len(str(base - 1))
+    part_width = max_digits * (digit_width + 1) - 1
+
+    col1_width = max(len("Base 10"), FIXED_DECIMAL_WIDTH)
+    col2_width = max(len(f"Base {base}"),
+                     len("-") + part_width + len(".") + part_width
+                     + len("()") + len("..."))
+
+    return (col1_width, col2_width)
+
+
+def print_table(results, base, col1_width, col2_width):
+    """
+    Print the Markdown table, writing each row as soon as it is available.
+    """
+    base_header = f"Base {base}"
+
     # Print header
     print(f"| {'Base 10':<{col1_width}} | {base_header:<{col2_width}} |")
     print(f"| {':':-<{col1_width}} | {':':-<{col2_width}} |")
-    
+
     # Print data rows
     for decimal_str, converted_str in results:
         print(f"| {decimal_str:<{col1_width}} | {converted_str:<{col2_width}} |")
 
 
+def spool_results(results, spool):
+    """
+    Write each (decimal, converted) pair to spool as a tab separated line
+    and yield the pair, so the caller can measure it on the way through.
+    """
+    for decimal_str, converted_str in results:
+        spool.write(f"{decimal_str}\t{converted_str}\n")
+        yield (decimal_str, converted_str)
+
+
+def read_spool(spool):
+    """
+    Yield the (decimal, converted) pairs written by spool_results.
+    """
+    for line in spool:
+        decimal_str, converted_str = line.rstrip("\n").split("\t", 1)
+        yield (decimal_str, converted_str)
+
+
+def stream_file(path, base, **convert_options):
+    """
+    Convert every value in a file in a single pass. The rows are spooled
+    to a temporary file while the column widths are computed, then printed
+    from the spool, so every value is converted once and memory use does
+    not grow with the size of the file.
+
+    convert_options are passed through to convert_values.
+    """
+    with open(path) as stream, tempfile.TemporaryFile("w+") as spool:
+        col1_width, col2_width = column_widths(
+            spool_results(convert_values(read_values(stream), base, **convert_options),
+                          spool),
+            base,
+        )
+
+        spool.seek(0)
+        print_table(read_spool(spool), base, col1_width, col2_width)
+
+
+def stream_stdin(base, **convert_options):
+    """
+    Convert every value read from stdin in a single pass using fixed
+    column widths.
+
+    convert_options are passed through to convert_values.
+    """
+    max_digits = convert_options.get("max_digits", MAX_DIGITS)
+    col1_width, col2_width = fixed_column_widths(base, max_digits)
+    print_table(convert_values(read_values(sys.stdin), base, **convert_options),
+                base, col1_width, col2_width)
+
+
+USAGE = ("Usage: convert.py BASE [--file PATH] [--digits N] [--exact] [--jobs N]\n"
+         "                  [--cache N] [value ...]")
+
+
+def usage_error(message):
+    """
+    Print message and the usage line to stderr and exit with status 2.
+    """
+    print(f"convert.py: {message}", file=sys.stderr)
+    print(USAGE, file=sys.stderr)
+    sys.exit(2)
+
+
+def option_value(name, args):
+    """
+    Return the argument that follows option name, or report a usage error
+    if the command line ends first.
+    """
+    try:
+        return next(args)
+    except StopIteration:
+        usage_error(f"{name} needs a value")
+
+
+def int_option_value(name, args, minimum=0):
+    """
+    Return the integer that follows option name, or report a usage error if
+    it is missing, not an integer or smaller than minimum.
+    """
+    text = option_value(name, args)
+
+    try:
+        value = int(text)
+    except ValueError:
+        usage_error(f"{name} needs an integer, not '{text}'")
+
+    if value < minimum:
+        usage_error(f"{name} must be at least {minimum}")
+
+    return value
+
+
+def parse_args(argv):
+    """
+    Split the command line into (base, values, options).
+
+    Usage: convert.py BASE [--file PATH] [--digits N] [--exact] [--jobs N]
+                      [--cache N] [value ...]
+
+    options is a dictionary with the keys:
+      - input_file   file to read values from (None to use the values list)
+      - max_digits   maximum number of fractional digits
+      - exact        use exact_decimal_to_base instead of float conversion
+      - jobs         number of worker processes
+      - cache_size   number of entries in the conversion cache (0 = off)
+    """
+    if not argv:
+        usage_error("missing BASE")
+
+    try:
+        base = int(argv[0])
+    except ValueError:
+        usage_error(f"BASE must be an integer, not '{argv[0]}'")
+
+    if base < 2:
+        usage_error("BASE must be at least 2")
+
+    values = []
+    options = {
+        "input_file": None,
+        "max_digits": MAX_DIGITS,
+        "exact": False,
+        "jobs": 1,
+        "cache_size": 0,
+    }
+
+    args = iter(argv[1:])
+    for arg in args:
+        if arg == "--file":
+            options["input_file"] = option_value(arg, args)
+        elif arg == "--digits":
+            options["max_digits"] = int_option_value(arg, args)
+        elif arg == "--exact":
+            options["exact"] = True
+        elif arg == "--jobs":
+            options["jobs"] = int_option_value(arg, args, minimum=1)
+        elif arg == "--cache":
+            options["cache_size"] = int_option_value(arg, args)
+        else:
+            values.append(arg)
+
+    return (base, values, options)
+
+
+def main():
+    # First argument is the base, rest are numbers to convert
+    base, inputs, options = parse_args(sys.argv[1:])
+
+    input_file = options.pop("input_file")
+
+    if input_file is not None:
+        stream_file(input_file, base, **options)
+
+    elif not inputs:
+        stream_stdin(base, **options)
+
+    else:
+        # Convert all inputs first so we can calculate column widths
+        results = list(convert_values(inputs, base, **options))
+        col1_width, col2_width = column_widths(results, base)
+
+        print_table(results, base, col1_width, col2_width)
+
+    # Worker processes keep their own caches, so only report serial runs
+    if options["cache_size"] and options["jobs"] <= 1:
+        cache_info = cached_convert(options["cache_size"]).cache_info()
+        print(format_cache_info(cache_info), file=sys.stderr)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -50,7 +50,7 @@ run_verbose() {
     echo ""
     echo -e "${GREEN}Running all tests (verbose mode)...${NC}"
     echo ""
-    python3 -m pytest test_convert.py -v
+    python3 -m pytest test_convert.py test_batch_convert.py test_benchmark_convert.py -v
 }
 
 run_coverage() {
@@ -69,21 +69,21 @@ run_coverage() {
     
     echo -e "${GREEN}Running tests with coverage report...${NC}"
     echo ""
-    python3 -m pytest test_convert.py -v --cov=convert --cov-report=term-missing
+    python3 -m pytest test_convert.py test_batch_convert.py test_benchmark_convert.py -v --cov=convert --cov=batch_convert --cov=benchmark_convert --cov-report=term-missing
 }
 
 run_quiet() {
     echo ""
     echo -e "${GREEN}Running tests (quiet mode)...${NC}"
     echo ""
-    python3 -m pytest test_convert.py -q
+    python3 -m pytest test_convert.py test_batch_convert.py test_benchmark_convert.py -q
 }
 
 run_failed() {
     echo ""
     echo -e "${GREEN}Running only previously failed tests...${NC}"
     echo ""
-    python3 -m pytest test_convert.py -v --lf
+    python3 -m pytest test_convert.py test_batch_convert.py test_benchmark_convert.py -v --lf
 }
 
 run_specific() {
@@ -99,6 +99,12 @@ run_specific() {
     echo "  8) TestRepeatingNumbers"
     echo "  9) TestAlgorithmDirectly"
     echo "  10) TestMainFunction"
+    echo "  11) TestStreaming"
+    echo "  12) TestExactConversion"
+    echo "  13) TestParallel"
+    echo "  14) TestCache"
+    echo "  15) TestPowerOfTwoBases"
+    echo "  16) TestSplitConversion"
     echo ""
     read -p "Enter the number of the test class to run: " choice
     
@@ -113,6 +119,12 @@ run_specific() {
         8) class="TestRepeatingNumbers" ;;
         9) class="TestAlgorithmDirectly" ;;
         10) class="TestMainFunction" ;;
+        11) class="TestStreaming" ;;
+        12) class="TestExactConversion" ;;
+        13) class="TestParallel" ;;
+        14) class="TestCache" ;;
+        15) class="TestPowerOfTwoBases" ;;
+        16) class="TestSplitConversion" ;;
         *)
             echo -e "${YELLOW}Invalid choice. Running all tests.${NC}"
             run_verbose
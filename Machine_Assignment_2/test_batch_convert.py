@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+import numpy as np
+import pytest
+
+from convert import convert, MAX_DIGITS
+from batch_convert import batch_convert, chunk_table, digit_matrices, NO_DIGIT
+
+
+SAMPLE_VALUES = [0, 1, 0.5, 0.25, 0.625, 1/3, 1/6, 0.1, 0.2, 5.625, 42.5,
+                 255, 256, -0.75, -5.625, -1/3, -0.0, 123456.789, 2.0 ** 70]
+
+
+class TestMatchesScalarPath:
+    @pytest.mark.parametrize("base", [2, 3, 10, 16, 36, 60])
+    def test_sample_values(self, base):
+        expected = [convert(x, base) for x in SAMPLE_VALUES]
+        assert batch_convert(np.array(SAMPLE_VALUES), base) == expected
+
+    def test_random_values(self):
+        rng = np.random.default_rng(417)
+        values = np.concatenate([rng.uniform(-1e6, 1e6, 500),
+                                 rng.random(500)])
+        expected = [convert(x, 7) for x in values.tolist()]
+        assert batch_convert(values, 7) == expected
+
+    def test_accepts_lists(self):
+        assert batch_convert([0.5, 0.25], 2) == ["0.1", "0.0;1"]
+
+    def test_empty_input(self):
+        assert batch_convert(np.array([]), 2) == []
+
+    @pytest.mark.parametrize("base", [2, 60, 1000, 12345])
+    def test_values_near_int64_limit(self, base):
+        values = [2.0 ** 62 + 2048, 2.0 ** 63 - 1024, 12345.5, -0.1, 0.0]
+        expected = [convert(x, base) for x in values]
+        assert batch_convert(np.array(values), base) == expected
+
+    def test_rejects_non_finite(self):
+        with pytest.raises(ValueError):
+            batch_convert(np.array([1.0, np.inf]), 2)
+
+
+class TestDigitMatrices:
+    def test_integer_digits_are_right_aligned(self):
+        _, int_digits, _, _ = digit_matrices(np.array([5.0, 1.0]), 2)
+        assert int_digits.tolist() == [[1, 0, 1],
+                                       [NO_DIGIT, NO_DIGIT, 1]]
+
+    def test_fraction_digits_are_left_aligned(self):
+        _, _, frac_digits, truncated = digit_matrices(np.array([0.625]), 2)
+        assert frac_digits.shape == (1, MAX_DIGITS)
+        assert frac_digits[0, :3].tolist() == [1, 0, 1]
+        assert all(d == NO_DIGIT for d in frac_digits[0, 3:])
+        assert not truncated[0]
+
+    def test_repeating_fraction_is_truncated(self):
+        _, _, frac_digits, truncated = digit_matrices(np.array([1/3]), 2)
+        assert NO_DIGIT not in frac_digits[0]
+        assert truncated[0]
+
+    def test_negative_flags(self):
+        negative, _, _, _ = digit_matrices(np.array([-0.5, 0.5, -0.0]), 2)
+        assert negative.tolist() == [True, False, False]
+
+
+class TestChunkTable:
+    @pytest.mark.parametrize("base, chunk_size", [(2, 12), (10, 3), (60, 2), (5000, 1)])
+    def test_chunk_size(self, base, chunk_size):
+        assert chunk_table(base)[0] == chunk_size
+
+    def test_rows_are_padded_digits(self):
+        _, table = chunk_table(10)
+        assert table.shape == (1000, 3)
+        assert table[7].tolist() == [0, 0, 7]
+        assert table[415].tolist() == [4, 1, 5]
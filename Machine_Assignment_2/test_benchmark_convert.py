@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+import json
+
+import pytest
+
+from benchmark_convert import (case_key, find_regressions, generate_values, main,
+                               parse_range, run_benchmarks, DISTRIBUTIONS)
+
+
+class TestParseRange:
+    def test_range(self):
+        assert parse_range("2-5") == [2, 3, 4, 5]
+
+    def test_list(self):
+        assert parse_range("2,10,16") == [2, 10, 16]
+
+    def test_mixed(self):
+        assert parse_range("2-4,36") == [2, 3, 4, 36]
+
+
+class TestGenerateValues:
+    @pytest.mark.parametrize("distribution", DISTRIBUTIONS)
+    def test_size(self, distribution):
+        assert generate_values(distribution, 50).size == 50
+
+    def test_dyadic_values_terminate_in_base_2(self):
+        values = generate_values("dyadic", 100)
+        assert all((x * 2 ** 10).is_integer() for x in values.tolist())
+
+    def test_unknown_distribution(self):
+        with pytest.raises(ValueError):
+            generate_values("normal", 10)
+
+
+class TestRunBenchmarks:
+    def test_records_every_case(self):
+        results = run_benchmarks([2, 16], [20], ["fraction"], repeats=1)
+
+        assert set(results) == {case_key(mode, base, "fraction", 20)
+                                for mode in ("scalar", "batch", "streaming")
+                                for base in (2, 16)}
+        assert all(r["values_per_second"] > 0 for r in results.values())
+
+
+class TestFindRegressions:
+    def test_drop_beyond_threshold_is_reported(self):
+        baseline = {"a": {"values_per_second": 1000.0}}
+        results = {"a": {"values_per_second": 800.0}}
+
+        regressions = find_regressions(results, baseline, threshold=10)
+
+        assert len(regressions) == 1
+        assert regressions[0][0] == "a"
+        assert regressions[0][3] == pytest.approx(-20.0)
+
+    def test_drop_within_threshold_is_ignored(self):
+        baseline = {"a": {"values_per_second": 1000.0}}
+        results = {"a": {"values_per_second": 950.0}}
+
+        assert find_regressions(results, baseline, threshold=10) == []
+
+    def test_missing_cases_are_ignored(self):
+        baseline = {"a": {"values_per_second": 1000.0}}
+        results = {"b": {"values_per_second": 1.0}}
+
+        assert find_regressions(results, baseline, threshold=10) == []
+
+
+class TestMain:
+    def test_writes_json(self, tmp_path, capsys):
+        output = tmp_path / "results.json"
+
+        status = main(["--bases", "2", "--sizes", "10", "--repeats", "1",
+                       "--distributions", "fraction", "--output", str(output)])
+
+        assert status == 0
+        assert "scalar/base=2/fraction/n=10" in json.loads(output.read_text())["results"]
+
+    def test_fails_on_regression(self, tmp_path, capsys):
+        output = tmp_path / "results.json"
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps({"results": {
+            "scalar/base=2/fraction/n=10": {"values_per_second": 1e300}}}))
+
+        status = main(["--bases", "2", "--sizes", "10", "--repeats", "1",
+                       "--distributions", "fraction", "--output", str(output),
+                       "--baseline", str(baseline)])
+
+        assert status == 1
+        assert "regressed" in capsys.readouterr().out
@@ -1,6 +1,14 @@
 #!/usr/bin/env python3
+import io
 import sys
-from convert import integer_to_base, fraction_to_base, decimal_to_base, convert, main, MAX_DIGITS
+from fractions import Fraction
+import pytest
+import convert as convert_module
+from convert import (integer_to_base, fraction_to_base, decimal_to_base, convert, main,
+                     read_values, convert_values, column_widths, exact_fraction_digits,
+                     exact_decimal_to_base, parallel_convert_values, cached_convert,
+                     format_cache_info, power_of_two_to_base, slow_integer_to_base,
+                     chunk_digits, digit_table, split_integer_to_base, MAX_DIGITS)
 
 
 class TestSpecialCases:
@@ -224,4 +232,299 @@ class TestMainFunction:
         
         # All lines should have the same length if columns are aligned
         line_lengths = [len(line) for line in lines]
-        assert all(length == line_lengths[0] for length in line_lengths)
\ No newline at end of file
+        assert all(length == line_lengths[0] for length in line_lengths)
+
+class TestStreaming:
+    def test_read_values_splits_on_whitespace(self):
+        stream = io.StringIO("0.5 -0.25\n42\n")
+        assert list(read_values(stream)) == ["0.5", "-0.25", "42"]
+    
+    def test_read_values_joins_tokens_across_chunks(self):
+        stream = io.StringIO("5.625 -0.125\n255")
+        assert list(read_values(stream, chunk_size=4)) == ["5.625", "-0.125", "255"]
+    
+    def test_convert_values_is_lazy(self):
+        results = convert_values(iter(["0.5", "not-a-number"]), 2)
+        assert next(results) == ("0.5", "0.1")
+    
+    def test_column_widths_use_header_minimum(self):
+        assert column_widths([("1", "1")], 16) == (len("Base 10"), len("Base 16"))
+    
+    def test_main_reads_file(self, monkeypatch, capsys, tmp_path):
+        input_file = tmp_path / "values.txt"
+        input_file.write_text("0.5\n0.25\n5.625\n")
+        monkeypatch.setattr(sys, 'argv', ['convert.py', '2', '--file', str(input_file)])
+        
+        main()
+        
+        captured = capsys.readouterr()
+        lines = captured.out.strip().split('\n')
+        
+        assert len(lines) == 5
+        assert "1;0;1.1;0;1" in captured.out
+        line_lengths = [len(line) for line in lines]
+        assert all(length == line_lengths[0] for length in line_lengths)
+    
+    def test_main_reads_stdin_without_values(self, monkeypatch, capsys):
+        monkeypatch.setattr(sys, 'argv', ['convert.py', '2'])
+        monkeypatch.setattr(sys, 'stdin', io.StringIO("0.5 -0.75\n"))
+        
+        main()
+        
+        captured = capsys.readouterr()
+        lines = captured.out.strip().split('\n')
+        
+        assert "-0.1;1" in captured.out
+        line_lengths = [len(line) for line in lines]
+        assert all(length == line_lengths[0] for length in line_lengths)
+    
+    def test_main_converts_each_file_value_once(self, monkeypatch, capsys, tmp_path):
+        input_file = tmp_path / "values.txt"
+        input_file.write_text("0.5\n-0.25\n5.625\n")
+        calls = []
+        
+        def counting_convert(value, base, max_digits=MAX_DIGITS):
+            calls.append(value)
+            return convert(value, base, max_digits)
+        
+        monkeypatch.setattr(convert_module, 'convert', counting_convert)
+        monkeypatch.setattr(sys, 'argv', ['convert.py', '2', '--file', str(input_file)])
+        
+        main()
+        
+        assert calls == [0.5, -0.25, 5.625]
+        assert "1;0;1.1;0;1" in capsys.readouterr().out
+    
+    @pytest.mark.parametrize("argv", [
+        ['convert.py', '2', '--file'],
+        ['convert.py', '2', '0.5', '--digits'],
+        ['convert.py', '2', '--jobs'],
+        ['convert.py', '2', '--cache'],
+    ])
+    def test_option_without_value_is_a_usage_error(self, monkeypatch, capsys, argv):
+        monkeypatch.setattr(sys, 'argv', argv)
+        
+        with pytest.raises(SystemExit) as exit_info:
+            main()
+        
+        assert exit_info.value.code == 2
+        assert f"{argv[-1]} needs a value" in capsys.readouterr().err
+    
+    def test_missing_base_is_a_usage_error(self, monkeypatch, capsys):
+        monkeypatch.setattr(sys, 'argv', ['convert.py'])
+        
+        with pytest.raises(SystemExit):
+            main()
+        
+        assert "Usage:" in capsys.readouterr().err
+    
+    @pytest.mark.parametrize("argv, message", [
+        (['convert.py', 'two', '0.5'], "BASE must be an integer"),
+        (['convert.py', '1', '0.5'], "BASE must be at least 2"),
+        (['convert.py', '2', '0.5', '--digits', 'many'], "--digits needs an integer"),
+        (['convert.py', '2', '0.5', '--jobs', 'two'], "--jobs needs an integer"),
+        (['convert.py', '2', '0.5', '--jobs', '0'], "--jobs must be at least 1"),
+        (['convert.py', '2', '0.5', '--cache', '-1'], "--cache must be at least 0"),
+    ])
+    def test_bad_integer_is_a_usage_error(self, monkeypatch, capsys, argv, message):
+        monkeypatch.setattr(sys, 'argv', argv)
+        
+        with pytest.raises(SystemExit) as exit_info:
+            main()
+        
+        err = capsys.readouterr().err
+        assert exit_info.value.code == 2
+        assert message in err
+        assert "Usage:" in err
+
+
+class TestExactConversion:
+    def test_one_tenth_base_2_repeats(self):
+        assert exact_decimal_to_base("0.1", 2) == "0.0;(0;0;1;1)"
+    
+    def test_one_third_base_10_repeats(self):
+        assert exact_decimal_to_base(Fraction(1, 3), 10) == "0.(3)"
+    
+    def test_one_seventh_base_10_period(self):
+        assert exact_fraction_digits(1, 7, 10) == ([], [1, 4, 2, 8, 5, 7], False)
+    
+    def test_terminating_matches_float_path(self):
+        for x in [0.5, 0.25, 5.625, -0.75, 42.5, 0, 255]:
+            assert exact_decimal_to_base(x, 2) == convert(x, 2)
+    
+    def test_float_uses_exact_stored_value(self):
+        # The double closest to 0.1 is a dyadic rational, so it terminates
+        result = exact_decimal_to_base(0.1, 2, max_digits=100)
+        assert "(" not in result
+        assert "..." not in result
+        assert len(result.split(".")[1].split(";")) == 55
+    
+    def test_negative_repeating(self):
+        assert exact_decimal_to_base("-1/6", 60) == "-0.10"
+        assert exact_decimal_to_base("-1/3", 2) == "-0.(0;1)"
+    
+    def test_truncated_when_period_not_found(self):
+        prefix, repetend, truncated = exact_fraction_digits(1, 10, 2, max_digits=3)
+        assert prefix == [0, 0, 0]
+        assert repetend == []
+        assert truncated
+        assert exact_decimal_to_base("0.1", 2, max_digits=3) == "0.0;0;0..."
+    
+    def test_many_digits(self):
+        prefix, repetend, truncated = exact_fraction_digits(1, 7 * 2 ** 5000, 2, max_digits=10000)
+        assert not truncated
+        assert len(prefix) == 5000
+        assert repetend == [0, 0, 1]
+    
+    def test_max_digits_is_runtime_parameter(self):
+        result = convert(1/3, 2, max_digits=12)
+        assert len(result.replace("...", "").split(".")[1].split(";")) == 12
+    
+    def test_main_exact_option(self, monkeypatch, capsys):
+        monkeypatch.setattr(sys, 'argv', ['convert.py', '2', '--exact', '0.1'])
+        
+        main()
+        
+        captured = capsys.readouterr()
+        
+        assert "0.0;(0;0;1;1)" in captured.out
+
+
+class TestParallel:
+    def test_parallel_results_keep_input_order(self):
+        values = [str(i / 7 - 3) for i in range(50)]
+        
+        results = list(parallel_convert_values(values, 3, jobs=2, chunk_size=4))
+        
+        assert results == list(convert_values(values, 3))
+    
+    def test_parallel_passes_options_to_workers(self):
+        values = ["0.1", "1/3"]
+        
+        results = list(parallel_convert_values(values, 2, jobs=2, exact=True))
+        
+        assert results == [("0.1", "0.0;(0;0;1;1)"), ("1/3", "0.(0;1)")]
+    
+    def test_main_with_jobs_matches_serial(self, monkeypatch, capsys):
+        values = ['0.5', '-5.625', '0.3', '42', '0.1']
+        
+        monkeypatch.setattr(sys, 'argv', ['convert.py', '16'] + values)
+        main()
+        serial = capsys.readouterr().out
+        
+        monkeypatch.setattr(sys, 'argv', ['convert.py', '16', '--jobs', '2'] + values)
+        main()
+        parallel = capsys.readouterr().out
+        
+        assert parallel == serial
+
+
+class TestCache:
+    def test_cached_convert_matches_convert(self):
+        cached = cached_convert(8)
+        for x in [0.5, -5.625, 1/3, 255]:
+            assert cached(x, 2, MAX_DIGITS) == convert(x, 2)
+    
+    def test_repeated_values_are_hits(self):
+        cached = cached_convert(3)
+        cached.cache_clear()
+        
+        for x in [0.5, 0.25, 0.5, 0.5, 0.25]:
+            cached(x, 2, MAX_DIGITS)
+        
+        info = cached.cache_info()
+        assert info.hits == 3
+        assert info.misses == 2
+    
+    def test_key_includes_base_and_digits(self):
+        cached = cached_convert(5)
+        cached.cache_clear()
+        
+        cached(0.1, 2, 8)
+        cached(0.1, 3, 8)
+        cached(0.1, 2, 12)
+        
+        assert cached.cache_info().misses == 3
+    
+    def test_cache_is_bounded(self):
+        cached = cached_convert(2)
+        cached.cache_clear()
+        
+        for x in [0.5, 0.25, 0.125, 0.0625]:
+            cached(x, 2, MAX_DIGITS)
+        
+        assert cached.cache_info().currsize == 2
+    
+    def test_same_size_shares_one_cache(self):
+        assert cached_convert(7) is cached_convert(7)
+    
+    def test_format_cache_info(self):
+        cached = cached_convert(4)
+        cached.cache_clear()
+        cached(0.5, 2, MAX_DIGITS)
+        cached(0.5, 2, MAX_DIGITS)
+        
+        assert format_cache_info(cached.cache_info()) == (
+            "Cache: 1 hits, 1 misses (50.0% hit rate), 1/4 entries")
+    
+    def test_main_reports_statistics(self, monkeypatch, capsys):
+        cached_convert(10).cache_clear()
+        monkeypatch.setattr(sys, 'argv', ['convert.py', '2', '--cache', '10', '0.5', '0.5', '0.2'])
+        
+        main()
+        
+        captured = capsys.readouterr()
+        
+        assert "0.0;0;1;1;0;0;1;1..." in captured.out
+        assert "1 hits, 2 misses" in captured.err
+
+
+class TestPowerOfTwoBases:
+    def test_chunk_digits_are_padded(self):
+        assert chunk_digits(0, 16) == "0;0;0"
+        assert chunk_digits(255, 16) == "0;15;15"
+    
+    def test_digit_table_is_filled_on_use(self):
+        table = digit_table(8)
+        table[:] = [None] * len(table)
+        
+        power_of_two_to_base(0o7777_0001_0001, 8)
+        
+        assert table[0o0001] == "0;0;0;1"
+        assert sum(entry is not None for entry in table) == 1
+    
+    def test_small_values_match_loop(self):
+        for base in [2, 4, 8, 16, 32]:
+            for n in range(1, 1100):
+                assert power_of_two_to_base(n, base) == slow_integer_to_base(n, base)
+    
+    def test_huge_values_match_loop(self):
+        n = 3 ** 2000
+        for base in [2, 4, 8, 16, 32]:
+            assert integer_to_base(n, base) == slow_integer_to_base(n, base)
+    
+    def test_exact_power_of_base(self):
+        assert integer_to_base(2 ** 300, 2) == "1" + ";0" * 300
+        assert integer_to_base(32 ** 40, 32) == "1" + ";0" * 40
+    
+    def test_all_ones(self):
+        assert integer_to_base(2 ** 500 - 1, 8) == "3;" + ";".join(["7"] * 166)
+
+
+class TestSplitConversion:
+    def test_small_values_match_loop(self):
+        for base in [3, 10, 60]:
+            for n in range(1, 500):
+                assert split_integer_to_base(n, base, leaf_digits=2) == slow_integer_to_base(n, base)
+    
+    def test_huge_values_match_loop(self):
+        n = 7 ** 5000 + 12345
+        for base in [3, 10, 36, 60]:
+            assert integer_to_base(n, base) == slow_integer_to_base(n, base)
+    
+    def test_zero_padding_inside_number(self):
+        n = 10 ** 1000 + 1
+        assert integer_to_base(n, 10) == "1;" + "0;" * 999 + "1"
+    
+    def test_exact_power_of_base(self):
+        assert split_integer_to_base(3 ** 700, 3, leaf_digits=4) == "1" + ";0" * 700
@@ -0,0 +1,79 @@
+"""
+Memoize a function at the abscissae it is evaluated at.
+
+Finite difference sweeps evaluate f at the same points over and over:
+f(x) is shared by every forward difference at x, and halving h in a
+Richardson table revisits earlier points. Wrapping f in a CachedFunction
+makes each distinct point cost one evaluation and counts how many
+evaluations were requested versus actually performed.
+
+NumPy is only imported the first time an array is passed in, so scalar
+callers (e.g., finite_difference.py) do not depend on it.
+"""
+
+
+class CachedFunction:
+    """
+    Wrap f so that each distinct abscissa is evaluated only once.
+
+    Works with scalars and with NumPy arrays. For arrays, only the values
+    not already in the cache are passed to f (as one array), so f must be
+    vectorized when called with arrays.
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self.values = {}
+        self.requested = 0
+
+    def __call__(self, x):
+        if isinstance(x, (int, float)):
+            return self._evaluate_scalar(float(x))
+
+        import numpy as np
+
+        x = np.asarray(x, dtype=np.float64)
+
+        if x.ndim == 0:
+            return self._evaluate_scalar(float(x))
+
+        return self._evaluate_array(x)
+
+    def _evaluate_scalar(self, x):
+        self.requested += 1
+
+        if x not in self.values:
+            self.values[x] = self.f(x)
+
+        return self.values[x]
+
+    def _evaluate_array(self, x):
+        import numpy as np
+
+        self.requested += x.size
+
+        points, inverse = np.unique(x, return_inverse=True)
+        missing = [p for p in points.tolist() if p not in self.values]
+
+        if missing:
+            results = np.asarray(self.f(np.array(missing)), dtype=np.float64)
+            self.values.update(zip(missing, results.tolist()))
+
+        unique_values = np.array([self.values[p] for p in points.tolist()])
+
+        return unique_values[inverse].reshape(x.shape)
+
+    @property
+    def evaluations(self):
+        """Number of distinct points f was actually evaluated at."""
+        return len(self.values)
+
+    @property
+    def hits(self):
+        """Number of requested evaluations answered from the cache."""
+        return self.requested - self.evaluations
+
+    def clear(self):
+        """Forget every cached value and reset the counters."""
+        self.values.clear()
+        self.requested = 0
@@ -8,6 +8,9 @@ with x = 1 and h = 2^-1, 2^-2, ..., 2^-30.
 """
 
 import math
+from typing import Callable
+
+from evaluation_cache import CachedFunction
 
 
 def compute_step_size(n: int) -> float:
@@ -15,9 +18,10 @@ def compute_step_size(n: int) -> float:
     return 2.0 ** (-n)
 
 
-def approximate_derivative(x: float, h: float) -> float:
-    """Compute forward finite difference approximation of sin'(x)."""
-    return (math.sin(x + h) - math.sin(x)) / h
+def approximate_derivative(x: float, h: float,
+                           f: Callable[[float], float] = math.sin) -> float:
+    """Compute forward finite difference approximation of f'(x) (sin'(x) by default)."""
+    return (f(x + h) - f(x)) / h
 
 
 def known_derivative(x: float) -> float:
@@ -47,15 +51,20 @@ def print_table_header() -> None:
     print("|:----:|--------------:|--------------:|--------------:|--------------:|")
 
 
-def run_finite_difference(x: float = 1.0, max_n: int = 30) -> None:
-    """Run the finite difference computation and print results."""
-    exact = known_derivative(x)
+def run_finite_difference(x: float = 1.0, max_n: int = 30,
+                          f: Callable[[float], float] = math.sin,
+                          df: Callable[[float], float] = known_derivative) -> None:
+    """Run the finite difference computation for f (with exact derivative df) and print results."""
+    exact = df(x)
+
+    # f(x) is shared by every row, so it is only computed once
+    f = CachedFunction(f)
 
     print_table_header()
 
     for n in range(1, max_n + 1):
         h = compute_step_size(n)
-        approx = approximate_derivative(x, h)
+        approx = approximate_derivative(x, h, f)
         error = absolute_error(approx, exact)
         print(format_row(n, x, approx, exact, error))
 
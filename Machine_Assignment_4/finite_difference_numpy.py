@@ -0,0 +1,80 @@
+"""
+NumPy version of finite_difference.py for many points and step sizes at
+once.
+
+The functions mirror the scalar ones in finite_difference.py, but accept
+arrays and follow NumPy broadcasting rules. error_sweep() evaluates every
+combination of x and h:
+
+    approx[i, j] = (sin(x[i] + h[j]) - sin(x[i])) / h[j]
+"""
+
+import numpy as np
+
+
+def compute_step_size(n):
+    """Return h = 2^-n for every n."""
+    return 2.0 ** -np.asarray(n, dtype=np.float64)
+
+
+def approximate_derivative(x, h, out=None):
+    """
+    Compute forward finite difference approximations of sin'(x).
+
+    x and h are broadcast against each other. If out is given, the result
+    is written into it instead of a new array.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    h = np.asarray(h, dtype=np.float64)
+
+    if out is None:
+        out = np.empty(np.broadcast_shapes(x.shape, h.shape))
+
+    np.add(x, h, out=out)
+    np.sin(out, out=out)
+    np.subtract(out, np.sin(x), out=out)
+    np.divide(out, h, out=out)
+
+    return out
+
+
+def known_derivative(x):
+    """Return the exact derivative of sin(x), which is cos(x)."""
+    return np.cos(x)
+
+
+def absolute_error(approx, exact, out=None):
+    """Return the absolute error between the approximations and exact values."""
+    exact = np.asarray(exact, dtype=np.float64)
+    approx = np.asarray(approx, dtype=np.float64)
+
+    if out is None:
+        out = np.empty(np.broadcast_shapes(exact.shape, approx.shape))
+
+    np.subtract(exact, approx, out=out)
+    np.abs(out, out=out)
+
+    return out
+
+
+def error_sweep(x, h):
+    """
+    Approximate sin'(x) for every combination of x and h.
+
+    Returns (approx, exact, error), each with shape (len(x), len(h)). approx
+    and error are the only full-size arrays allocated; exact is a read-only
+    broadcast view of cos(x).
+    """
+    x = np.asarray(x, dtype=np.float64).reshape(-1, 1)
+    h = np.asarray(h, dtype=np.float64).reshape(1, -1)
+
+    shape = (x.shape[0], h.shape[1])
+
+    approx = np.empty(shape)
+    error = np.empty(shape)
+
+    approximate_derivative(x, h, out=approx)
+    exact = np.broadcast_to(known_derivative(x), shape)
+    absolute_error(approx, exact, out=error)
+
+    return approx, exact, error
@@ -0,0 +1,144 @@
+"""
+Probe the floating point characteristics of every NumPy float type.
+
+machine_epsilon.py finds eps for float64 only, and recomputes it on every
+call. This module measures, for float16, float32, float64 and longdouble:
+
+  - epsilon             with the Cleve Moler algorithm, in that precision
+  - smallest normal     from numpy.finfo
+  - smallest subnormal  by halving the smallest normal until it underflows
+  - max                 from numpy.finfo
+  - rounding mode       from how 1 ± a fraction of eps rounds
+
+Each type is probed once per process; machine_parameters() returns the
+same frozen MachineParameters object on every later call, so it is cheap
+enough to use inside numeric loops.
+
+Values are stored as NumPy scalars of the probed type, since, e.g., the
+longdouble limits do not fit in a Python float.
+"""
+
+from dataclasses import dataclass
+from functools import cache
+
+import numpy as np
+
+FLOAT_TYPES = ("float16", "float32", "float64", "longdouble")
+
+
+@dataclass(frozen=True)
+class MachineParameters:
+    """Floating point characteristics of one NumPy float type."""
+
+    name: str
+    bits: int
+    mantissa_bits: int
+    epsilon: np.floating
+    smallest_normal: np.floating
+    smallest_subnormal: np.floating
+    max: np.floating
+    rounding: str
+
+    @property
+    def sqrt_epsilon(self) -> np.floating:
+        """Square root of epsilon, the optimal forward difference step size."""
+        return np.sqrt(self.epsilon)
+
+
+def probe_epsilon(dtype: np.dtype) -> np.floating:
+    """Return machine epsilon of dtype using the Cleve Moler algorithm."""
+    one = dtype.type(1)
+    a = dtype.type(4) / dtype.type(3)
+    b = a - one
+    c = b + b + b
+    return abs(one - c)
+
+
+def probe_smallest_subnormal(smallest_normal: np.floating) -> np.floating:
+    """Halve the smallest normal number until the next halving gives zero."""
+    two = smallest_normal.dtype.type(2)
+    x = smallest_normal
+
+    while x / two > 0:
+        x = x / two
+
+    return x
+
+
+def probe_rounding(epsilon: np.floating) -> str:
+    """
+    Return the rounding mode used by arithmetic in epsilon's type:
+    "nearest", "toward zero", "upward" or "downward".
+
+    Adds a quarter and three quarters of eps to 1 and -1; the results are
+    different for each IEEE 754 rounding mode.
+    """
+    one = epsilon.dtype.type(1)
+    quarter = epsilon / epsilon.dtype.type(4)
+    three_quarters = quarter * epsilon.dtype.type(3)
+
+    if one + quarter > one:
+        return "upward"
+
+    if -one - quarter < -one:
+        return "downward"
+
+    if one + three_quarters > one:
+        return "nearest"
+
+    return "toward zero"
+
+
+@cache
+def _probe(dtype: np.dtype) -> MachineParameters:
+    info = np.finfo(dtype)
+    epsilon = probe_epsilon(dtype)
+
+    return MachineParameters(name=dtype.name,
+                             bits=info.bits,
+                             mantissa_bits=info.nmant,
+                             epsilon=epsilon,
+                             smallest_normal=info.smallest_normal,
+                             smallest_subnormal=probe_smallest_subnormal(info.smallest_normal),
+                             max=info.max,
+                             rounding=probe_rounding(epsilon))
+
+
+def machine_parameters(dtype="float64") -> MachineParameters:
+    """
+    Return the MachineParameters of a NumPy float type (a name such as
+    "float32" or "longdouble", or a type such as np.float16).
+
+    The type is probed on the first call only.
+    """
+    dtype = np.dtype(dtype)
+
+    if dtype.kind != "f":
+        raise ValueError(f"{dtype.name} is not a floating point type")
+
+    return _probe(dtype)
+
+
+def all_machine_parameters() -> dict:
+    """Return the MachineParameters of every type in FLOAT_TYPES, by name."""
+    return {name: machine_parameters(name) for name in FLOAT_TYPES}
+
+
+def main():
+    print("|    Type    | Bits |    Epsilon    | Smallest Normal | Smallest Subnormal |      Max       | Rounding |")
+    print("|:----------:|-----:|--------------:|----------------:|-------------------:|---------------:|:--------:|")
+
+    for name, params in all_machine_parameters().items():
+        # Formatted by NumPy, since Python floats cannot hold longdouble limits
+        eps, normal, subnormal, largest = (
+            np.format_float_scientific(value, precision=6, unique=False,
+                                        exp_digits=2)
+            for value in (params.epsilon, params.smallest_normal,
+                          params.smallest_subnormal, params.max))
+
+        print(f"| {name:^10} | {params.bits:>4} | {eps:>13} | {normal:>15} "
+              f"| {subnormal:>18} | {largest:>14} | {params.rounding:^8} |")
+
+
+if __name__ == "__main__":
+    main()
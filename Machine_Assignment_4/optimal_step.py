@@ -0,0 +1,140 @@
+"""
+Find the step size h that minimizes the finite difference error for any
+function, without sweeping every h = 2^-1, ..., 2^-30.
+
+The error of a stencil of order p behaves like
+
+    E(h) ≈ C1 h^p + C2 eps / h
+
+(truncation error plus rounding error), so the optimal step is near
+eps^(1 / (p + 1)), e.g., sqrt(eps) for the forward difference. The search
+starts from that guess, computed with the cached float64 epsilon, and runs a
+golden-section search over n = -log2(h) in a bracket around it. Only
+powers of two are tried, so every step size is exact and neighbouring
+estimates share function evaluations through a CachedFunction.
+
+If the exact derivative df is known, E(h) = |D(h) - df(x)|. Otherwise the
+error is estimated from the error curve itself as |D(h) - D(h/2)|, but
+never below the rounding error eps |f(x)| sum|c_j| / h^d of the stencil
+(weights c_j, derivative d): two estimates can agree exactly by chance
+(or for a polynomial), which would otherwise look like a perfect step.
+"""
+
+import math
+from typing import Callable, NamedTuple, Optional
+
+from evaluation_cache import CachedFunction
+from machine_parameters import machine_parameters
+from stencils import FORWARD, Stencil
+
+# Half the width of the bracket (in powers of two) searched around the
+# initial guess
+BRACKET_HALF_WIDTH = 8
+
+# Smallest and largest n considered for h = 2^-n
+MIN_N = 1
+MAX_N = 52
+
+INVERSE_GOLDEN_RATIO = (math.sqrt(5.0) - 1.0) / 2.0
+
+
+class OptimalStep(NamedTuple):
+    """Result of optimal_step_size."""
+
+    h: float
+    n: int
+    derivative: float
+    error: float
+    evaluations: int
+    steps_tried: int
+
+
+def initial_step_exponent(x: float, stencil: Stencil = FORWARD) -> int:
+    """
+    Return n such that h = 2^-n is the theoretical optimal step size,
+    eps^(1 / (order + derivative)) * max(1, |x|), rounded to a power of two.
+    """
+    eps = float(machine_parameters().epsilon)
+    h = eps ** (1.0 / (stencil.order + stencil.derivative)) * max(1.0, abs(x))
+
+    return min(MAX_N, max(MIN_N, round(-math.log2(h))))
+
+
+def golden_section_minimum(error: Callable[[int], float], lower: int, upper: int) -> int:
+    """
+    Return the integer n in [lower, upper] that minimizes error(n),
+    assuming error is (roughly) unimodal on the bracket.
+    """
+    while upper - lower > 2:
+        step = round((upper - lower) * (1.0 - INVERSE_GOLDEN_RATIO))
+        left = lower + max(1, step)
+        right = upper - max(1, step)
+
+        if left >= right:
+            right = left + 1
+
+        if error(left) <= error(right):
+            upper = right
+        else:
+            lower = left
+
+    return min(range(lower, upper + 1), key=error)
+
+
+def optimal_step_size(f: Callable[[float], float],
+                      x: float,
+                      df: Optional[Callable[[float], float]] = None,
+                      stencil: Stencil = FORWARD) -> OptimalStep:
+    """
+    Search for the step size h = 2^-n that minimizes the error of the
+    given stencil for f'(x).
+
+    f may be any callable that accepts a float. If df (the exact
+    derivative) is given it is used to measure the error; otherwise the
+    error is estimated as |D(h) - D(h/2)|.
+    """
+    cached_f = CachedFunction(f)
+    exact = float(df(x)) if df is not None else None
+
+    eps = float(machine_parameters().epsilon)
+    rounding_scale = eps * abs(float(cached_f(x))) * sum(abs(c) for c in stencil.coefficients)
+
+    estimates = {}
+    errors = {}
+
+    def estimate(n):
+        if n not in estimates:
+            estimates[n] = float(stencil.apply(cached_f, x, 2.0 ** -n))
+
+        return estimates[n]
+
+    def error(n):
+        if n not in errors:
+            if exact is not None:
+                errors[n] = abs(exact - estimate(n))
+            else:
+                rounding_error = rounding_scale / (2.0 ** -n) ** stencil.derivative
+                errors[n] = max(abs(estimate(n + 1) - estimate(n)), rounding_error)
+
+        return errors[n]
+
+    guess = initial_step_exponent(x, stencil)
+    lower = max(MIN_N, guess - BRACKET_HALF_WIDTH)
+    upper = min(MAX_N - 1, guess + BRACKET_HALF_WIDTH)
+
+    n = golden_section_minimum(error, lower, upper)
+
+    return OptimalStep(h=2.0 ** -n,
+                       n=n,
+                       derivative=estimate(n),
+                       error=error(n),
+                       evaluations=cached_f.evaluations,
+                       steps_tried=len(estimates))
+
+
+def differentiate(f: Callable[[float], float],
+                  x: float,
+                  df: Optional[Callable[[float], float]] = None,
+                  stencil: Stencil = FORWARD) -> float:
+    """Return the derivative of f at x using the optimal step size."""
+    return optimal_step_size(f, x, df, stencil).derivative
@@ -2,29 +2,48 @@
 Plot h vs Abs. Error from the finite difference approximation of sin'(x).
 
 Both axes use logarithmic scales. A vertical reference line marks sqrt(eps),
-the theoretical optimal step size for the forward difference formula.
+the theoretical optimal step size for the forward difference formula. Batch
+plots of other stencils mark eps^(1/(order + derivative)) instead, e.g., the
+cube root of eps for the central difference.
 
-Saves the plot as error_plot.png.
+Saves the plot as error_plot.png, or with --data FILE writes the raw
+(h, error) data as CSV or NPY without touching matplotlib at all.
+
+matplotlib is only imported the first time a plot is rendered, always with
+the headless Agg backend. ErrorPlotRenderer keeps one figure and its line
+artists alive, so rendering many plots in a loop only updates their data.
+
+With --batch SPEC [--jobs N], plots are generated for every entry of a
+JSON spec file (function, x, stencil, h range). The data is computed with
+the vectorized stencils, the PNGs are rendered in a process pool (one
+figure per worker), and plots whose content hash is unchanged since the
+last run are skipped.
 """
 
 from ast import Return
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import hashlib
+import json
 import math
-import matplotlib.pyplot as plt
-import matplotlib.ticker as ticker
+import os
+import sys
 
+from evaluation_cache import CachedFunction
 from finite_difference import compute_step_size, approximate_derivative, known_derivative, absolute_error
 from machine_epsilon import cleve_moler_epsilon, sqrt_epsilon
 
 
-def collect_data(x: float = 1.0, max_n: int = 30):
-    #Return (h_values, errors) lists from the finite difference computation.    
-    exact = known_derivative(x)
+def collect_data(x: float = 1.0, max_n: int = 30, f=math.sin, df=known_derivative):
+    #Return (h_values, errors) lists from the finite difference computation of f'(x).    
+    exact = df(x)
+    f = CachedFunction(f)
     h_values = []
     errors = []
 
     for n in range(1, max_n + 1):
         h = compute_step_size(n)
-        approx = approximate_derivative(x, h)
+        approx = approximate_derivative(x, h, f)
         err = absolute_error(approx, exact)
         h_values.append(h)
         errors.append(err)
@@ -32,39 +51,377 @@ def collect_data(x: float = 1.0, max_n: int = 30):
     return h_values, errors
 
 
-def plot_error(h_values, errors, sqrt_eps, output_file="error_plot.png"):
-    #Generate and save the log-log plot of h vs absolute error.
-    fig, ax = plt.subplots(figsize=(9, 6))
+DEFAULT_TITLE = "Finite Difference Approximation of sin'(1)\nAbsolute Error vs Step Size h"
+
+# Renderer shared by every plot_error() call, created on first use
+_default_renderer = None
+
+
+def load_pyplot():
+    #Import and return matplotlib.pyplot, forcing the headless Agg backend.
+    import matplotlib
+    matplotlib.use("Agg")
+
+    import matplotlib.pyplot as plt
+    return plt
+
+
+class ErrorPlotRenderer:
+    #Log-log plot of h vs absolute error that is built once and reused.
+    #
+    #Each render() call only swaps the data of the existing line artists,
+    #rescales the axes and saves the figure.
+
+    def __init__(self):
+        plt = load_pyplot()
+
+        self.fig, self.ax = plt.subplots(figsize=(9, 6))
+
+        (self.error_line,) = self.ax.plot([], [], marker='o', markersize=5,
+                                          linewidth=1.5, color='steelblue',
+                                          label="Abs. Error")
+
+        # Vertical reference line at sqrt(eps)
+        self.eps_line = self.ax.axvline(x=1.0, color='tomato', linestyle='--',
+                                        linewidth=1.5)
+
+        self.ax.set_xscale("log")
+        self.ax.set_yscale("log")
 
-    ax.plot(h_values, errors, marker='o', markersize=5,
-            linewidth=1.5, color='steelblue', label="Abs. Error")
+        self.ax.set_xlabel("h  (step size)", fontsize=12)
+        self.ax.set_ylabel("Absolute Error  |f'(x) - approx|", fontsize=12)
+        self.title = self.ax.set_title(DEFAULT_TITLE, fontsize=13)
 
-    # Vertical reference line at sqrt(eps)
-    ax.axvline(x=sqrt_eps, color='tomato', linestyle='--', linewidth=1.5,
-               label=f"$\\sqrt{{\\epsilon_{{mach}}}}$ ≈ {sqrt_eps:.2e}")
+        self.ax.grid(True, which="both", linestyle="--", linewidth=0.5, alpha=0.7)
 
-    ax.set_xscale("log")
-    ax.set_yscale("log")
+        # The legend is built once; render() only changes the reference text
+        self.eps_line.set_label(self.eps_label(1.0))
+        self.legend = self.ax.legend(fontsize=11)
+        self.eps_text = self.legend.get_texts()[1]
 
-    ax.set_xlabel("h  (step size)", fontsize=12)
-    ax.set_ylabel("Absolute Error  |f'(x) - approx|", fontsize=12)
-    ax.set_title("Finite Difference Approximation of sin'(1)\nAbsolute Error vs Step Size h", fontsize=13)
+        self.laid_out = False
 
-    ax.legend(fontsize=11)
-    ax.grid(True, which="both", linestyle="--", linewidth=0.5, alpha=0.7)
+    @staticmethod
+    def eps_label(h_ref, root=2):
+        #Legend text for the reference line at h_ref = eps^(1/root).
+        index = "" if root == 2 else f"[{root}]"
+        return f"$\\sqrt{index}{{\\epsilon_{{mach}}}}$ ≈ {h_ref:.2e}"
 
-    plt.tight_layout()
-    plt.savefig(output_file, dpi=150)
+    def render(self, h_values, errors, h_ref, output_file, title=DEFAULT_TITLE, root=2):
+        #Update the plot with a new dataset and save it to output_file.
+        #
+        #The reference line is drawn at h_ref, which is eps^(1/root).
+        self.error_line.set_data(h_values, errors)
+
+        self.eps_line.set_xdata([h_ref, h_ref])
+        self.eps_line.set_label(self.eps_label(h_ref, root))
+        self.eps_text.set_text(self.eps_label(h_ref, root))
+
+        self.title.set_text(title)
+
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+        # The layout only depends on the labels, so it is computed once
+        if not self.laid_out:
+            self.fig.tight_layout()
+            self.laid_out = True
+
+        self.fig.savefig(output_file, dpi=150)
+
+    def close(self):
+        #Release the figure.
+        load_pyplot().close(self.fig)
+
+
+def plot_error(h_values, errors, sqrt_eps, output_file="error_plot.png", renderer=None):
+    #Generate and save the log-log plot of h vs absolute error.
+    global _default_renderer
+
+    if renderer is None:
+        if _default_renderer is None:
+            _default_renderer = ErrorPlotRenderer()
+
+        renderer = _default_renderer
+
+    renderer.render(h_values, errors, sqrt_eps, output_file)
     print(f"Plot saved to: {output_file}")
 
 
+def write_raw_data(h_values, errors, output_file):
+    #Write the (h, error) pairs to a .csv or .npy file. matplotlib is not used.
+    if output_file.endswith(".npy"):
+        import numpy as np
+        np.save(output_file, np.column_stack([h_values, errors]))
+
+    else:
+        with open(output_file, "w", newline="") as data_file:
+            writer = csv.writer(data_file)
+            writer.writerow(["h", "abs_error"])
+            writer.writerows(zip(map(repr, h_values), map(repr, errors)))
+
+    print(f"Data saved to: {output_file}")
+
+
+DEFAULT_MIN_N = 1
+DEFAULT_MAX_N = 30
+
+# Renderer owned by each batch worker process, created by the pool initializer
+_worker_renderer = None
+
+
+def batch_functions():
+    #Return the functions batch specs may refer to, as name -> (f, df).
+    #Both f and its exact derivative df accept NumPy arrays.
+    import numpy as np
+
+    return {
+        "sin": (np.sin, np.cos),
+        "cos": (np.cos, lambda x: -np.sin(x)),
+        "exp": (np.exp, np.exp),
+        "log": (np.log, np.reciprocal),
+        "sqrt": (np.sqrt, lambda x: 0.5 / np.sqrt(x)),
+        "tan": (np.tan, lambda x: 1.0 / np.cos(x) ** 2),
+    }
+
+
+def load_batch_spec(spec_file):
+    #Read a batch spec and return a list of fully populated plot entries.
+    #
+    #The spec is a JSON object:
+    #  {"output_dir": "plots",
+    #   "plots": [{"function": "sin", "x": 1.0, "stencil": "central",
+    #              "min_n": 1, "max_n": 30, "output": "sin_central.png"}, ...]}
+    #
+    #Only function and x are required. output_dir is relative to the spec file.
+    from stencils import STENCILS
+
+    with open(spec_file) as spec_input:
+        spec = json.load(spec_input)
+
+    output_dir = os.path.join(os.path.dirname(os.path.abspath(spec_file)),
+                              spec.get("output_dir", "."))
+    functions = batch_functions()
+    entries = []
+
+    for plot in spec["plots"]:
+        entry = {
+            "function": plot["function"],
+            "x": float(plot["x"]),
+            "stencil": plot.get("stencil", "forward"),
+            "min_n": int(plot.get("min_n", DEFAULT_MIN_N)),
+            "max_n": int(plot.get("max_n", DEFAULT_MAX_N)),
+        }
+
+        if entry["function"] not in functions:
+            raise ValueError(f"Unknown function '{entry['function']}', expected one of: "
+                             + ", ".join(functions))
+
+        if entry["stencil"] not in STENCILS:
+            raise ValueError(f"Unknown stencil '{entry['stencil']}', expected one of: "
+                             + ", ".join(STENCILS))
+
+        if entry["min_n"] > entry["max_n"]:
+            raise ValueError(f"min_n ({entry['min_n']}) is larger than max_n ({entry['max_n']})")
+
+        output = plot.get("output",
+                          f"{entry['function']}_x{entry['x']:g}_{entry['stencil']}.png")
+        entry["output"] = os.path.join(output_dir, output)
+
+        entries.append(entry)
+
+    return entries
+
+
+def batch_data(entry):
+    #Return (h_values, errors) arrays for one spec entry, computed by applying
+    #the entry's stencil to every step size at once.
+    import numpy as np
+    from stencils import STENCILS
+
+    f, df = batch_functions()[entry["function"]]
+    h_values = 2.0 ** -np.arange(entry["min_n"], entry["max_n"] + 1, dtype=np.float64)
+
+    approx = STENCILS[entry["stencil"]].apply(f, entry["x"], h_values)
+    errors = np.abs(df(entry["x"]) - approx)
+
+    return h_values, errors
+
+
+def batch_reference(entry, eps):
+    #Return (h_ref, root) for one spec entry: the theoretical optimal step
+    #h_ref = eps^(1/root) of its stencil, where root = order + derivative
+    #(2 for forward, 3 for central, 5 for five-point).
+    from stencils import STENCILS
+
+    stencil = STENCILS[entry["stencil"]]
+    root = stencil.order + stencil.derivative
+
+    return eps ** (1.0 / root), root
+
+
+def batch_title(entry):
+    #Return the plot title for one spec entry.
+    return (f"{entry['stencil'].capitalize()} Difference Approximation of "
+            f"{entry['function']}'({entry['x']:g})\nAbsolute Error vs Step Size h")
+
+
+def content_hash(h_values, errors, h_ref, title, root=2):
+    #Return a SHA-256 digest of everything that determines a plot's pixels.
+    digest = hashlib.sha256()
+    digest.update(h_values.tobytes())
+    digest.update(errors.tobytes())
+    digest.update(repr(h_ref).encode())
+    digest.update(title.encode())
+    digest.update(repr(root).encode())
+    return digest.hexdigest()
+
+
+def hash_file(output_file):
+    #Return the path of the sidecar file holding a plot's content hash.
+    return output_file + ".sha256"
+
+
+def is_up_to_date(output_file, digest):
+    #True if output_file exists and was rendered from data with this digest.
+    try:
+        with open(hash_file(output_file)) as hash_input:
+            return os.path.exists(output_file) and hash_input.read().strip() == digest
+
+    except FileNotFoundError:
+        return False
+
+
+def _init_worker():
+    #Pool initializer: give each worker process its own renderer.
+    global _worker_renderer
+    _worker_renderer = ErrorPlotRenderer()
+
+
+def _close_worker():
+    #Release the renderer created by _init_worker in this process.
+    global _worker_renderer
+    _worker_renderer.close()
+    _worker_renderer = None
+
+
+def _render_job(job):
+    #Render one batch plot in a worker process and return its output file.
+    h_values, errors, h_ref, output_file, title, root = job
+    _worker_renderer.render(h_values, errors, h_ref, output_file, title, root)
+    return output_file
+
+
+def run_batch(spec_file, jobs=1):
+    #Generate every plot listed in spec_file, skipping up-to-date ones.
+    #
+    #A plot's hash is written next to it only after the PNG has been saved,
+    #so an interrupted run can simply be restarted.
+    #
+    #Returns (rendered, skipped) lists of output files.
+    eps = cleve_moler_epsilon()
+
+    pending = []
+    skipped = []
+
+    for entry in load_batch_spec(spec_file):
+        h_values, errors = batch_data(entry)
+        h_ref, root = batch_reference(entry, eps)
+        title = batch_title(entry)
+        digest = content_hash(h_values, errors, h_ref, title, root)
+
+        if is_up_to_date(entry["output"], digest):
+            skipped.append(entry["output"])
+            continue
+
+        os.makedirs(os.path.dirname(entry["output"]), exist_ok=True)
+        pending.append(((h_values, errors, h_ref, entry["output"], title, root), digest))
+
+    jobs_list = [job for job, _ in pending]
+
+    # Nothing to render: do not import matplotlib or create a figure
+    if not pending:
+        rendered = []
+
+    elif jobs > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+            outputs = pool.map(_render_job, jobs_list)
+            rendered = _record_hashes(outputs, pending)
+
+    else:
+        _init_worker()
+
+        try:
+            rendered = _record_hashes(map(_render_job, jobs_list), pending)
+
+        finally:
+            _close_worker()
+
+    return rendered, skipped
+
+
+def _record_hashes(outputs, pending):
+    #Write the hash sidecar of each plot as soon as it has been rendered.
+    rendered = []
+
+    for output_file, (_, digest) in zip(outputs, pending):
+        with open(hash_file(output_file), "w") as hash_output:
+            hash_output.write(digest + "\n")
+
+        rendered.append(output_file)
+
+    return rendered
+
+
 def find_minimum_error(h_values, errors):
     #Return the (h, error) pair where error is smallest.
     min_idx = errors.index(min(errors))
     return h_values[min_idx], errors[min_idx]
 
 
+BATCH_USAGE = "Usage: plot_error.py --batch SPEC [--jobs N]"
+
+
+def usage_error(message):
+    #Print message and the batch usage line to stderr and exit with status 2.
+    print(f"plot_error.py: {message}", file=sys.stderr)
+    print(BATCH_USAGE, file=sys.stderr)
+    sys.exit(2)
+
+
+def option_value(argv, name):
+    #Return the argument after option name, or report a usage error if there
+    #is none (or it is another option).
+    index = argv.index(name) + 1
+
+    if index >= len(argv) or argv[index].startswith("--"):
+        usage_error(f"{name} needs a value")
+
+    return argv[index]
+
+
+def parse_batch_args(argv):
+    #Return (spec_file, jobs) from "--batch SPEC [--jobs N]".
+    spec_file = option_value(argv, "--batch")
+    jobs = option_value(argv, "--jobs") if "--jobs" in argv else "1"
+
+    if not jobs.isdigit() or int(jobs) < 1:
+        usage_error(f"--jobs must be a positive integer, not '{jobs}'")
+
+    return spec_file, int(jobs)
+
+
 def main():
+    if "--batch" in sys.argv:
+        spec_file, jobs = parse_batch_args(sys.argv)
+        rendered, skipped = run_batch(spec_file, jobs)
+
+        for output_file in rendered:
+            print(f"Plot saved to: {output_file}")
+
+        print(f"{len(rendered)} plot(s) rendered, {len(skipped)} up to date")
+        return
+
     eps = cleve_moler_epsilon()
     sqrt_eps = sqrt_epsilon(eps)
 
@@ -76,7 +433,10 @@ def main():
     print(f"Minimum absolute error:     {err_min:.6e}  at h = {h_min:.6e}")
     print()
 
-    plot_error(h_values, errors, sqrt_eps)
+    if len(sys.argv) >= 3 and sys.argv[1] == "--data":
+        write_raw_data(h_values, errors, sys.argv[2])
+    else:
+        plot_error(h_values, errors, sqrt_eps)
 
 
 if __name__ == "__main__":
@@ -50,7 +50,7 @@ run_verbose() {
     echo ""
     echo -e "${GREEN}Running all tests (verbose mode)...${NC}"
     echo ""
-    python3 -m pytest test_machine_epsilon.py -v
+    python3 -m pytest test_machine_epsilon.py test_finite_difference_numpy.py test_stencils.py test_evaluation_cache.py test_optimal_step.py test_machine_parameters.py -v
 }
 
 run_coverage() {
@@ -68,22 +68,25 @@ run_coverage() {
 
     echo -e "${GREEN}Running tests with coverage report...${NC}"
     echo ""
-    python3 -m pytest test_machine_epsilon.py -v \
-        --cov=machine_epsilon --cov=plot_error --cov-report=term-missing
+    python3 -m pytest test_machine_epsilon.py test_finite_difference_numpy.py test_stencils.py test_evaluation_cache.py test_optimal_step.py test_machine_parameters.py -v \
+        --cov=machine_epsilon --cov=plot_error --cov=finite_difference_numpy \
+        --cov=stencils --cov=evaluation_cache --cov=optimal_step \
+        --cov=machine_parameters \
+        --cov-report=term-missing
 }
 
 run_quiet() {
     echo ""
     echo -e "${GREEN}Running tests (quiet mode)...${NC}"
     echo ""
-    python3 -m pytest test_machine_epsilon.py -q
+    python3 -m pytest test_machine_epsilon.py test_finite_difference_numpy.py test_stencils.py test_evaluation_cache.py test_optimal_step.py test_machine_parameters.py -q
 }
 
 run_failed() {
     echo ""
     echo -e "${GREEN}Running only previously failed tests...${NC}"
     echo ""
-    python3 -m pytest test_machine_epsilon.py -v --lf
+    python3 -m pytest test_machine_epsilon.py test_finite_difference_numpy.py test_stencils.py test_evaluation_cache.py test_optimal_step.py test_machine_parameters.py -v --lf
 }
 
 run_specific() {
@@ -93,6 +96,9 @@ run_specific() {
     echo "  2) TestSqrtEpsilon"
     echo "  3) TestCollectData"
     echo "  4) TestFindMinimumError"
+    echo "  5) TestWriteRawData"
+    echo "  6) TestErrorPlotRenderer"
+    echo "  7) TestBatchPlots"
     echo ""
     read -p "Enter the number of the test class to run: " choice
 
@@ -101,6 +107,9 @@ run_specific() {
         2) class="TestSqrtEpsilon" ;;
         3) class="TestCollectData" ;;
         4) class="TestFindMinimumError" ;;
+        5) class="TestWriteRawData" ;;
+        6) class="TestErrorPlotRenderer" ;;
+        7) class="TestBatchPlots" ;;
         *)
             echo -e "${YELLOW}Invalid choice. Running all tests.${NC}"
             run_verbose
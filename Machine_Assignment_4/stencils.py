@@ -0,0 +1,214 @@
+"""
+Finite difference stencils and Richardson extrapolation.
+
+A stencil approximates the d-th derivative of f with a weighted sum of
+samples taken at multiples of h around x:
+
+    f^(d)(x) ≈ (1 / h^d) * sum_j c_j f(x + s_j h)
+
+The weights c_j are found once, exactly (using Fractions), by requiring
+that the sum reproduce the d-th derivative of every polynomial up to
+degree len(offsets) - 1. The same exact weights give the powers of h in
+the truncation error, which Richardson extrapolation uses to cancel the
+error terms one by one.
+
+Stencils evaluate f on NumPy arrays, so x and h may be arrays of any
+broadcast-compatible shapes.
+"""
+
+from dataclasses import dataclass
+from fractions import Fraction
+from math import factorial
+
+import numpy as np
+
+# Largest power examined when searching for truncation error terms
+MAX_ERROR_POWER = 64
+
+
+def solve_exact(matrix, rhs):
+    """
+    Solve matrix * c = rhs with Gaussian elimination over Fractions.
+
+    Raises ValueError if the matrix is singular.
+    """
+    size = len(rhs)
+    rows = [[Fraction(v) for v in row] + [Fraction(b)]
+            for row, b in zip(matrix, rhs)]
+
+    for col in range(size):
+        pivot = next((r for r in range(col, size) if rows[r][col] != 0), None)
+
+        if pivot is None:
+            raise ValueError("Stencil offsets must be distinct")
+
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+
+        for r in range(size):
+            if r != col and rows[r][col] != 0:
+                scale = rows[r][col] / rows[col][col]
+                rows[r] = [a - scale * b for a, b in zip(rows[r], rows[col])]
+
+    return [rows[r][size] / rows[r][r] for r in range(size)]
+
+
+@dataclass(frozen=True)
+class Stencil:
+    """
+    A finite difference formula for the derivative-th derivative.
+
+    offsets       sample positions in multiples of h
+    weights       exact weight (Fraction) of each sample
+    coefficients  the weights as floats, used for evaluation
+    """
+
+    name: str
+    derivative: int
+    offsets: tuple
+    weights: tuple
+    coefficients: tuple
+
+    @classmethod
+    def from_offsets(cls, offsets, derivative=1, name=None):
+        """
+        Build the stencil for the given derivative using the given sample
+        offsets (integers or Fractions, in multiples of h).
+
+        Offsets whose weight comes out as zero are dropped, so they cost no
+        function evaluations.
+        """
+        offsets = tuple(Fraction(s) for s in offsets)
+
+        if derivative >= len(offsets):
+            raise ValueError(f"A derivative of order {derivative} needs at "
+                             f"least {derivative + 1} offsets")
+
+        # sum_j c_j s_j^m = d! if m == d else 0, for m = 0 .. N-1
+        matrix = [[s ** m for s in offsets] for m in range(len(offsets))]
+        rhs = [factorial(derivative) if m == derivative else 0
+               for m in range(len(offsets))]
+
+        weights = solve_exact(matrix, rhs)
+
+        kept = [(s, c) for s, c in zip(offsets, weights) if c != 0]
+
+        if name is None:
+            name = "offsets(" + ", ".join(str(s) for s, _ in kept) + ")"
+
+        return cls(name=name,
+                   derivative=derivative,
+                   offsets=tuple(s for s, _ in kept),
+                   weights=tuple(c for _, c in kept),
+                   coefficients=tuple(float(c) for _, c in kept))
+
+    def error_orders(self, count=1):
+        """
+        Return the first count powers of h in the truncation error.
+
+        The error is sum over m of (M_m / m!) f^(m)(x) h^(m - d), where
+        M_m = sum_j c_j s_j^m. Powers with M_m == 0 (e.g., the odd powers
+        of a symmetric stencil) do not appear.
+        """
+        orders = []
+        m = self.derivative + 1
+
+        while len(orders) < count and m <= MAX_ERROR_POWER:
+            moment = sum(c * s ** m for s, c in zip(self.offsets, self.weights))
+
+            if moment != 0 and m != self.derivative:
+                orders.append(m - self.derivative)
+
+            m += 1
+
+        return orders
+
+    @property
+    def order(self):
+        """Order of accuracy: the leading power of h in the error."""
+        return self.error_orders(1)[0]
+
+    @property
+    def evaluations(self):
+        """Number of function evaluations per derivative estimate."""
+        return len(self.offsets)
+
+    def apply(self, f, x, h):
+        """
+        Approximate the derivative of f at x with step size h.
+
+        f must accept NumPy arrays. x and h are broadcast against each
+        other and the result has the broadcast shape.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        h = np.asarray(h, dtype=np.float64)
+
+        total = None
+
+        for s, c in zip(self.offsets, self.coefficients):
+            sample = f(x + float(s) * h) if s != 0 else f(x)
+            term = c * np.asarray(sample, dtype=np.float64)
+
+            total = term if total is None else total + term
+
+        return total / h ** self.derivative
+
+
+FORWARD = Stencil.from_offsets((0, 1), name="forward")
+BACKWARD = Stencil.from_offsets((-1, 0), name="backward")
+CENTRAL = Stencil.from_offsets((-1, 1), name="central")
+FIVE_POINT = Stencil.from_offsets((-2, -1, 1, 2), name="five-point")
+
+STENCILS = {stencil.name: stencil
+            for stencil in (FORWARD, BACKWARD, CENTRAL, FIVE_POINT)}
+
+
+def central_stencil(order, derivative=1):
+    """
+    Return the symmetric stencil with the given (even) order of accuracy,
+    e.g., central_stencil(2) is CENTRAL and central_stencil(4) is
+    FIVE_POINT.
+    """
+    if order < 2 or order % 2:
+        raise ValueError("Central stencils have an even order of at least 2")
+
+    half = (derivative + 1) // 2 + order // 2 - 1
+    offsets = [s for s in range(-half, half + 1)]
+
+    return Stencil.from_offsets(offsets, derivative,
+                                name=f"central-{order}")
+
+
+def richardson_table(stencil, f, x, h, levels=4, ratio=2):
+    """
+    Build a Richardson extrapolation table.
+
+    Row i starts with the stencil estimate using step h / ratio^i. Entry
+    (i, k) removes the k-th truncation error term using rows i and i-1:
+
+        T[i][k] = T[i][k-1] + (T[i][k-1] - T[i-1][k-1]) / (ratio^p_k - 1)
+
+    where p_k is the k-th entry of stencil.error_orders().
+
+    Returns a list of rows; row i has i + 1 entries, each with the
+    broadcast shape of x and h.
+    """
+    orders = stencil.error_orders(levels - 1)
+    h = np.asarray(h, dtype=np.float64)
+
+    table = []
+
+    for i in range(levels):
+        row = [stencil.apply(f, x, h / ratio ** i)]
+
+        for k in range(1, i + 1):
+            factor = ratio ** orders[k - 1] - 1
+            row.append(row[k - 1] + (row[k - 1] - table[i - 1][k - 1]) / factor)
+
+        table.append(row)
+
+    return table
+
+
+def richardson_extrapolate(stencil, f, x, h, levels=4, ratio=2):
+    """Return the most extrapolated entry of richardson_table()."""
+    return richardson_table(stencil, f, x, h, levels, ratio)[-1][-1]
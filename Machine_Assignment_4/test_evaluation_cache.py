@@ -0,0 +1,126 @@
+"""
+Test suite for evaluation_cache.py
+
+Tests cover:
+  - Scalar and array memoization
+  - Requested vs unique evaluation counts
+  - Sharing evaluations across step sizes and stencils
+  - Scalar use without importing NumPy
+"""
+
+import math
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from evaluation_cache import CachedFunction
+from finite_difference import approximate_derivative, compute_step_size
+from stencils import CENTRAL, FORWARD, richardson_table
+
+
+def counting(f):
+    """Wrap f so the number of points it is called with is recorded."""
+    def wrapper(x):
+        wrapper.points += np.size(x)
+        return f(x)
+
+    wrapper.points = 0
+    return wrapper
+
+
+# ──────────────────────────────────────────────
+# TestScalarCache
+# ──────────────────────────────────────────────
+class TestScalarCache:
+    def test_returns_function_value(self):
+        f = CachedFunction(math.sin)
+        assert f(1.0) == math.sin(1.0)
+
+    def test_repeated_point_is_evaluated_once(self):
+        inner = counting(math.sin)
+        f = CachedFunction(inner)
+
+        for _ in range(5):
+            f(1.0)
+
+        assert inner.points == 1
+        assert f.requested == 5
+        assert f.evaluations == 1
+        assert f.hits == 4
+
+    def test_forward_difference_sweep_shares_f_of_x(self):
+        f = CachedFunction(math.sin)
+
+        for n in range(1, 31):
+            approximate_derivative(1.0, compute_step_size(n), f)
+
+        assert f.requested == 60
+        assert f.evaluations == 31
+
+    def test_scalar_path_does_not_import_numpy(self):
+        code = ("import sys, math, finite_difference; "
+                "from evaluation_cache import CachedFunction; "
+                "CachedFunction(math.sin)(1.0); "
+                "print('numpy' in sys.modules)")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                check=True)
+
+        assert result.stdout.strip() == "False"
+
+    def test_clear(self):
+        f = CachedFunction(math.sin)
+        f(1.0)
+        f.clear()
+        assert f.requested == 0
+        assert f.evaluations == 0
+
+
+# ──────────────────────────────────────────────
+# TestArrayCache
+# ──────────────────────────────────────────────
+class TestArrayCache:
+    def test_matches_function(self):
+        f = CachedFunction(np.sin)
+        x = np.linspace(0, 3, 12).reshape(3, 4)
+        assert f(x) == pytest.approx(np.sin(x))
+        assert f(x).shape == (3, 4)
+
+    def test_duplicates_within_array(self):
+        inner = counting(np.sin)
+        f = CachedFunction(inner)
+
+        f(np.array([1.0, 2.0, 1.0, 2.0]))
+
+        assert inner.points == 2
+        assert f.requested == 4
+
+    def test_only_missing_points_are_evaluated(self):
+        inner = counting(np.sin)
+        f = CachedFunction(inner)
+
+        f(np.array([1.0, 2.0]))
+        f(np.array([2.0, 3.0]))
+
+        assert inner.points == 3
+
+    def test_shared_across_stencils(self):
+        f = CachedFunction(np.sin)
+        x = np.linspace(0, 1, 10)
+
+        FORWARD.apply(f, x, 0.001)
+        CENTRAL.apply(f, x, 0.001)
+
+        # x + h is shared by both stencils
+        assert f.requested == 40
+        assert f.evaluations == 30
+
+    def test_richardson_table_revisits_points(self):
+        f = CachedFunction(np.sin)
+
+        richardson_table(FORWARD, f, 1.0, 0.5, levels=4)
+
+        # f(1) is shared by every level
+        assert f.requested == 8
+        assert f.evaluations == 5
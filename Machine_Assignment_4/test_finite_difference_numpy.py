@@ -0,0 +1,76 @@
+"""
+Test suite for finite_difference_numpy.py
+
+Tests cover:
+  - Agreement with the scalar functions in finite_difference.py
+  - Broadcasting of x and h
+  - Shapes returned by error_sweep
+"""
+
+import numpy as np
+import pytest
+
+import finite_difference
+import finite_difference_numpy
+
+
+# ──────────────────────────────────────────────
+# TestMatchesScalar
+# ──────────────────────────────────────────────
+class TestMatchesScalar:
+    def test_compute_step_size(self):
+        n = np.arange(1, 31)
+        expected = [finite_difference.compute_step_size(k) for k in range(1, 31)]
+        assert finite_difference_numpy.compute_step_size(n).tolist() == expected
+
+    def test_approximate_derivative(self):
+        x = np.array([0.0, 0.5, 1.0, 2.0])
+        h = 2.0 ** -10
+        result = finite_difference_numpy.approximate_derivative(x, h)
+        expected = [finite_difference.approximate_derivative(xi, h) for xi in x]
+        assert result == pytest.approx(expected, rel=1e-12)
+
+    def test_known_derivative(self):
+        assert finite_difference_numpy.known_derivative(1.0) == pytest.approx(
+            finite_difference.known_derivative(1.0))
+
+    def test_absolute_error(self):
+        assert finite_difference_numpy.absolute_error(0.3, 0.5) == pytest.approx(0.2)
+
+    def test_error_sweep_matches_table(self):
+        h = finite_difference_numpy.compute_step_size(np.arange(1, 31))
+        _, _, error = finite_difference_numpy.error_sweep([1.0], h)
+
+        for j, n in enumerate(range(1, 31)):
+            h_n = finite_difference.compute_step_size(n)
+            approx = finite_difference.approximate_derivative(1.0, h_n)
+            exact = finite_difference.known_derivative(1.0)
+            expected = finite_difference.absolute_error(approx, exact)
+            assert error[0, j] == pytest.approx(expected, rel=1e-9, abs=1e-15)
+
+
+# ──────────────────────────────────────────────
+# TestErrorSweep
+# ──────────────────────────────────────────────
+class TestErrorSweep:
+    def test_shapes(self):
+        approx, exact, error = finite_difference_numpy.error_sweep(
+            np.linspace(0, 1, 7), [0.5, 0.25, 0.125])
+        assert approx.shape == (7, 3)
+        assert exact.shape == (7, 3)
+        assert error.shape == (7, 3)
+
+    def test_exact_is_a_view(self):
+        _, exact, _ = finite_difference_numpy.error_sweep([0.0, 1.0], [0.5, 0.25])
+        assert not exact.flags.writeable
+        assert exact[1, 0] == exact[1, 1]
+
+    def test_first_error_at_x_equal_one(self):
+        _, _, error = finite_difference_numpy.error_sweep([1.0], [0.5])
+        assert error[0, 0] == pytest.approx(0.22825430, abs=1e-6)
+
+    def test_out_argument_is_filled(self):
+        out = np.empty(3)
+        result = finite_difference_numpy.approximate_derivative(
+            np.array([0.0, 1.0, 2.0]), 0.5, out=out)
+        assert result is out
@@ -6,14 +6,23 @@ Tests cover:
   - sqrt(epsilon) computation
   - Data collection from finite difference
   - Minimum error finder
+  - Raw data output and the reusable plot renderer
+  - Batch plot generation from a spec file
 """
 
+import csv
+import json
 import math
+import sys
 
+import numpy as np
 import pytest
 
+import plot_error as plot_error_module
 from machine_epsilon import cleve_moler_epsilon, sqrt_epsilon
-from plot_error import collect_data, find_minimum_error
+from plot_error import (ErrorPlotRenderer, batch_data, batch_reference, collect_data,
+                        find_minimum_error, load_batch_spec, load_pyplot, parse_batch_args,
+                        plot_error, run_batch, write_raw_data)
 
 
 # ──────────────────────────────────────────────
@@ -127,4 +136,223 @@ class TestFindMinimumError:
         errs = [0.3, 0.1, 0.2]
         h_min, err_min = find_minimum_error(h_vals, errs)
         assert err_min == pytest.approx(0.1)
-        assert h_min == pytest.approx(0.25)
\ No newline at end of file
+        assert h_min == pytest.approx(0.25)
+
+
+# ──────────────────────────────────────────────
+# TestWriteRawData
+# ──────────────────────────────────────────────
+class TestWriteRawData:
+    def test_csv(self, tmp_path):
+        h_values, errors = collect_data(max_n=5)
+        output = tmp_path / "data.csv"
+        write_raw_data(h_values, errors, str(output))
+
+        with open(output) as data_file:
+            rows = list(csv.reader(data_file))
+
+        assert rows[0] == ["h", "abs_error"]
+        assert len(rows) == 6
+        assert float(rows[1][0]) == 0.5
+        assert float(rows[1][1]) == errors[0]
+
+    def test_npy(self, tmp_path):
+        h_values, errors = collect_data(max_n=5)
+        output = tmp_path / "data.npy"
+        write_raw_data(h_values, errors, str(output))
+
+        data = np.load(output)
+        assert data.shape == (5, 2)
+        assert data[:, 1].tolist() == errors
+
+    def test_does_not_import_matplotlib(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(sys.modules, "matplotlib", None)
+        h_values, errors = collect_data(max_n=3)
+        write_raw_data(h_values, errors, str(tmp_path / "data.csv"))
+
+
+# ──────────────────────────────────────────────
+# TestErrorPlotRenderer
+# ──────────────────────────────────────────────
+class TestErrorPlotRenderer:
+    def test_renders_png(self, tmp_path):
+        h_values, errors = collect_data()
+        renderer = ErrorPlotRenderer()
+        output = tmp_path / "plot.png"
+
+        renderer.render(h_values, errors, 1.49e-8, str(output))
+        renderer.close()
+
+        assert output.read_bytes().startswith(b"\x89PNG")
+
+    def test_reuses_figure_and_lines(self, tmp_path):
+        renderer = ErrorPlotRenderer()
+        fig, line = renderer.fig, renderer.error_line
+
+        for n in (10, 20):
+            h_values, errors = collect_data(max_n=n)
+            renderer.render(h_values, errors, 1.49e-8, str(tmp_path / f"plot{n}.png"))
+
+            assert renderer.fig is fig
+            assert renderer.error_line is line
+            assert len(line.get_xdata()) == n
+
+        renderer.close()
+
+    def test_legend_is_built_once(self, tmp_path):
+        renderer = ErrorPlotRenderer()
+        legend = renderer.ax.get_legend()
+        h_values, errors = collect_data(max_n=5)
+
+        for sqrt_eps in (1.49e-8, 3.45e-4):
+            renderer.render(h_values, errors, sqrt_eps, str(tmp_path / "plot.png"))
+
+            assert renderer.ax.get_legend() is legend
+            assert f"{sqrt_eps:.2e}" in legend.get_texts()[1].get_text()
+
+        renderer.close()
+
+    def test_reference_label_names_the_root(self, tmp_path):
+        renderer = ErrorPlotRenderer()
+        h_values, errors = collect_data(max_n=5)
+
+        renderer.render(h_values, errors, 6.06e-6, str(tmp_path / "plot.png"), root=3)
+
+        assert renderer.legend.get_texts()[1].get_text().startswith("$\\sqrt[3]{")
+        renderer.close()
+
+    def test_uses_agg_backend(self):
+        import matplotlib
+        ErrorPlotRenderer().close()
+        assert matplotlib.get_backend().lower() == "agg"
+
+    def test_plot_error_prints_output_file(self, tmp_path, capsys):
+        h_values, errors = collect_data(max_n=5)
+        output = tmp_path / "plot.png"
+        plot_error(h_values, errors, 1.49e-8, str(output))
+
+        assert output.exists()
+        assert str(output) in capsys.readouterr().out
+
+
+# ──────────────────────────────────────────────
+# TestBatchPlots
+# ──────────────────────────────────────────────
+def write_spec(tmp_path, plots):
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text(json.dumps({"output_dir": "plots", "plots": plots}))
+    return str(spec_file)
+
+
+class TestBatchPlots:
+    def test_spec_defaults(self, tmp_path):
+        entries = load_batch_spec(write_spec(tmp_path, [{"function": "sin", "x": 1}]))
+
+        assert entries == [{
+            "function": "sin",
+            "x": 1.0,
+            "stencil": "forward",
+            "min_n": 1,
+            "max_n": 30,
+            "output": str(tmp_path / "plots" / "sin_x1_forward.png"),
+        }]
+
+    def test_spec_rejects_unknown_names(self, tmp_path):
+        with pytest.raises(ValueError):
+            load_batch_spec(write_spec(tmp_path, [{"function": "gamma", "x": 1}]))
+
+        with pytest.raises(ValueError):
+            load_batch_spec(write_spec(tmp_path, [{"function": "sin", "x": 1,
+                                                   "stencil": "sideways"}]))
+
+    def test_forward_data_matches_collect_data(self, tmp_path):
+        entry = load_batch_spec(write_spec(tmp_path, [{"function": "sin", "x": 1}]))[0]
+        h_values, errors = batch_data(entry)
+        expected_h, expected_errors = collect_data()
+
+        assert h_values.tolist() == expected_h
+        assert errors.tolist() == pytest.approx(expected_errors, rel=1e-12, abs=1e-15)
+
+    def test_renders_then_skips_up_to_date_plots(self, tmp_path):
+        spec_file = write_spec(tmp_path, [
+            {"function": "sin", "x": 1},
+            {"function": "exp", "x": 0.5, "stencil": "central", "max_n": 20},
+        ])
+
+        rendered, skipped = run_batch(spec_file)
+        assert len(rendered) == 2 and skipped == []
+        assert all((tmp_path / "plots" / name).exists()
+                   for name in ("sin_x1_forward.png", "exp_x0.5_central.png"))
+
+        rendered, skipped = run_batch(spec_file)
+        assert rendered == [] and len(skipped) == 2
+
+    def test_serial_run_closes_its_figure(self, tmp_path):
+        plt = load_pyplot()
+        figures = len(plt.get_fignums())
+
+        run_batch(write_spec(tmp_path, [{"function": "sin", "x": 1}]))
+
+        assert len(plt.get_fignums()) == figures
+
+    def test_up_to_date_run_creates_no_renderer(self, tmp_path, monkeypatch):
+        spec_file = write_spec(tmp_path, [{"function": "sin", "x": 1}])
+        run_batch(spec_file)
+
+        def fail():
+            raise AssertionError("renderer created with nothing to render")
+
+        monkeypatch.setattr(plot_error_module, "ErrorPlotRenderer", fail)
+
+        rendered, skipped = run_batch(spec_file)
+        assert rendered == [] and len(skipped) == 1
+
+    def test_rerenders_changed_or_missing_plots(self, tmp_path):
+        plots = [{"function": "sin", "x": 1}, {"function": "cos", "x": 1}]
+        run_batch(write_spec(tmp_path, plots))
+
+        (tmp_path / "plots" / "sin_x1_forward.png").unlink()
+        plots[1]["max_n"] = 10
+
+        rendered, skipped = run_batch(write_spec(tmp_path, plots))
+        assert sorted(rendered) == sorted(str(tmp_path / "plots" / name)
+                                          for name in ("sin_x1_forward.png",
+                                                       "cos_x1_forward.png"))
+        assert skipped == []
+
+    @pytest.mark.parametrize("stencil, root", [("forward", 2), ("backward", 2),
+                                               ("central", 3), ("five-point", 5)])
+    def test_reference_step_follows_the_stencil(self, tmp_path, stencil, root):
+        entry = load_batch_spec(write_spec(tmp_path, [{"function": "sin", "x": 1,
+                                                       "stencil": stencil}]))[0]
+        eps = 2.0 ** -52
+
+        assert batch_reference(entry, eps) == (eps ** (1.0 / root), root)
+
+    def test_batch_args(self):
+        assert parse_batch_args(["plot_error.py", "--batch", "spec.json"]) == ("spec.json", 1)
+        assert parse_batch_args(["plot_error.py", "--jobs", "4", "--batch", "spec.json"]) == \
+            ("spec.json", 4)
+
+    @pytest.mark.parametrize("argv", [
+        ["plot_error.py", "--batch"],
+        ["plot_error.py", "--batch", "--jobs", "2"],
+        ["plot_error.py", "--batch", "spec.json", "--jobs"],
+        ["plot_error.py", "--batch", "spec.json", "--jobs", "two"],
+        ["plot_error.py", "--batch", "spec.json", "--jobs", "0"],
+    ])
+    def test_bad_batch_args_are_a_usage_error(self, argv, capsys):
+        with pytest.raises(SystemExit) as exit_info:
+            parse_batch_args(argv)
+
+        assert exit_info.value.code == 2
+        assert "Usage:" in capsys.readouterr().err
+
+    def test_process_pool(self, tmp_path):
+        spec_file = write_spec(tmp_path, [{"function": name, "x": 0.5}
+                                          for name in ("sin", "cos", "exp")])
+
+        rendered, _ = run_batch(spec_file, jobs=2)
+
+        assert len(rendered) == 3
+        assert all(open(output, "rb").read(4) == b"\x89PNG" for output in rendered)
\ No newline at end of file
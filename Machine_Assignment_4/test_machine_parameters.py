@@ -0,0 +1,87 @@
+"""
+Test suite for machine_parameters.py
+
+Tests cover:
+  - Probed values against numpy.finfo and the Cleve Moler epsilon
+  - Rounding mode detection
+  - Caching and immutability of the results
+"""
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from machine_epsilon import cleve_moler_epsilon
+from machine_parameters import FLOAT_TYPES, all_machine_parameters, machine_parameters
+
+
+# ──────────────────────────────────────────────
+# TestProbedValues
+# ──────────────────────────────────────────────
+class TestProbedValues:
+    @pytest.mark.parametrize("name", FLOAT_TYPES)
+    def test_matches_finfo(self, name):
+        params = machine_parameters(name)
+        info = np.finfo(name)
+
+        assert params.epsilon == info.eps
+        assert params.smallest_normal == info.smallest_normal
+        assert params.smallest_subnormal == info.smallest_subnormal
+        assert params.max == info.max
+        assert params.mantissa_bits == info.nmant
+
+    @pytest.mark.parametrize("name", FLOAT_TYPES)
+    def test_values_keep_their_precision(self, name):
+        params = machine_parameters(name)
+
+        assert params.epsilon.dtype == np.dtype(name)
+        assert params.smallest_subnormal.dtype == np.dtype(name)
+
+    def test_float64_matches_cleve_moler(self):
+        params = machine_parameters()
+
+        assert params.epsilon == cleve_moler_epsilon()
+        assert params.sqrt_epsilon == pytest.approx(1.490116e-08, rel=1e-6)
+
+    def test_precision_ordering(self):
+        params = all_machine_parameters()
+        epsilons = [params[name].epsilon for name in FLOAT_TYPES]
+
+        assert list(params) == list(FLOAT_TYPES)
+        assert epsilons == sorted(epsilons, reverse=True)
+
+    def test_half_precision_values(self):
+        params = machine_parameters(np.float16)
+
+        assert params.epsilon == 2.0 ** -10
+        assert params.smallest_normal == 2.0 ** -14
+        assert params.smallest_subnormal == 2.0 ** -24
+        assert params.max == 65504.0
+        assert params.bits == 16
+
+
+# ──────────────────────────────────────────────
+# TestRounding
+# ──────────────────────────────────────────────
+class TestRounding:
+    @pytest.mark.parametrize("name", FLOAT_TYPES)
+    def test_default_is_nearest(self, name):
+        assert machine_parameters(name).rounding == "nearest"
+
+
+# ──────────────────────────────────────────────
+# TestCaching
+# ──────────────────────────────────────────────
+class TestCaching:
+    def test_same_object_for_any_spelling(self):
+        assert machine_parameters("float32") is machine_parameters(np.float32)
+        assert machine_parameters() is machine_parameters(np.dtype("float64"))
+
+    def test_frozen(self):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            machine_parameters().epsilon = 1.0
+
+    def test_rejects_non_float_types(self):
+        with pytest.raises(ValueError):
+            machine_parameters("int32")
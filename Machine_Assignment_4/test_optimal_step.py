@@ -0,0 +1,117 @@
+"""
+Test suite for optimal_step.py
+
+Tests cover:
+  - Initial guess from machine epsilon
+  - Golden-section search over powers of two
+  - Optimal step search with and without an exact derivative
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from finite_difference import run_finite_difference
+from machine_epsilon import cleve_moler_epsilon, sqrt_epsilon
+from optimal_step import (differentiate, golden_section_minimum, initial_step_exponent,
+                          optimal_step_size)
+from plot_error import collect_data, find_minimum_error
+from stencils import CENTRAL
+
+
+# ──────────────────────────────────────────────
+# TestInitialGuess
+# ──────────────────────────────────────────────
+class TestInitialGuess:
+    def test_forward_guess_is_sqrt_eps(self):
+        n = initial_step_exponent(1.0)
+        assert 2.0 ** -n == pytest.approx(sqrt_epsilon(cleve_moler_epsilon()), rel=0.5)
+
+    def test_central_guess_is_larger(self):
+        assert initial_step_exponent(1.0, CENTRAL) < initial_step_exponent(1.0)
+
+    def test_guess_scales_with_x(self):
+        assert initial_step_exponent(1024.0) == initial_step_exponent(1.0) - 10
+
+
+# ──────────────────────────────────────────────
+# TestGoldenSection
+# ──────────────────────────────────────────────
+class TestGoldenSection:
+    def test_finds_minimum_of_parabola(self):
+        assert golden_section_minimum(lambda n: (n - 17) ** 2, 1, 40) == 17
+
+    def test_minimum_at_bracket_edge(self):
+        assert golden_section_minimum(lambda n: n, 5, 30) == 5
+
+    def test_uses_few_evaluations(self):
+        calls = set()
+
+        def error(n):
+            calls.add(n)
+            return abs(n - 23)
+
+        golden_section_minimum(error, 10, 40)
+        assert len(calls) < 12
+
+
+# ──────────────────────────────────────────────
+# TestOptimalStepSize
+# ──────────────────────────────────────────────
+class TestOptimalStepSize:
+    def test_matches_exhaustive_sweep(self):
+        h_values, errors = collect_data()
+        h_min, err_min = find_minimum_error(h_values, errors)
+
+        result = optimal_step_size(math.sin, 1.0, math.cos)
+
+        assert result.h == h_min
+        assert result.error == err_min
+
+    def test_needs_a_handful_of_evaluations(self):
+        result = optimal_step_size(math.sin, 1.0, math.cos)
+        assert result.evaluations < 12
+
+    def test_without_exact_derivative(self):
+        result = optimal_step_size(math.exp, 2.0)
+        assert result.derivative == pytest.approx(math.exp(2.0), rel=1e-7)
+
+    def test_any_callable(self):
+        result = optimal_step_size(lambda x: x ** 3, 2.0, lambda x: 3 * x ** 2)
+        assert result.derivative == pytest.approx(12.0, rel=1e-7)
+
+    def test_higher_order_stencil(self):
+        result = optimal_step_size(math.sin, 1.0, math.cos, stencil=CENTRAL)
+        assert result.error < 1e-10
+
+    def test_estimated_error_is_never_zero(self):
+        # D(h) == D(h/2) exactly for a linear function
+        result = optimal_step_size(lambda x: 3.0 * x + 1.0, 1.0)
+
+        assert result.error > 0
+        assert result.derivative == pytest.approx(3.0, rel=1e-12)
+
+    def test_error_is_a_python_float(self):
+        for df in (None, math.cos, np.cos):
+            result = optimal_step_size(np.sin, 1.0, df)
+            assert type(result.error) is float
+            assert type(result.derivative) is float
+
+    def test_differentiate(self):
+        assert differentiate(math.log, 2.0) == pytest.approx(0.5, rel=1e-7)
+
+
+# ──────────────────────────────────────────────
+# TestGenericFunctions
+# ──────────────────────────────────────────────
+class TestGenericFunctions:
+    def test_collect_data_with_other_function(self):
+        _, errors = collect_data(x=0.0, max_n=5, f=math.exp, df=math.exp)
+        assert errors[0] == pytest.approx(abs(1.0 - (math.exp(0.5) - 1.0) / 0.5))
+
+    def test_run_finite_difference_with_other_function(self, capsys):
+        run_finite_difference(x=0.0, max_n=3, f=math.exp, df=math.exp)
+        lines = capsys.readouterr().out.strip().split('\n')
+        assert len(lines) == 5
+        assert "1.00000000" in lines[2]
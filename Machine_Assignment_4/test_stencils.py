@@ -0,0 +1,120 @@
+"""
+Test suite for stencils.py
+
+Tests cover:
+  - Exact stencil weights and error orders
+  - Batch evaluation of stencils
+  - Richardson extrapolation tables
+"""
+
+import math
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from finite_difference import approximate_derivative
+from stencils import (BACKWARD, CENTRAL, FIVE_POINT, FORWARD, STENCILS, Stencil,
+                      central_stencil, richardson_extrapolate, richardson_table)
+
+
+# ──────────────────────────────────────────────
+# TestStencilWeights
+# ──────────────────────────────────────────────
+class TestStencilWeights:
+    def test_forward(self):
+        assert FORWARD.offsets == (0, 1)
+        assert FORWARD.weights == (-1, 1)
+        assert FORWARD.order == 1
+
+    def test_backward(self):
+        assert BACKWARD.offsets == (-1, 0)
+        assert BACKWARD.weights == (-1, 1)
+        assert BACKWARD.order == 1
+
+    def test_central_drops_zero_weight(self):
+        assert CENTRAL.offsets == (-1, 1)
+        assert CENTRAL.weights == (Fraction(-1, 2), Fraction(1, 2))
+        assert CENTRAL.evaluations == 2
+
+    def test_five_point(self):
+        assert FIVE_POINT.weights == (Fraction(1, 12), Fraction(-2, 3),
+                                      Fraction(2, 3), Fraction(-1, 12))
+        assert FIVE_POINT.order == 4
+
+    def test_symmetric_error_has_only_even_powers(self):
+        assert CENTRAL.error_orders(3) == [2, 4, 6]
+
+    def test_one_sided_error_has_every_power(self):
+        assert FORWARD.error_orders(3) == [1, 2, 3]
+
+    def test_second_derivative(self):
+        stencil = Stencil.from_offsets((-1, 0, 1), derivative=2)
+        assert stencil.weights == (1, -2, 1)
+        assert stencil.order == 2
+
+    def test_central_stencil_of_order_4_is_five_point(self):
+        assert central_stencil(4).weights == FIVE_POINT.weights
+
+    def test_too_few_offsets(self):
+        with pytest.raises(ValueError):
+            Stencil.from_offsets((0,), derivative=1)
+
+    def test_repeated_offsets(self):
+        with pytest.raises(ValueError):
+            Stencil.from_offsets((0, 1, 1))
+
+    def test_registry(self):
+        assert STENCILS["central"] is CENTRAL
+
+
+# ──────────────────────────────────────────────
+# TestStencilApply
+# ──────────────────────────────────────────────
+class TestStencilApply:
+    def test_forward_matches_scalar_formula(self):
+        for n in range(1, 31):
+            h = 2.0 ** -n
+            assert FORWARD.apply(np.sin, 1.0, h) == approximate_derivative(1.0, h)
+
+    def test_higher_order_is_more_accurate(self):
+        h = 2.0 ** -6
+        errors = [abs(s.apply(np.sin, 1.0, h) - math.cos(1.0))
+                  for s in (FORWARD, CENTRAL, FIVE_POINT)]
+        assert errors[0] > errors[1] > errors[2]
+
+    def test_broadcasts_x_and_h(self):
+        x = np.array([[0.0], [1.0], [2.0]])
+        h = np.array([0.1, 0.01])
+        result = CENTRAL.apply(np.sin, x, h)
+        assert result.shape == (3, 2)
+        assert result == pytest.approx(np.cos(x) * np.ones((1, 2)), abs=2e-3)
+
+    def test_counts_evaluations(self):
+        calls = []
+
+        def f(x):
+            calls.append(x)
+            return np.sin(x)
+
+        FIVE_POINT.apply(f, np.linspace(0, 1, 100), 0.01)
+        assert len(calls) == FIVE_POINT.evaluations == 4
+
+
+# ──────────────────────────────────────────────
+# TestRichardson
+# ──────────────────────────────────────────────
+class TestRichardson:
+    def test_table_shape(self):
+        table = richardson_table(FORWARD, np.sin, 1.0, 0.5, levels=4)
+        assert [len(row) for row in table] == [1, 2, 3, 4]
+
+    def test_extrapolation_improves_each_column(self):
+        table = richardson_table(CENTRAL, np.sin, 1.0, 0.5, levels=4)
+        errors = [abs(row[-1] - math.cos(1.0)) for row in table]
+        assert errors[0] > errors[1] > errors[2] > errors[3]
+
+    def test_extrapolated_forward_difference(self):
+        result = richardson_extrapolate(FORWARD, np.exp, np.array([0.0, 1.0]),
+                                        0.1, levels=5)
+        assert result == pytest.approx(np.exp([0.0, 1.0]), rel=1e-9)
@@ -0,0 +1,288 @@
+"""
+Benchmark the solvers over a catalog of test functions.
+
+Every method is run (without tracing) on every problem in CATALOG under
+each precision policy. For every iteration the benchmark records
+
+  - the time spent computing the step
+  - how many times f (and f') was evaluated
+  - the bit lengths of the numerator and denominator of the newest iterate
+    (Fraction policies only; these show how fast exact arithmetic grows)
+
+and, for every run, the solution, the residual |f(x)|, the totals and
+whether the method converged. The runs are summarized in a Markdown
+table and, with --output FILE, written to FILE as JSON.
+
+Exact Fractions can grow without bound (e.g., regula falsi on a cubic),
+and the cost of a step grows with them, so a run is stopped before its
+next step once it has used max_seconds or its newest iterate has more
+than max_bits bits (numerator and denominator together).
+
+Usage: python benchmark_solvers.py [--precision P,P,...] [--output FILE]
+                                   [--max-seconds S] [--max-bits B]
+"""
+
+import json
+import sys
+import time
+from fractions import Fraction
+from typing import Callable, List, NamedTuple
+
+from expressions import build_f_df
+from solvers import (BracketStep, EvaluationCounter, NewtonStep, PrecisionPolicy,
+                     SecantStep, bisection_steps, brent_steps, met_stop_condition,
+                     newton_steps, parse_policy, regula_falsi_steps, secant_steps)
+
+DEFAULT_MAX_SECONDS = 5.0
+DEFAULT_MAX_BITS = 32768
+
+
+class Problem(NamedTuple):
+    """
+    A test function with a bracket [a, b] around one root, where
+    f(a) < 0 < f(b) (as bisection_steps requires). Newton's method starts
+    from b.
+    """
+
+    name: str
+    expression: str
+    a: Fraction
+    b: Fraction
+
+
+CATALOG = (
+    Problem("quadratic", "x**2 - 3*x - 4", Fraction(0), Fraction(6)),
+    Problem("sqrt2", "x**2 - 2", Fraction(1), Fraction(2)),
+    Problem("cubic", "x**3 - 2*x - 5", Fraction(2), Fraction(3)),
+    Problem("quintic", "x**5 - (7*x)**2", Fraction(1), Fraction(5)),
+    Problem("dottie", "x - cos(x)", Fraction(0), Fraction(1)),
+    Problem("exp", "exp(x) - 2", Fraction(0), Fraction(1)),
+)
+
+METHODS = (
+    ("bisection", bisection_steps),
+    ("regula_falsi", regula_falsi_steps),
+    ("secant", secant_steps),
+    ("newton", newton_steps),
+    ("brent", brent_steps),
+)
+
+
+def __newest_iterate(step):
+    """Return the iterate a step computed (None for the starting step)"""
+
+    if isinstance(step, BracketStep):
+        return step.x_n
+
+    if isinstance(step, (SecantStep, NewtonStep)):
+        return step.x_n_plus_1
+
+    return None
+
+
+def __bit_lengths(value) -> tuple:
+    """Return (numerator bits, denominator bits), or (None, None) for non-Fractions"""
+
+    if not isinstance(value, Fraction):
+        return (None, None)
+
+    return (value.numerator.bit_length(), value.denominator.bit_length())
+
+
+def run_benchmark(problem: Problem,
+                  method: str,
+                  engine: Callable,
+                  policy: PrecisionPolicy,
+                  max_seconds: float = DEFAULT_MAX_SECONDS,
+                  max_bits: int = DEFAULT_MAX_BITS) -> dict:
+    """
+    Run one method on one problem under one policy and return its record
+    (a JSON-serializable dictionary).
+
+    status is "converged", "max iterations", "time limit", "bit limit" or
+    the error the method raised (e.g., a division by zero).
+    """
+
+    f, df = build_f_df(problem.expression, policy.backend)
+    counted_f = EvaluationCounter(f)
+    counted_df = EvaluationCounter(df)
+
+    args = ((counted_f, counted_df, problem.b) if engine is newton_steps
+            else (counted_f, problem.a, problem.b))
+
+    steps = engine(*args, policy=policy)
+
+    record = {
+        "problem": problem.name,
+        "expression": problem.expression,
+        "method": method,
+        "policy": policy.name,
+        "steps": [],
+    }
+
+    seconds = 0.0
+    solution = None
+    status = None
+    step = None
+    f_evaluations = df_evaluations = 0
+
+    deadline = time.perf_counter() + max_seconds
+
+    try:
+        while True:
+            if step is not None and time.perf_counter() > deadline:
+                status = "time limit"
+                solution = __newest_iterate(step)
+                break
+
+            try:
+                step = next(steps)
+
+            except StopIteration as done:
+                solution = done.value
+                status = "converged" if met_stop_condition(step) else "max iterations"
+                break
+
+            seconds += step.seconds
+            numerator_bits, denominator_bits = __bit_lengths(__newest_iterate(step))
+
+            record["steps"].append({
+                "n": step.n,
+                "seconds": step.seconds,
+                "f_evaluations": counted_f.count - f_evaluations,
+                "df_evaluations": counted_df.count - df_evaluations,
+                "numerator_bits": numerator_bits,
+                "denominator_bits": denominator_bits,
+            })
+
+            f_evaluations = counted_f.count
+            df_evaluations = counted_df.count
+
+            if numerator_bits is not None and numerator_bits + denominator_bits > max_bits:
+                status = "bit limit"
+                solution = __newest_iterate(step)
+                break
+
+    except (ArithmeticError, ValueError) as err:
+        status = f"failed: {err}"
+
+    # |f(x)| is evaluated in floating point so huge Fractions stay cheap
+    float_f, _ = build_f_df(problem.expression, "float")
+
+    record.update({
+        "status": status,
+        "solution": float(solution) if solution is not None else None,
+        "abs_fx": abs(float_f(float(solution))) if solution is not None else None,
+        "iterations": record["steps"][-1]["n"] if record["steps"] else 0,
+        "seconds": seconds,
+        "f_evaluations": counted_f.count,
+        "df_evaluations": counted_df.count,
+        "max_bits": max((step["numerator_bits"] + step["denominator_bits"]
+                         for step in record["steps"]
+                         if step["numerator_bits"] is not None), default=None),
+    })
+
+    return record
+
+
+def run_catalog(policies: List[PrecisionPolicy],
+                catalog: tuple = CATALOG,
+                max_seconds: float = DEFAULT_MAX_SECONDS,
+                max_bits: int = DEFAULT_MAX_BITS) -> list:
+    """
+    Run every method on every problem in catalog under every policy and
+    return the records (see run_benchmark).
+    """
+
+    return [run_benchmark(problem, method, engine, policy, max_seconds, max_bits)
+            for problem in catalog
+            for method, engine in METHODS
+            for policy in policies]
+
+
+def print_summary(records: list) -> None:
+    """
+    Print one Markdown table row per run.
+    """
+
+    fmt_str_header = "|{:^10}|{:^14}|{:^18}|{:^6}|{:^6}|{:^6}|{:^12}|{:^10}|{:^11}|{:^16}|"
+    fmt_str_row = "|{:<10}|{:<14}|{:<18}|{:>6d}|{:>6d}|{:>6d}|{:>12.3f}|{:>10}|{:>11}|{:<16}|"
+
+    print(fmt_str_header.format("Problem", "Method", "Precision", "n", "$f$", "$f'$",
+                                "Time (ms)", "Max Bits", "Residual", "Status"))
+    print("|:" + "-" * 9 + "|:" + "-" * 13 + "|:" + "-" * 17 + "|"
+          + ("-" * 5 + ":|") * 3 + "-" * 11 + ":|" + "-" * 9 + ":|"
+          + "-" * 10 + ":|:" + "-" * 15 + "|")
+
+    for record in records:
+        max_bits = record["max_bits"] if record["max_bits"] is not None else "-"
+        abs_fx = f"{record['abs_fx']:.2e}" if record["abs_fx"] is not None else "-"
+
+        print(fmt_str_row.format(record["problem"],
+                                 record["method"],
+                                 record["policy"],
+                                 record["iterations"],
+                                 record["f_evaluations"],
+                                 record["df_evaluations"],
+                                 record["seconds"] * 1000,
+                                 max_bits,
+                                 abs_fx,
+                                 record["status"][:16]))
+
+
+def __handle_cli_args() -> tuple:
+    """
+    A wrapper for CLI parsing and usage message logic
+
+    Returns (policies, JSON file name or None, max seconds per run, max bits)
+    """
+
+    args = sys.argv[1:]
+    options = {"--precision": "exact,float",
+               "--output": None,
+               "--max-seconds": str(DEFAULT_MAX_SECONDS),
+               "--max-bits": str(DEFAULT_MAX_BITS)}
+
+    while args:
+        name = args.pop(0)
+
+        if name not in options or not args:
+            print("Usage: {0} [--precision P,P,...] [--output FILE] [--max-seconds S] [--max-bits B]"
+                  .format(*sys.argv))
+            print("  P is one of: exact, float, fraction:<max denominator>, decimal:<digits>")
+            sys.exit(1)
+
+        options[name] = args.pop(0)
+
+    try:
+        policies = [parse_policy(text) for text in options["--precision"].split(",")]
+        max_seconds = float(options["--max-seconds"])
+        max_bits = int(options["--max-bits"])
+
+    except ValueError as e:
+        print(str(e))
+        sys.exit(2)
+
+    return (policies, options["--output"], max_seconds, max_bits)
+
+
+def main():
+    policies, output_file, max_seconds, max_bits = __handle_cli_args()
+
+    records = run_catalog(policies, max_seconds=max_seconds, max_bits=max_bits)
+
+    print("# Benchmark")
+
+    if output_file is not None:
+        with open(output_file, "w") as json_out:
+            json.dump(records, json_out, indent=2)
+
+        print(f"Per-iteration data written to {output_file}")
+
+    print()
+
+    print_summary(records)
+
+
+if __name__ == "__main__":
+    main()
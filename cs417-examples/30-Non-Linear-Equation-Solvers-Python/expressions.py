@@ -0,0 +1,464 @@
+"""
+Turn a math expression in x (e.g., "x**2 - 3*x - 4") into callables for the
+solvers, along with its derivative.
+
+The text is parsed once with the ast module and checked against a small
+whitelist (numbers, x, pi, e, + - * / ** ^ and a few functions). The
+derivative is built symbolically from the same tree. Each tree is then
+compiled into a plain Python function for one of four backends:
+
+  - fraction  exact Fraction arithmetic (what the solvers use); functions
+              such as sin are evaluated in floating point and converted
+              back to a Fraction
+  - decimal   Decimals (in the current decimal context); functions such as
+              sin are evaluated in floating point
+  - float     Python floats and the math module
+  - numpy     NumPy arrays (NumPy is only imported for this backend)
+
+The compiled functions contain the expression itself as Python bytecode,
+so evaluating them does not walk a tree or call through nested closures.
+"""
+
+import ast
+import math
+from decimal import Decimal
+from fractions import Fraction
+from typing import Callable, Optional, Union
+
+VARIABLE = "x"
+
+CONSTANTS = {
+    "pi": math.pi,
+    "e": math.e,
+}
+
+FUNCTIONS = ("sin", "cos", "tan", "exp", "log", "sqrt")
+
+Number = Union[int, float, Fraction]
+
+
+class ExpressionError(ValueError):
+    """Raised when the text is not a supported expression in x."""
+
+
+# ------------------------------------------------------------------------------
+# Parsing
+# ------------------------------------------------------------------------------
+def __check_node(node: ast.AST) -> ast.expr:
+    """
+    Return a copy of node, or raise ExpressionError if node (or any node
+    below it) is not allowed.
+    """
+
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise ExpressionError(f"Unsupported constant {node.value!r}")
+
+        return node
+
+    if isinstance(node, ast.Name):
+        if node.id != VARIABLE and node.id not in CONSTANTS:
+            raise ExpressionError(f"Unknown name '{node.id}'"
+                                  f" (only {VARIABLE}, {', '.join(CONSTANTS)})")
+
+        return ast.Name(id=node.id, ctx=ast.Load())
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        operand = __check_node(node.operand)
+
+        return operand if isinstance(node.op, ast.UAdd) else _neg(operand)
+
+    if isinstance(node, ast.BinOp):
+        left = __check_node(node.left)
+        right = __check_node(node.right)
+
+        if isinstance(node.op, (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow)):
+            return ast.BinOp(left=left, op=node.op, right=right)
+
+    if isinstance(node, ast.Call):
+        if (not isinstance(node.func, ast.Name)
+                or node.func.id not in FUNCTIONS
+                or len(node.args) != 1
+                or node.keywords):
+            raise ExpressionError("Only single argument calls to "
+                                  + ", ".join(FUNCTIONS) + " are allowed")
+
+        return _call(node.func.id, __check_node(node.args[0]))
+
+    raise ExpressionError(f"Unsupported syntax '{ast.unparse(node)}'")
+
+
+def parse(text: str) -> ast.expr:
+    """
+    Parse text into a checked expression tree. Both ^ and ** mean power
+    (^ is replaced before parsing so it keeps the precedence of **).
+
+    Raises ExpressionError if the text is not valid Python syntax or uses
+    anything outside the whitelist.
+    """
+
+    try:
+        tree = ast.parse(text.strip().replace("^", "**"), mode="eval")
+
+    except SyntaxError as err:
+        raise ExpressionError(f"Invalid expression '{text}': {err.msg}") from err
+
+    return __check_node(tree.body)
+
+
+# ------------------------------------------------------------------------------
+# Tree construction (with constant folding)
+# ------------------------------------------------------------------------------
+def _constant(node: ast.expr) -> Optional[Number]:
+    """Return the value of a numeric literal (possibly negated), else None."""
+
+    if isinstance(node, ast.Constant):
+        return node.value
+
+    if (isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub)
+            and isinstance(node.operand, ast.Constant)):
+        return -node.operand.value
+
+    return None
+
+
+def _number(value: Number) -> ast.expr:
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+
+    if value < 0:
+        return ast.UnaryOp(op=ast.USub(), operand=ast.Constant(value=-value))
+
+    return ast.Constant(value=value)
+
+
+def _neg(node: ast.expr) -> ast.expr:
+    value = _constant(node)
+
+    if value is not None:
+        return _number(-value)
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return node.operand
+
+    return ast.UnaryOp(op=ast.USub(), operand=node)
+
+
+def _add(left: ast.expr, right: ast.expr) -> ast.expr:
+    a, b = _constant(left), _constant(right)
+
+    if a is not None and b is not None:
+        return _number(a + b)
+
+    if a == 0:
+        return right
+
+    if b == 0:
+        return left
+
+    return ast.BinOp(left=left, op=ast.Add(), right=right)
+
+
+def _sub(left: ast.expr, right: ast.expr) -> ast.expr:
+    a, b = _constant(left), _constant(right)
+
+    if a is not None and b is not None:
+        return _number(a - b)
+
+    if a == 0:
+        return _neg(right)
+
+    if b == 0:
+        return left
+
+    return ast.BinOp(left=left, op=ast.Sub(), right=right)
+
+
+def _mul(left: ast.expr, right: ast.expr) -> ast.expr:
+    a, b = _constant(left), _constant(right)
+
+    if a is not None and b is not None:
+        return _number(a * b)
+
+    if a == 0 or b == 0:
+        return _number(0)
+
+    if a == 1:
+        return right
+
+    if b == 1:
+        return left
+
+    if a == -1:
+        return _neg(right)
+
+    if b == -1:
+        return _neg(left)
+
+    return ast.BinOp(left=left, op=ast.Mult(), right=right)
+
+
+def _div(left: ast.expr, right: ast.expr) -> ast.expr:
+    a, b = _constant(left), _constant(right)
+
+    if a == 0 and b != 0:
+        return _number(0)
+
+    if b == 1:
+        return left
+
+    return ast.BinOp(left=left, op=ast.Div(), right=right)
+
+
+def _pow(base: ast.expr, exponent: ast.expr) -> ast.expr:
+    b = _constant(exponent)
+
+    if b == 0:
+        return _number(1)
+
+    if b == 1:
+        return base
+
+    return ast.BinOp(left=base, op=ast.Pow(), right=exponent)
+
+
+def _call(name: str, argument: ast.expr) -> ast.expr:
+    return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=[argument], keywords=[])
+
+
+# ------------------------------------------------------------------------------
+# Symbolic differentiation
+# ------------------------------------------------------------------------------
+def __has_variable(node: ast.expr) -> bool:
+    return any(isinstance(n, ast.Name) and n.id == VARIABLE for n in ast.walk(node))
+
+
+def __derivative_of_call(name: str, u: ast.expr, du: ast.expr) -> ast.expr:
+    """Chain rule: d/dx name(u) = name'(u) * du."""
+
+    if name == "sin":
+        return _mul(_call("cos", u), du)
+
+    if name == "cos":
+        return _neg(_mul(_call("sin", u), du))
+
+    if name == "tan":
+        return _div(du, _pow(_call("cos", u), _number(2)))
+
+    if name == "exp":
+        return _mul(_call("exp", u), du)
+
+    if name == "log":
+        return _div(du, u)
+
+    # sqrt
+    return _div(du, _mul(_number(2), _call("sqrt", u)))
+
+
+def derivative(node: ast.expr) -> ast.expr:
+    """Return the tree of d/dx of a checked expression tree."""
+
+    if not __has_variable(node):
+        return _number(0)
+
+    if isinstance(node, ast.Name):
+        return _number(1)
+
+    if isinstance(node, ast.UnaryOp):
+        return _neg(derivative(node.operand))
+
+    if isinstance(node, ast.Call):
+        u = node.args[0]
+        return __derivative_of_call(node.func.id, u, derivative(u))
+
+    u, v = node.left, node.right
+    du, dv = derivative(u), derivative(v)
+
+    if isinstance(node.op, ast.Add):
+        return _add(du, dv)
+
+    if isinstance(node.op, ast.Sub):
+        return _sub(du, dv)
+
+    if isinstance(node.op, ast.Mult):
+        return _add(_mul(du, v), _mul(u, dv))
+
+    if isinstance(node.op, ast.Div) and not __has_variable(v):
+        return _div(du, v)
+
+    if isinstance(node.op, ast.Div):
+        return _div(_sub(_mul(du, v), _mul(u, dv)), _pow(v, _number(2)))
+
+    # Power rule when the exponent does not depend on x
+    if not __has_variable(v):
+        c = _constant(v)
+        reduced = _number(c - 1) if c is not None else _sub(v, _number(1))
+
+        return _mul(_mul(v, _pow(u, reduced)), du)
+
+    # d/dx u^v = u^v * (v' log(u) + v u' / u)
+    return _mul(node, _add(_mul(dv, _call("log", u)), _div(_mul(v, du), u)))
+
+
+# ------------------------------------------------------------------------------
+# Compilation
+# ------------------------------------------------------------------------------
+def __fraction_function(function: Callable[[float], float]) -> Callable[[Fraction], Fraction]:
+    def wrapped(x):
+        return Fraction(function(x))
+
+    return wrapped
+
+
+def __decimal_function(function: Callable[[float], float]) -> Callable[[Decimal], Decimal]:
+    def wrapped(x):
+        return Decimal(function(x))
+
+    return wrapped
+
+
+def __fraction_pow(base: Fraction, exponent: Fraction) -> Fraction:
+    """Fraction ** Fraction is only exact for integer exponents."""
+
+    result = base ** exponent
+    return result if isinstance(result, Fraction) else Fraction(result)
+
+
+def __namespace(backend: str) -> dict:
+    """Return the names available to compiled code for a backend."""
+
+    if backend == "float":
+        namespace = {name: getattr(math, name) for name in FUNCTIONS}
+        namespace.update(CONSTANTS)
+
+    elif backend == "fraction":
+        namespace = {name: __fraction_function(getattr(math, name)) for name in FUNCTIONS}
+        namespace.update({name: Fraction(value) for name, value in CONSTANTS.items()})
+        namespace["_fraction_pow"] = __fraction_pow
+
+    elif backend == "decimal":
+        namespace = {name: __decimal_function(getattr(math, name)) for name in FUNCTIONS}
+        namespace.update({name: Decimal(value) for name, value in CONSTANTS.items()})
+
+    elif backend == "numpy":
+        import numpy as np
+
+        namespace = {name: getattr(np, name) for name in FUNCTIONS}
+        namespace.update(CONSTANTS)
+        namespace["zeros_like"] = np.zeros_like
+
+    else:
+        raise ValueError(f"Unknown backend '{backend}' (fraction, decimal, float or numpy)")
+
+    return namespace
+
+
+class _BindLiterals(ast.NodeTransformer):
+    """
+    Replace every literal with a name bound to its value in the backend's
+    number type, so conversions happen once at compile time.
+
+    For the fraction backend, powers with a non-integer exponent are routed
+    through _fraction_pow so the result stays a Fraction.
+    """
+
+    def __init__(self, backend: str, namespace: dict):
+        self.backend = backend
+        self.namespace = namespace
+
+    def visit_Constant(self, node: ast.Constant) -> ast.expr:
+        if self.backend == "fraction":
+            # str() keeps decimal literals exact, e.g., 0.1 -> 1/10
+            value = Fraction(str(node.value))
+        elif self.backend == "decimal":
+            value = Decimal(str(node.value))
+        else:
+            value = float(node.value)
+
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+
+        return ast.Name(id=name, ctx=ast.Load())
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.expr:
+        exponent = _constant(node.right)
+
+        if (self.backend == "fraction" and isinstance(node.op, ast.Pow)
+                and (exponent is None or exponent != int(exponent))):
+            return ast.Call(func=ast.Name(id="_fraction_pow", ctx=ast.Load()),
+                            args=[self.visit(node.left), self.visit(node.right)],
+                            keywords=[])
+
+        return self.generic_visit(node)
+
+
+def compile_tree(tree: ast.expr, backend: str = "fraction") -> Callable:
+    """Compile a checked expression tree into a function of x."""
+
+    namespace = __namespace(backend)
+    body = _BindLiterals(backend, namespace).visit(__copy(tree))
+
+    # Keep the output shape of a constant (e.g., a derivative) equal to x's
+    if backend == "numpy" and not __has_variable(tree):
+        body = ast.BinOp(left=body, op=ast.Add(),
+                         right=_call("zeros_like", ast.Name(id=VARIABLE, ctx=ast.Load())))
+
+    function = ast.Expression(
+        body=ast.Lambda(args=ast.arguments(posonlyargs=[],
+                                           args=[ast.arg(arg=VARIABLE)],
+                                           kwonlyargs=[],
+                                           kw_defaults=[],
+                                           defaults=[]),
+                        body=body))
+
+    code = compile(ast.fix_missing_locations(function), "<expression>", "eval")
+
+    return eval(code, namespace)
+
+
+def __copy(tree: ast.expr) -> ast.expr:
+    return ast.parse(ast.unparse(tree), mode="eval").body
+
+
+class Expression:
+    """
+    A parsed expression in x.
+
+    Compiled functions are cached, so each backend is compiled at most once.
+    """
+
+    def __init__(self, text: str, tree: Optional[ast.expr] = None):
+        self.tree = parse(text) if tree is None else tree
+        self.text = text
+        self.__compiled = {}
+        self.__derivative = None
+
+    def __str__(self) -> str:
+        return ast.unparse(self.tree)
+
+    def derivative(self) -> "Expression":
+        """Return d/dx of this expression."""
+
+        if self.__derivative is None:
+            tree = derivative(self.tree)
+            self.__derivative = Expression(ast.unparse(tree), tree)
+
+        return self.__derivative
+
+    def function(self, backend: str = "fraction") -> Callable:
+        """Return this expression compiled for the given backend."""
+
+        if backend not in self.__compiled:
+            self.__compiled[backend] = compile_tree(self.tree, backend)
+
+        return self.__compiled[backend]
+
+
+def build_f_df(text: str, backend: str = "fraction") -> tuple[Callable, Callable]:
+    """
+    Return (f, df) for the expression text, compiled for the given backend.
+    """
+
+    expression = Expression(text)
+
+    return (expression.function(backend), expression.derivative().function(backend))
@@ -0,0 +1,100 @@
+"""
+Find every root of f in a (wide) interval without being given brackets.
+
+  1. Sample f on a grid of evenly spaced points (one vectorized call).
+  2. Every pair of neighbouring samples where f changes sign is a bracket;
+     samples where f is exactly zero are roots already.
+  3. Solve all brackets at once with one of the vectorized solvers.
+  4. Sort the roots and merge those closer together than the tolerance.
+
+Roots where f touches zero without changing sign (e.g., x^2 at 0), and
+pairs of roots closer together than the grid spacing, are not detected;
+use more samples for those.
+"""
+
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+import vectorized_solvers
+from solvers import EPSILON
+
+DEFAULT_SAMPLES = 10000
+
+METHODS = ("bisection", "regula_falsi", "secant", "newton")
+
+
+def isolate_roots(f: Callable,
+                  lower: float,
+                  upper: float,
+                  samples: int = DEFAULT_SAMPLES) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sample f at samples + 1 evenly spaced points of [lower, upper].
+
+    Returns (a, b, exact): the end points of every interval [a_i, b_i] over
+    which f changes sign, and the sample points where f is exactly zero.
+    Samples where f is not finite (e.g., log of a negative number) never
+    form a bracket.
+    """
+
+    x = np.linspace(lower, upper, samples + 1)
+
+    with np.errstate(all="ignore"):
+        fx = np.asarray(f(x), dtype=np.float64) + np.zeros_like(x)
+
+    signs = np.sign(fx)
+    changes = signs[:-1] * signs[1:] < 0
+
+    return x[:-1][changes], x[1:][changes], x[signs == 0]
+
+
+def deduplicate(roots: np.ndarray, tol: float = EPSILON) -> np.ndarray:
+    """
+    Return the sorted roots, keeping only the first of any run of roots
+    that lie within tol of the previous one.
+    """
+
+    roots = np.sort(roots)
+
+    if roots.size == 0:
+        return roots
+
+    keep = np.concatenate(([True], np.diff(roots) >= tol))
+
+    return roots[keep]
+
+
+def find_roots(f: Callable,
+               lower: float,
+               upper: float,
+               method: str = "bisection",
+               df: Optional[Callable] = None,
+               samples: int = DEFAULT_SAMPLES,
+               tol: float = EPSILON) -> np.ndarray:
+    """
+    Return every root of f found in [lower, upper], sorted and
+    deduplicated to tol.
+
+    f (and df, which newton requires) must accept NumPy arrays. Bisection
+    and regula falsi solve each bracket; secant starts from its two end
+    points and newton from its midpoint. Lanes that do not converge, and
+    roots that land outside [lower, upper], are dropped.
+    """
+
+    if method not in METHODS:
+        raise ValueError(f"Unknown method '{method}' (one of {', '.join(METHODS)})")
+
+    if method == "newton" and df is None:
+        raise ValueError("newton needs the derivative df")
+
+    a, b, exact = isolate_roots(f, lower, upper, samples)
+
+    if method == "newton":
+        result = vectorized_solvers.newton(f, df, (a + b) / 2, tol=tol)
+    else:
+        result = getattr(vectorized_solvers, method)(f, a, b, tol=tol)
+
+    roots = result.roots[result.converged]
+    roots = roots[(roots >= lower) & (roots <= upper)]
+
+    return deduplicate(np.concatenate((roots, exact)), tol)
@@ -2,9 +2,14 @@
 
 import sys
 from fractions import Fraction
-from typing import Tuple
+from typing import List, Optional, Tuple
 
-from solvers import bisection, newton, print_solution, regula_falsi, secant
+from expressions import ExpressionError, build_f_df
+from root_isolation import DEFAULT_SAMPLES, METHODS, find_roots
+from solvers import (EXACT, EvaluationCounter, PrecisionPolicy, bisection,
+                     bisection_steps, brent, brent_steps, compare_policies, newton, newton_steps,
+                     parse_policy, print_policy_comparison, print_solution,
+                     regula_falsi, regula_falsi_steps, secant, secant_steps)
 
 
 def __build_f_df():
@@ -33,17 +38,106 @@ def __build_f_df():
     return (f, df)
 
 
-def __handle_cli_args() -> Tuple[Fraction, Fraction]:
+def __print_evaluations(*counters: EvaluationCounter) -> None:
+    """
+    Print how many times the solver evaluated f (and f', for Newton's method)
+    """
+
+    print("## Evaluations")
+
+    for name, counter in zip(("$f$", "$f'$"), counters):
+        print(f"{name}: {counter.count}")
+        print()
+
+
+def __build_functions(expression: Optional[str], policy: PrecisionPolicy):
+    """
+    Return (f, df) for the expression (or the built-in f when expression is
+    None), compiled for the number type the policy uses.
+    """
+
+    if expression is None:
+        return __build_f_df()
+
+    # e.g., "x**2 - 3*x - 4"; df is derived symbolically
+    try:
+        return build_f_df(expression, policy.backend)
+
+    except ExpressionError as err:
+        print(str(err))
+        sys.exit(3)
+
+
+def __pop_option(args: List[str], name: str) -> Optional[str]:
+    """
+    Remove "name value" from args and return value (None if name is absent)
+    """
+
+    if name not in args:
+        return None
+
+    index = args.index(name)
+    value = args[index + 1] if index + 1 < len(args) else ""
+    del args[index:index + 2]
+
+    return value
+
+
+def __pop_flag(args: List[str], name: str) -> bool:
+    """
+    Remove name from args and return whether it was present
+    """
+
+    if name not in args:
+        return False
+
+    args.remove(name)
+
+    return True
+
+
+def __handle_cli_args() -> Tuple[Fraction, Fraction, Optional[str], dict]:
     """
     A wrapper for CLI parsing and usage message logic
+
+    Returns a, b, the expression (or None) and a dictionary of options:
+    policy, policies (for --compare), all_roots, method and samples
     """
 
+    args = sys.argv[1:]
+
     try:
-        limit_a = Fraction(sys.argv[1])
-        limit_b = Fraction(sys.argv[2])
+        precision = __pop_option(args, "--precision")
+        compare = __pop_option(args, "--compare")
+        method = __pop_option(args, "--method")
+        samples = __pop_option(args, "--samples")
+        all_roots = __pop_flag(args, "--all")
+
+        options = {
+            "policy": parse_policy(precision) if precision is not None else EXACT,
+            "policies": ([parse_policy(text) for text in compare.split(",")]
+                         if compare is not None else []),
+            "all_roots": all_roots,
+            "method": method if method is not None else "bisection",
+            "samples": int(samples) if samples is not None else DEFAULT_SAMPLES,
+        }
+
+        if options["method"] not in METHODS:
+            raise ValueError(f"Unknown method '{method}' (one of {', '.join(METHODS)})")
+
+    except ValueError as e:
+        print(str(e))
+        sys.exit(2)
+
+    try:
+        limit_a = Fraction(args[0])
+        limit_b = Fraction(args[1])
 
     except IndexError:
-        print("Usage: {0} a b".format(*sys.argv))
+        print("Usage: {0} a b [expression] [--precision P] [--compare P,P,...]".format(*sys.argv))
+        print("       {0} a b [expression] --all [--method M] [--samples N]".format(*sys.argv))
+        print("  P is one of: exact, float, fraction:<max denominator>, decimal:<digits>")
+        print("  M is one of: " + ", ".join(METHODS))
         sys.exit(1)
 
     except ValueError as e:
@@ -51,16 +145,103 @@ def __handle_cli_args() -> Tuple[Fraction, Fraction]:
         print("  " + str(e))
         sys.exit(2)
 
-    return (limit_a, limit_b)
+    expression = args[2] if len(args) > 2 else None
+
+    return (limit_a, limit_b, expression, options)
+
+
+def __run_all_roots(limit_a: Fraction,
+                    limit_b: Fraction,
+                    expression: Optional[str],
+                    method: str,
+                    samples: int) -> None:
+    """
+    Find and print every root in [a, b] (see root_isolation.find_roots)
+    """
+
+    if expression is None:
+        math_f, math_df = __build_f_df()
+
+    else:
+        try:
+            math_f, math_df = build_f_df(expression, "numpy")
+
+        except ExpressionError as err:
+            print(str(err))
+            sys.exit(3)
+
+    roots = find_roots(math_f, float(limit_a), float(limit_b),
+                       method=method, df=math_df, samples=samples)
+
+    print("# Roots")
+    print(f"{samples} samples over $[{float(limit_a)}, {float(limit_b)}]$, "
+          f"solved with {method}")
+    print()
+
+    fmt_str_header = "|{:^4}|{:^20}|{:^20}|"
+    fmt_str_row = "|{:4d}|{:>20.10f}|{:>20.6e}|"
+
+    print(fmt_str_header.format("n", "$x$", "$f(x)$"))
+    print("|---:|" + ("-" * 19 + ":|") * 2)
+
+    for n, root in enumerate(roots, start=1):
+        print(fmt_str_row.format(n, root, float(math_f(root))))
+
+
+def __run_comparison(limit_a: Fraction,
+                     limit_b: Fraction,
+                     expression: Optional[str],
+                     policies: List[PrecisionPolicy]) -> None:
+    """
+    Run every method (without step tables) under each precision policy and
+    print the solution, iteration count and time of each run
+    """
+
+    methods = (("Bisection", bisection_steps),
+               ("Regula Falsi (False Position)", regula_falsi_steps),
+               ("Secant", secant_steps),
+               ("Newton", newton_steps),
+               ("Brent", brent_steps))
+
+    for index, (name, engine) in enumerate(methods):
+        if index:
+            print()
+
+        print(f"# {name}")
+        print("## Precision")
+
+        results = []
+
+        for policy in policies:
+            math_f, math_df = __build_functions(expression, policy)
+            args = ((math_f, math_df, limit_a) if engine is newton_steps
+                    else (math_f, limit_a, limit_b))
+
+            try:
+                results.extend(compare_policies(engine, args, [policy]))
+
+            except (ValueError, ZeroDivisionError) as err:
+                print(f"{policy.name}: Method Failed - {err}")
+
+        print_policy_comparison(results)
 
 
 def main():
-    limit_a, limit_b = __handle_cli_args()
+    limit_a, limit_b, expression, options = __handle_cli_args()
+    policy = options["policy"]
 
     # a = Fraction(-1 * math.pi / 4)
     # b = Fraction(2 * math.pi / 3)
 
-    math_f, math_df = __build_f_df()
+    if options["all_roots"]:
+        __run_all_roots(limit_a, limit_b, expression, options["method"], options["samples"])
+        return
+
+    if options["policies"]:
+        __run_comparison(limit_a, limit_b, expression, options["policies"])
+        return
+
+    math_f, math_df = __build_functions(expression, policy)
 
     # ---------------------------------------------------------------------------
     # Bisection Method
@@ -69,10 +250,12 @@ def main():
     print("## Steps")
 
     try:
-        solution_bisection = bisection(math_f, limit_a, limit_b)
+        counted_f = EvaluationCounter(math_f)
+        solution_bisection = bisection(counted_f, limit_a, limit_b, policy=policy)
         fx_bisection = math_f(solution_bisection)
 
         print_solution(solution_bisection, fx_bisection)
+        __print_evaluations(counted_f)
 
     except ValueError as err:
         print()
@@ -87,10 +270,12 @@ def main():
     print("## Steps")
 
     try:
-        solution_regula_falsi = regula_falsi(math_f, limit_a, limit_b)
+        counted_f = EvaluationCounter(math_f)
+        solution_regula_falsi = regula_falsi(counted_f, limit_a, limit_b, policy=policy)
         fx_regula_falsi = math_f(solution_regula_falsi)
 
         print_solution(solution_regula_falsi, fx_regula_falsi)
+        __print_evaluations(counted_f)
 
     except ZeroDivisionError as err:
         print()
@@ -105,10 +290,12 @@ def main():
     print("## Steps")
 
     try:
-        solution_secant = secant(math_f, limit_a, limit_b)
+        counted_f = EvaluationCounter(math_f)
+        solution_secant = secant(counted_f, limit_a, limit_b, policy=policy)
         fx_secant = math_f(solution_secant)
 
         print_solution(solution_secant, fx_secant)
+        __print_evaluations(counted_f)
 
     except ZeroDivisionError as err:
         print()
@@ -123,16 +310,39 @@ def main():
     print("## Steps")
 
     try:
-        solution_newton = newton(math_f, math_df, limit_a)
+        counted_f = EvaluationCounter(math_f)
+        counted_df = EvaluationCounter(math_df)
+        solution_newton = newton(counted_f, counted_df, limit_a, policy=policy)
         fx_newton = math_f(solution_newton)
 
         print_solution(solution_newton, fx_newton)
+        __print_evaluations(counted_f, counted_df)
 
     except ZeroDivisionError as err:
         print()
         print("## Method Failed")
         print(str(err))
 
+    # ---------------------------------------------------------------------------
+    # Brent's Method
+    # ---------------------------------------------------------------------------
+    print()
+    print("# Brent")
+    print("## Steps")
+
+    try:
+        counted_f = EvaluationCounter(math_f)
+        solution_brent = brent(counted_f, limit_a, limit_b, policy=policy)
+        fx_brent = math_f(solution_brent)
+
+        print_solution(solution_brent, fx_brent)
+        __print_evaluations(counted_f)
+
+    except (ValueError, ZeroDivisionError) as err:
+        print()
+        print("## Method Failed")
+        print(str(err))
+
 
 if __name__ == "__main__":
     main()
@@ -1,16 +1,142 @@
 """
 Collection of instrumented nonlinear solvers for CS 417/517 lecture examples.
+
+Each method is split into two parts:
+
+  - an iteration engine (e.g., bisection_steps) that yields one lightweight
+    step record (a NamedTuple) per iteration and returns the solution
+  - a wrapper (e.g., bisection) that runs the engine and passes every step
+    to a tracer
+
+The default tracer prints the Markdown tables used in lecture. CSVTracer
+writes the same columns as CSV, and tracer=None skips tracing entirely,
+so no time is spent formatting (potentially huge) Fractions.
+
+Every engine also takes a PrecisionPolicy that decides how the iterates are
+represented: exact Fractions (the default), Fractions rounded with
+limit_denominator after each step, Decimals at a fixed precision, or
+floats. Each step record includes the time spent computing it, and
+compare_policies() runs one method under several policies side by side.
 """
 
+import contextlib
+import csv
+import decimal
+import math
+import sys
+import time
+from decimal import Decimal
 from fractions import Fraction
-from typing import Callable
+from typing import Callable, Generator, NamedTuple, Optional, TextIO, Union
 
 EPSILON = 10e-6
 MAX_ITERATIONS = 100
 ONE_HALF = Fraction.from_float(0.5)
 
 
-def __get_printable_fraction(fraction: Fraction, digit_limit: int = 8) -> str:
+class EvaluationCounter:
+    """
+    Wrap a function and count how many times it is called, e.g.,
+
+        counted_f = EvaluationCounter(f)
+        bisection(counted_f, a, b)
+        print(counted_f.count)
+    """
+
+    def __init__(self, function: Callable):
+        self.function = function
+        self.count = 0
+
+    def __call__(self, x):
+        self.count += 1
+        return self.function(x)
+
+
+class PrecisionPolicy:
+    """
+    How a solver represents its iterates.
+
+    :param name: short description, e.g., "fraction:1000000"
+    :param convert: applied to the starting values and to every new iterate
+    :param context: returns a context manager that every step is computed in
+    :param backend: the expressions backend whose functions take and return
+        the policy's number type ("fraction", "decimal" or "float")
+    """
+
+    def __init__(self,
+                 name: str,
+                 convert: Callable,
+                 context: Callable = contextlib.nullcontext,
+                 backend: str = "fraction"):
+        self.name = name
+        self.convert = convert
+        self.context = context
+        self.backend = backend
+
+    def __repr__(self) -> str:
+        return f"PrecisionPolicy({self.name!r})"
+
+
+def limited_denominator(max_denominator: int) -> PrecisionPolicy:
+    """
+    Fractions whose denominators are capped at max_denominator after each
+    step (with Fraction.limit_denominator).
+    """
+
+    def convert(value):
+        return Fraction(value).limit_denominator(max_denominator)
+
+    return PrecisionPolicy(f"fraction:{max_denominator}", convert)
+
+
+def decimal_precision(digits: int) -> PrecisionPolicy:
+    """
+    Decimals with the given number of significant digits. All arithmetic in
+    a step (including f) is done at that precision.
+    """
+
+    context = decimal.Context(prec=digits)
+
+    def convert(value):
+        if isinstance(value, Fraction):
+            return context.divide(Decimal(value.numerator), Decimal(value.denominator))
+
+        return context.create_decimal(value)
+
+    return PrecisionPolicy(f"decimal:{digits}", convert,
+                           lambda: decimal.localcontext(context), backend="decimal")
+
+
+EXACT = PrecisionPolicy("exact", Fraction)
+FLOAT = PrecisionPolicy("float", float, backend="float")
+
+
+def parse_policy(text: str) -> PrecisionPolicy:
+    """
+    Return the policy described by text: "exact", "float",
+    "fraction:<max denominator>" or "decimal:<digits>".
+    """
+
+    name, _, argument = text.partition(":")
+
+    if name == "exact" and not argument:
+        return EXACT
+
+    if name == "float" and not argument:
+        return FLOAT
+
+    if name == "fraction" and argument.isdigit():
+        return limited_denominator(int(argument))
+
+    if name == "decimal" and argument.isdigit():
+        return decimal_precision(int(argument))
+
+    raise ValueError(f"Unknown precision '{text}'"
+                     " (exact, float, fraction:N or decimal:N)")
+
+
+def __get_printable_fraction(fraction: Union[Fraction, Decimal, float],
+                             digit_limit: int = 8) -> str:
     """
     Generate a printable fraction in the form:
     \\frac{numerator}{denominator} (.6f)
@@ -25,13 +151,144 @@ def __get_printable_fraction(fraction: Fraction, digit_limit: int = 8) -> str:
 
     fmt_str = "$\\frac{{{f.numerator}}}{{{f.denominator}}}={:.6f}$"
 
-    if len(str(fraction.numerator)) > digit_limit or fraction.denominator == 1:
+    # Decimals and floats are printed as decimals only
+    if not isinstance(fraction, Fraction):
+        return "${:.6f}$".format(float(fraction))
+
+    # Same test as len(str(fraction.numerator)) > digit_limit (the sign
+    # counts as a digit), without converting a huge numerator to a string
+    max_numerator = 10 ** (digit_limit - (1 if fraction.numerator < 0 else 0))
+
+    if abs(fraction.numerator) >= max_numerator or fraction.denominator == 1:
 
         return "${:.6f}$".format(float(fraction))
 
     return fmt_str.format(float(fraction), f=fraction)
 
 
+# Tracer classes reach the formatter through this alias, since a double
+# underscore name used inside a class body would be mangled
+_printable_fraction = __get_printable_fraction
+
+
+class BracketStep(NamedTuple):
+    """
+    One bisection or regula falsi step (x_n and f(x_n) are None in row 0).
+    seconds is the time spent computing the step.
+    """
+
+    n: int
+    a_n: Fraction
+    b_n: Fraction
+    x_n: Optional[Fraction] = None
+    fx_n: Optional[Fraction] = None
+    seconds: float = 0.0
+
+
+class SecantStep(NamedTuple):
+    """
+    One secant step (the next iterate is None in the first row).
+    seconds is the time spent computing the step.
+    """
+
+    n: int
+    x_n_minus_1: Fraction
+    x_n: Fraction
+    x_n_plus_1: Optional[Fraction] = None
+    fx_n_plus_1: Optional[Fraction] = None
+    seconds: float = 0.0
+
+
+class NewtonStep(NamedTuple):
+    """One Newton step. seconds is the time spent computing the step."""
+
+    n: int
+    x_n: Fraction
+    fx_n: Fraction
+    dfx_n: Fraction
+    x_n_plus_1: Fraction
+    seconds: float = 0.0
+
+
+class MarkdownTracer:
+    """
+    Print each step as a row of a Markdown table (the lecture format).
+
+    :param stream: where to write (defaults to the current sys.stdout)
+    """
+
+    fmt_str_header = "|{:^4}|{:^16}|{:^16}|{:^16}|{:^20}|"
+    fmt_str_row = "|{:4d}|{:>16}|{:>16}|{:>16}|{:>20}|"
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream
+
+    def begin(self, headers: tuple) -> None:
+        print(self.fmt_str_header.format(*headers), file=self.stream)
+        print("|---:|"
+              + ("-" * 15 + ":|") * 3
+              + ("-" * 19 + ":|"), file=self.stream)
+
+    def row(self, n: int, values: tuple) -> None:
+        cells = ("" if value is None else _printable_fraction(value)
+                 for value in values)
+
+        print(self.fmt_str_row.format(n, *cells), file=self.stream)
+
+
+class CSVTracer:
+    """
+    Write each step as a CSV row. Values are written as floats; empty cells
+    stay empty.
+
+    :param stream: where to write (defaults to the current sys.stdout)
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream
+        self.writer = None
+
+    def begin(self, headers: tuple) -> None:
+        if self.stream is None:
+            self.stream = sys.stdout
+
+        self.writer = csv.writer(self.stream)
+        self.writer.writerow(header.strip("$") for header in headers)
+
+    def row(self, n: int, values: tuple) -> None:
+        self.writer.writerow([n] + ["" if value is None else float(value)
+                                    for value in values])
+
+
+MARKDOWN = MarkdownTracer()
+
+
+def __trace(steps: Generator, headers: tuple, columns: Callable, tracer) -> Fraction:
+    """
+    Run an iteration engine to completion, passing each step to tracer.
+
+    :param steps: generator that yields step records and returns the solution
+    :param headers: table headers
+    :param columns: function mapping a step to its table cells (after n)
+    :param tracer: MarkdownTracer, CSVTracer, or None for no output
+
+    :return: the solution returned by the engine
+    """
+
+    if tracer is not None:
+        tracer.begin(headers)
+
+    while True:
+        try:
+            step = next(steps)
+
+        except StopIteration as done:
+            return done.value
+
+        if tracer is not None:
+            tracer.row(step.n, columns(step))
+
+
 def print_solution(solution: Fraction, fx_solution) -> None:
     """
     Print the solution (x) and f(x) under a subsection heading.
@@ -48,9 +305,50 @@ def print_solution(solution: Fraction, fx_solution) -> None:
     print()
 
 
-def bisection(f: Callable[[Fraction], Fraction],
-              a: Fraction,
-              b: Fraction) -> Fraction:
+BRACKET_HEADERS = ("n", "$a_n$", "$b_n$", "$x_n$", "$f(x_n)$")
+SECANT_HEADERS = ("n", "$x_{n-1}$", "$x_n$", "$x_{n+1}$", "$f(x_{n+1})$")
+NEWTON_HEADERS = ("n", "$x_{n-1}$",
+                  "$f(x_{n-1})$", "$f'(x_{n-1})$", "$x_{n+1}$")
+
+
+def __bracket_columns(step: BracketStep) -> tuple:
+    return (step.a_n, step.b_n, step.x_n, step.fx_n)
+
+
+def __secant_columns(step: SecantStep) -> tuple:
+    # After the first row the lecture tables list x_n before x_{n-1}
+    if step.x_n_plus_1 is None:
+        return (step.x_n_minus_1, step.x_n, None, None)
+
+    return (step.x_n, step.x_n_minus_1, step.x_n_plus_1, step.fx_n_plus_1)
+
+
+def __newton_columns(step: NewtonStep) -> tuple:
+    return (step.x_n, step.fx_n, step.dfx_n, step.x_n_plus_1)
+
+
+def __check_bracket(n: int, fb_n, fa_n=None) -> None:
+    """
+    Raise ValueError unless [a_n, b_n] brackets a root
+
+    Bisection only carries f(b_n) and needs f(b_n) >= 0 (it keeps
+    f(a_n) < 0). When f(a_n) is given, f only has to change sign between
+    a_n and b_n, in either direction.
+    """
+
+    if fa_n is None:
+        if fb_n < 0:
+            raise ValueError("$f(b_{}) < 0$ - Invariant violated!".format(n))
+
+    elif (fa_n > 0 and fb_n > 0) or (fa_n < 0 and fb_n < 0):
+        raise ValueError("$f(a_{0})$ and $f(b_{0})$ have the same sign - Invariant violated!"
+                         .format(n))
+
+
+def bisection_steps(f: Callable[[Fraction], Fraction],
+                    a: Fraction,
+                    b: Fraction,
+                    policy: PrecisionPolicy = EXACT) -> Generator[BracketStep, None, Fraction]:
     """
     Compute a solution to f using the bisection method
 
@@ -72,44 +370,39 @@ def bisection(f: Callable[[Fraction], Fraction],
         end if;
 
     end for
-    """
 
-    fmt_str_header = "|{:^4}|{:^16}|{:^16}|{:^16}|{:^20}|"
-    fmt_str_row = "|{:4d}|{:>16}|{:>16}|{:>16}|{:>20}|"
+    Yields a BracketStep per iteration and returns the solution.
+    """
 
-    table_headers = ("n", "$a_n$", "$b_n$", "$x_n$", "$f(x_n)$")
+    with policy.context():
+        a_n = policy.convert(a)
+        b_n = policy.convert(b)
 
-    a_n = Fraction(a)
-    b_n = Fraction(b)
+        # f(b_n) is carried between iterations, so f is evaluated once per step
+        fb_n = f(b_n)
 
-    print(fmt_str_header.format(*table_headers))
-    print("|---:|"
-          + ("-" * 15 + ":|") * 3
-          + ("-" * 19 + ":|"))
-    print(fmt_str_row.format(0,
-                             __get_printable_fraction(a_n),
-                             __get_printable_fraction(b_n),
-                             "", ""))
+    yield BracketStep(0, a_n, b_n)
 
     for n in range(1, MAX_ITERATIONS):
-        x_n = ONE_HALF * (a_n + b_n)
+        start_time = time.perf_counter()
+
+        with policy.context():
+            x_n = policy.convert((a_n + b_n) / 2)
 
-        if f(b_n) < 0:
-            raise ValueError("$f(b_{}) < 0$ - Invariant violated!".format(n-1))
+            __check_bracket(n - 1, fb_n)
 
-        if f(x_n) < 0:
-            a_n = x_n
-            # b_n = b_n-1 # unchanged
+            fx_n = f(x_n)
 
-        if f(x_n) >= 0:
-            # a_n = a_n-1 # unchanged
-            b_n = x_n
+            if fx_n < 0:
+                a_n = x_n
+                # b_n = b_n-1 # unchanged
 
-        print(fmt_str_row.format(n,
-                                 __get_printable_fraction(a_n),
-                                 __get_printable_fraction(b_n),
-                                 __get_printable_fraction(x_n),
-                                 __get_printable_fraction(f(x_n))))
+            else:
+                # a_n = a_n-1 # unchanged
+                b_n = x_n
+                fb_n = fx_n
+
+        yield BracketStep(n, a_n, b_n, x_n, fx_n, time.perf_counter() - start_time)
 
         # Stop Condition
         if abs(b_n - a_n) < EPSILON:
@@ -118,9 +411,24 @@ def bisection(f: Callable[[Fraction], Fraction],
     return x_n
 
 
-def regula_falsi(f: Callable[[Fraction], Fraction],
-                 a: Fraction,
-                 b: Fraction) -> Fraction:
+def bisection(f: Callable[[Fraction], Fraction],
+              a: Fraction,
+              b: Fraction,
+              tracer=MARKDOWN,
+              policy: PrecisionPolicy = EXACT) -> Fraction:
+    """
+    Compute a solution to f using the bisection method (see
+    bisection_steps), passing every step to tracer.
+    """
+
+    return __trace(bisection_steps(f, a, b, policy),
+                   BRACKET_HEADERS, __bracket_columns, tracer)
+
+
+def regula_falsi_steps(f: Callable[[Fraction], Fraction],
+                       a: Fraction,
+                       b: Fraction,
+                       policy: PrecisionPolicy = EXACT) -> Generator[BracketStep, None, Fraction]:
     """
     Compute a solution to f using the false position method
 
@@ -136,47 +444,48 @@ def regula_falsi(f: Callable[[Fraction], Fraction],
             an+1 = an, bn+1 = xn
         end if
     end for
-    """
 
-    fmt_str_header = "|{:^4}|{:^16}|{:^16}|{:^16}|{:^20}|"
-    fmt_str_row = "|{:4d}|{:>16}|{:>16}|{:>16}|{:>20}|"
+    Yields a BracketStep per iteration and returns the solution.
+    """
 
-    table_headers = ("n", "$a_n$", "$b_n$", "$x_n$", "$f(x_n)$")
+    with policy.context():
+        a_n = policy.convert(a)
+        b_n = policy.convert(b)
 
-    a_n = Fraction(a)
-    b_n = Fraction(b)
+        # f(a_n) and f(b_n) are carried between iterations, so f is evaluated
+        # once per step
+        fa_n = f(a_n)
+        fb_n = f(b_n)
 
-    print(fmt_str_header.format(*table_headers))
-    print("|---:|"
-          + ("-" * 15 + ":|") * 3
-          + ("-" * 19 + ":|"))
-    print(fmt_str_row.format(0, __get_printable_fraction(a_n),
-                             __get_printable_fraction(b_n), "", ""))
+    yield BracketStep(0, a_n, b_n)
 
     for n in range(1, MAX_ITERATIONS):
-        try:
-            x_n = a_n - ((a_n - b_n) / (f(a_n) - f(b_n))) * f(a_n)
+        start_time = time.perf_counter()
+
+        with policy.context():
+            try:
+                x_n = policy.convert(a_n - ((a_n - b_n) / (fa_n - fb_n)) * fa_n)
 
-        except ZeroDivisionError:
-            err_fmt_str = "$x_n=\\frac{{{a_n}-{b_n}}}{{{}-{}}}*{}$"
-            err_str = err_fmt_str.format(f(a_n), f(b_n), f(a_n),
-                                         a_n=a_n,
-                                         b_n=b_n)
+            except ZeroDivisionError:
+                err_fmt_str = "$x_n=\\frac{{{a_n}-{b_n}}}{{{}-{}}}*{}$"
+                err_str = err_fmt_str.format(fa_n, fb_n, fa_n,
+                                             a_n=a_n,
+                                             b_n=b_n)
 
-            raise ZeroDivisionError(err_str + " Division by Zero")
+                raise ZeroDivisionError(err_str + " Division by Zero")
 
-        if f(x_n) * f(a_n) > 0:
-            a_n = x_n
-            # b_n - No change
-        else:
-            # a_n - No Change
-            b_n = x_n
+            fx_n = f(x_n)
 
-        print(fmt_str_row.format(n,
-                                 __get_printable_fraction(a_n),
-                                 __get_printable_fraction(b_n),
-                                 __get_printable_fraction(x_n),
-                                 __get_printable_fraction(f(x_n))))
+            if fx_n * fa_n > 0:
+                a_n = x_n
+                fa_n = fx_n
+                # b_n - No change
+            else:
+                # a_n - No Change
+                b_n = x_n
+                fb_n = fx_n
+
+        yield BracketStep(n, a_n, b_n, x_n, fx_n, time.perf_counter() - start_time)
 
         if abs(b_n - a_n) < EPSILON:
             break
@@ -184,9 +493,24 @@ def regula_falsi(f: Callable[[Fraction], Fraction],
     return x_n
 
 
-def secant(f: Callable[[Fraction], Fraction],
-           x_n_minus_1: Fraction,
-           x_n: Fraction) -> Fraction:
+def regula_falsi(f: Callable[[Fraction], Fraction],
+                 a: Fraction,
+                 b: Fraction,
+                 tracer=MARKDOWN,
+                 policy: PrecisionPolicy = EXACT) -> Fraction:
+    """
+    Compute a solution to f using the false position method (see
+    regula_falsi_steps), passing every step to tracer.
+    """
+
+    return __trace(regula_falsi_steps(f, a, b, policy),
+                   BRACKET_HEADERS, __bracket_columns, tracer)
+
+
+def secant_steps(f: Callable[[Fraction], Fraction],
+                 x_n_minus_1: Fraction,
+                 x_n: Fraction,
+                 policy: PrecisionPolicy = EXACT) -> Generator[SecantStep, None, Fraction]:
     """
     Compute a solution to f using the secant method
 
@@ -202,46 +526,45 @@ def secant(f: Callable[[Fraction], Fraction],
             an+1 = an, bn+1 = xn
         end if
     end for
-    """
 
-    fmt_str_header = "|{:^4}|{:^16}|{:^16}|{:^16}|{:^20}|"
-    fmt_str_row = "|{:4d}|{:>16}|{:>16}|{:>16}|{:>20}|"
+    Yields a SecantStep per iteration and returns the solution.
+    """
 
-    table_headers = ("n", "$x_{n-1}$", "$x_n$", "$x_{n+1}$", "$f(x_{n+1})$")
+    with policy.context():
+        x_n_minus_1 = policy.convert(x_n_minus_1)
+        x_n = policy.convert(x_n)
 
-    x_n_minus_1 = Fraction(x_n_minus_1)
-    x_n = Fraction(x_n)
+        # f(x_{n-1}) and f(x_n) are carried between iterations, so f is
+        # evaluated once per step
+        fx_n_minus_1 = f(x_n_minus_1)
+        fx_n = f(x_n)
 
-    print(fmt_str_header.format(*table_headers))
-    print("|---:|"
-          + ("-" * 15 + ":|") * 3
-          + ("-" * 19 + ":|"))
-    print(fmt_str_row.format(1,
-                             __get_printable_fraction(x_n_minus_1),
-                             __get_printable_fraction(x_n), "", ""))
+    yield SecantStep(1, x_n_minus_1, x_n)
 
     for n in range(2, MAX_ITERATIONS):
-        try:
-            next_x_n = x_n - ((x_n - x_n_minus_1)
-                              / (f(x_n) - f(x_n_minus_1))) * f(x_n)
-
-        except ZeroDivisionError:
-            err_fmt_str = "$x_n=\\frac{{{x_n}-{x_nm1}}}{{{}-{}}}*{}$"
-            err_str = err_fmt_str.format(f(x_n),
-                                         f(x_n_minus_1),
-                                         f(x_n),
-                                         x_n=x_n,
-                                         x_nm1=x_n_minus_1)
-            raise ZeroDivisionError(err_str + " Division by Zero")
-
-        print(fmt_str_row.format(n,
-                                 __get_printable_fraction(x_n),
-                                 __get_printable_fraction(x_n_minus_1),
-                                 __get_printable_fraction(next_x_n),
-                                 __get_printable_fraction(f(next_x_n))))
-
-        x_n_minus_1 = x_n
-        x_n = next_x_n
+        start_time = time.perf_counter()
+
+        with policy.context():
+            try:
+                next_x_n = policy.convert(x_n - ((x_n - x_n_minus_1)
+                                                 / (fx_n - fx_n_minus_1)) * fx_n)
+
+            except ZeroDivisionError:
+                err_fmt_str = "$x_n=\\frac{{{x_n}-{x_nm1}}}{{{}-{}}}*{}$"
+                err_str = err_fmt_str.format(fx_n,
+                                             fx_n_minus_1,
+                                             fx_n,
+                                             x_n=x_n,
+                                             x_nm1=x_n_minus_1)
+                raise ZeroDivisionError(err_str + " Division by Zero")
+
+            fnext_x_n = f(next_x_n)
+
+        yield SecantStep(n, x_n_minus_1, x_n, next_x_n, fnext_x_n,
+                         time.perf_counter() - start_time)
+
+        x_n_minus_1, fx_n_minus_1 = x_n, fx_n
+        x_n, fx_n = next_x_n, fnext_x_n
 
         if abs(x_n - x_n_minus_1) < EPSILON:
             break
@@ -249,37 +572,46 @@ def secant(f: Callable[[Fraction], Fraction],
     return x_n
 
 
-def newton(f: Callable[[Fraction], Fraction],
-           df: Callable[[Fraction, Fraction], Fraction],
-           x_n: Fraction) -> Fraction:
+def secant(f: Callable[[Fraction], Fraction],
+           x_n_minus_1: Fraction,
+           x_n: Fraction,
+           tracer=MARKDOWN,
+           policy: PrecisionPolicy = EXACT) -> Fraction:
+    """
+    Compute a solution to f using the secant method (see secant_steps),
+    passing every step to tracer.
+    """
+
+    return __trace(secant_steps(f, x_n_minus_1, x_n, policy),
+                   SECANT_HEADERS, __secant_columns, tracer)
+
+
+def newton_steps(f: Callable[[Fraction], Fraction],
+                 df: Callable[[Fraction, Fraction], Fraction],
+                 x_n: Fraction,
+                 policy: PrecisionPolicy = EXACT) -> Generator[NewtonStep, None, Fraction]:
     """
     Compute a solution to f using Newton's method.
 
     Compute x_{n+1} = x_n - (f(x_n) / df(x_n)) until
     |x_{n+1} - x_n| <= eps
-    """
 
-    fmt_str_header = "|{:^4}|{:^16}|{:^16}|{:^16}|{:^20}|"
-    fmt_str_row = "|{:4d}|{:>16}|{:>16}|{:>16}|{:>20}|"
+    Yields a NewtonStep per iteration and returns the solution.
+    """
 
-    table_headers = ("n", "$x_{n-1}$",
-                     "$f(x_{n-1})$", "$f'(x_{n-1})$", "$x_{n+1}$")
+    with policy.context():
+        x_n = policy.convert(x_n)
 
-    print(fmt_str_header.format(*table_headers))
-    print("|---:|"
-          + ("-" * 15 + ":|") * 3
-          + ("-" * 19 + ":|"))
+    for n in range(1, MAX_ITERATIONS):
+        start_time = time.perf_counter()
 
-    x_n = Fraction(x_n)
+        with policy.context():
+            fx_n = f(x_n)
+            dfx_n = df(x_n)
 
-    for n in range(1, MAX_ITERATIONS):
-        next_x_n = x_n - (f(x_n) / df(x_n))
+            next_x_n = policy.convert(x_n - (fx_n / dfx_n))
 
-        print(fmt_str_row.format(n,
-                                 __get_printable_fraction(x_n),
-                                 __get_printable_fraction(f(x_n)),
-                                 __get_printable_fraction(df(x_n)),
-                                 __get_printable_fraction(next_x_n)))
+        yield NewtonStep(n, x_n, fx_n, dfx_n, next_x_n, time.perf_counter() - start_time)
 
         if abs(x_n - next_x_n) < EPSILON:
             break
@@ -287,3 +619,253 @@ def newton(f: Callable[[Fraction], Fraction],
         x_n = next_x_n
 
     return x_n
+
+
+def newton(f: Callable[[Fraction], Fraction],
+           df: Callable[[Fraction, Fraction], Fraction],
+           x_n: Fraction,
+           tracer=MARKDOWN,
+           policy: PrecisionPolicy = EXACT) -> Fraction:
+    """
+    Compute a solution to f using Newton's method (see newton_steps),
+    passing every step to tracer.
+    """
+
+    return __trace(newton_steps(f, df, x_n, policy),
+                   NEWTON_HEADERS, __newton_columns, tracer)
+
+
+
+
+def __snap_to_grid(x, grid: int):
+    """
+    Round a Fraction to the nearest multiple of 1 / grid (other number
+    types are returned unchanged)
+    """
+
+    if not isinstance(x, Fraction):
+        return x
+
+    return Fraction(round(x * grid), grid)
+
+
+def brent_steps(f: Callable[[Fraction], Fraction],
+                a: Fraction,
+                b: Fraction,
+                policy: PrecisionPolicy = EXACT) -> Generator[BracketStep, None, Fraction]:
+    """
+    Compute a solution to f using Brent's method
+
+    Keep a bracket [b_n, c_n] with f(b_n) f(c_n) <= 0, where b_n is the
+    end point with the smaller |f|. Each step tries
+
+      - inverse quadratic interpolation through a_n, b_n, c_n (or a secant
+        step when only two distinct points are known)
+
+    and falls back to bisection whenever the interpolated point would land
+    outside the bracket or the steps stop shrinking fast enough. Bisection
+    is also forced if the bracket has not halved over the last two steps,
+    which bounds the iterations to about three times those of bisection
+    even near multiple roots. Steps are at least EPSILON / 4 long, so the
+    bracket always closes.
+
+    Stop once the bracket is shorter than EPSILON (or f(x_n) == 0).
+
+    Interpolation divides values of f by each other, so with exact
+    Fractions the denominators would multiply at every step (e.g., past
+    800,000 bits within 18 steps for (x-1)^3). Fraction iterates are
+    therefore rounded to a power-of-two grid that is 8 times finer than the
+    minimum step, which keeps their size bounded without changing how the
+    bracket closes.
+
+    Yields a BracketStep per iteration, with the bracket as (a_n, b_n) in
+    increasing order, and returns the solution.
+    """
+
+    with policy.context():
+        a_n = policy.convert(a)
+        b_n = policy.convert(b)
+        fa_n = f(a_n)
+        fb_n = f(b_n)
+
+        __check_bracket(0, fb_n, fa_n)
+
+        c_n, fc_n = a_n, fa_n
+        step = previous_step = b_n - a_n
+        # Built from EPSILON itself, since policy.convert may round it
+        # (e.g., to 0 with limited denominators)
+        min_step = type(a_n)(EPSILON) / 4
+
+        # 1 / grid <= min_step / 8
+        grid = 2 ** math.ceil(math.log2(8 / (Fraction(EPSILON) / 4)))
+
+        # Bracket widths one and two steps ago
+        last_width = older_width = abs(b_n - a_n)
+
+    yield BracketStep(0, min(a_n, b_n), max(a_n, b_n))
+
+    for n in range(1, MAX_ITERATIONS):
+        start_time = time.perf_counter()
+
+        with policy.context():
+            # Make b_n the best estimate
+            if abs(fc_n) < abs(fb_n):
+                a_n, b_n, c_n = b_n, c_n, b_n
+                fa_n, fb_n, fc_n = fb_n, fc_n, fb_n
+
+            half_width = (c_n - b_n) / 2
+
+            width = abs(c_n - b_n)
+            stalled = width > older_width / 2
+            last_width, older_width = width, last_width
+
+            if not stalled and abs(previous_step) >= min_step and abs(fa_n) > abs(fb_n):
+                s = fb_n / fa_n
+
+                if a_n == c_n:
+                    # Secant
+                    p = 2 * half_width * s
+                    q = 1 - s
+
+                else:
+                    # Inverse quadratic interpolation
+                    q = fa_n / fc_n
+                    r = fb_n / fc_n
+                    p = s * (2 * half_width * q * (q - r) - (b_n - a_n) * (r - 1))
+                    q = (q - 1) * (r - 1) * (s - 1)
+
+                if p > 0:
+                    q = -q
+
+                p = abs(p)
+
+                # Accept the interpolation only if it stays well inside the
+                # bracket and shrinks faster than the step before last
+                if 2 * p < min(3 * half_width * q - abs(min_step * q),
+                               abs(previous_step * q)):
+                    previous_step, step = step, p / q
+
+                else:
+                    previous_step = step = half_width
+
+            else:
+                previous_step = step = half_width
+
+            a_n, fa_n = b_n, fb_n
+
+            if abs(step) > min_step:
+                x_n = b_n + step
+            else:
+                x_n = b_n + (min_step if half_width > 0 else -min_step)
+
+            x_n = policy.convert(__snap_to_grid(x_n, grid))
+
+            fx_n = f(x_n)
+            b_n, fb_n = x_n, fx_n
+
+            # Keep f(b_n) and f(c_n) on opposite sides of zero
+            if (fb_n > 0 and fc_n > 0) or (fb_n < 0 and fc_n < 0):
+                c_n, fc_n = a_n, fa_n
+                step = previous_step = b_n - a_n
+
+        yield BracketStep(n, min(b_n, c_n), max(b_n, c_n), x_n, fx_n,
+                          time.perf_counter() - start_time)
+
+        if abs(c_n - b_n) < EPSILON or fx_n == 0:
+            break
+
+    # Return the end point with the smaller |f|
+    return b_n if abs(fb_n) <= abs(fc_n) else c_n
+
+
+def brent(f: Callable[[Fraction], Fraction],
+          a: Fraction,
+          b: Fraction,
+          tracer=MARKDOWN,
+          policy: PrecisionPolicy = EXACT) -> Fraction:
+    """
+    Compute a solution to f using Brent's method (see brent_steps),
+    passing every step to tracer.
+    """
+
+    return __trace(brent_steps(f, a, b, policy),
+                   BRACKET_HEADERS, __bracket_columns, tracer)
+
+
+class PolicyResult(NamedTuple):
+    """Outcome of one method run under one PrecisionPolicy"""
+
+    policy: str
+    solution: Union[Fraction, Decimal, float]
+    iterations: int
+    seconds: float
+    converged: bool
+
+
+def met_stop_condition(step) -> bool:
+    """
+    Return whether a step satisfies the stop condition of its method: the
+    bracket is shorter than EPSILON (or f(x_n) == 0), or the iterate moved
+    less than EPSILON
+    """
+
+    if isinstance(step, BracketStep):
+        return step.n > 0 and (abs(step.b_n - step.a_n) < EPSILON or step.fx_n == 0)
+
+    # SecantStep and NewtonStep
+    return abs(step.x_n_plus_1 - step.x_n) < EPSILON
+
+
+def compare_policies(engine: Callable, args: tuple, policies: list) -> list:
+    """
+    Run engine (e.g., newton_steps) with args under every policy, without
+    tracing, and return a PolicyResult for each.
+
+    A run has converged if its last step met the stop condition (see
+    met_stop_condition).
+    """
+
+    results = []
+
+    for policy in policies:
+        steps = engine(*args, policy=policy)
+        seconds = 0.0
+        last_step = None
+
+        while True:
+            try:
+                last_step = next(steps)
+
+            except StopIteration as done:
+                solution = done.value
+                break
+
+            seconds += last_step.seconds
+
+        results.append(PolicyResult(policy=policy.name,
+                                    solution=solution,
+                                    iterations=last_step.n,
+                                    seconds=seconds,
+                                    converged=met_stop_condition(last_step)))
+
+    return results
+
+
+def print_policy_comparison(results: list) -> None:
+    """
+    Print PolicyResults as a Markdown table.
+    """
+
+    fmt_str_header = "|{:^18}|{:^16}|{:^12}|{:^14}|{:^11}|"
+    fmt_str_row = "|{:<18}|{:>16.10f}|{:>12d}|{:>14.3f}|{:^11}|"
+
+    print(fmt_str_header.format("Precision", "$x$", "Iterations", "Time (ms)", "Converged"))
+    print("|:" + "-" * 17 + "|" + "-" * 15 + ":|" + "-" * 11 + ":|"
+          + "-" * 13 + ":|:" + "-" * 9 + ":|")
+
+    for result in results:
+        print(fmt_str_row.format(result.policy,
+                                 float(result.solution),
+                                 result.iterations,
+                                 result.seconds * 1000,
+                                 "yes" if result.converged else "no"))
@@ -0,0 +1,447 @@
+"""
+Test suite for expressions.py, solvers.py, vectorized_solvers.py and
+root_isolation.py
+
+Tests cover:
+  - The expression whitelist and the symbolic derivatives
+  - Every solver (and step engine) on the lecture equations under each
+    precision policy
+  - The Markdown and CSV tracers, and how often f is evaluated
+  - Brent's method on simple and multiple roots
+  - The vectorized solvers, including false position on convex functions
+  - Finding every root of a polynomial in an interval
+"""
+
+import io
+import math
+from decimal import Decimal
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+import vectorized_solvers
+
+from expressions import ExpressionError, build_f_df
+from root_isolation import METHODS, find_roots
+from solvers import (BRACKET_HEADERS, EPSILON, EXACT, FLOAT, MAX_ITERATIONS, CSVTracer,
+                     EvaluationCounter, MarkdownTracer, bisection, bisection_steps, brent, brent_steps,
+                     compare_policies, decimal_precision, limited_denominator, newton,
+                     newton_steps, parse_policy, regula_falsi, secant, secant_steps)
+
+# (expression, a, b, root) with f(a) < 0 < f(b); the first is the
+# built-in f of run_solvers.py
+EQUATIONS = (
+    ("x**2 - 3*x - 4", 0, 6, 4.0),
+    ("x**2 - 1", 0, 3, 1.0),
+    ("x - cos(x)", 0, 1, 0.7390851332151607),
+    ("x**5 - (7*x)**2", 1, 5, 49 ** (1 / 3)),
+)
+
+POLICIES = (FLOAT, limited_denominator(1000000), decimal_precision(30))
+
+
+def run_steps(steps) -> tuple:
+    """Exhaust a step engine and return (list of steps, solution)"""
+
+    records = []
+
+    while True:
+        try:
+            records.append(next(steps))
+
+        except StopIteration as done:
+            return records, done.value
+
+
+# ──────────────────────────────────────────────
+# TestExpressions
+# ──────────────────────────────────────────────
+class TestExpressions:
+    @pytest.mark.parametrize("text", [
+        "__import__('os').system('ls')",
+        "x.__class__",
+        "open('solvers.py')",
+        "(lambda: x)()",
+        "[x]",
+        "x if x else 1",
+        "x < 1",
+        "y + 1",
+        "'x'",
+        "True",
+        "sin(x, x)",
+        "sin(x=x)",
+        "math.sin(x)",
+        "x +",
+    ])
+    def test_whitelist_rejects_unsafe_input(self, text):
+        with pytest.raises(ExpressionError):
+            build_f_df(text)
+
+    def test_caret_is_power(self):
+        f, _ = build_f_df("x^2 - 2*x")
+
+        assert f(Fraction(3)) == 3
+
+    @pytest.mark.parametrize("backend_name, number_type", [
+        ("fraction", Fraction),
+        ("decimal", Decimal),
+        ("float", float),
+    ])
+    def test_backends_keep_number_type(self, backend_name, number_type):
+        f, df = build_f_df("x**2 - 3*x - 4", backend_name)
+        x = number_type(5)
+
+        assert f(x) == 6 and isinstance(f(x), number_type)
+        assert df(x) == 7 and isinstance(df(x), number_type)
+
+    def test_numpy_backend_takes_arrays(self):
+        f, df = build_f_df("x**2 - 3*x - 4", "numpy")
+
+        assert f(np.array([-1.0, 4.0])).tolist() == [0.0, 0.0]
+        assert df(np.array([0.0, 5.0])).tolist() == [-3.0, 7.0]
+
+    def test_polynomial_derivative_is_exact(self):
+        _, df = build_f_df("x**5 - (7*x)**2")
+
+        assert df(Fraction(1, 3)) == 5 * Fraction(1, 3)**4 - 98 * Fraction(1, 3)
+
+    @pytest.mark.parametrize("text, expected", [
+        ("sin(x)", math.cos),
+        ("cos(x)", lambda x: -math.sin(x)),
+        ("tan(x)", lambda x: 1 / math.cos(x)**2),
+        ("exp(2*x)", lambda x: 2 * math.exp(2 * x)),
+        ("log(x)", lambda x: 1 / x),
+        ("sqrt(x)", lambda x: 0.5 / math.sqrt(x)),
+        ("x / (1 + x)", lambda x: 1 / (1 + x)**2),
+        ("x**x", lambda x: x**x * (math.log(x) + 1)),
+        ("pi*x - e", lambda x: math.pi),
+        ("-x^3", lambda x: -3 * x**2),
+    ])
+    def test_derivatives(self, text, expected):
+        _, df = build_f_df(text, "float")
+
+        for x in (0.3, 0.7, 1.9):
+            assert df(x) == pytest.approx(expected(x), rel=1e-12)
+
+
+# ──────────────────────────────────────────────
+# TestSolvers
+# ──────────────────────────────────────────────
+class TestSolvers:
+    @pytest.mark.parametrize("policy", POLICIES, ids=lambda policy: policy.name)
+    @pytest.mark.parametrize("expression, a, b, root", EQUATIONS)
+    @pytest.mark.parametrize("solver", [bisection, regula_falsi, brent])
+    def test_bracketing_methods_converge(self, solver, expression, a, b, root, policy):
+        f, _ = build_f_df(expression, policy.backend)
+
+        solution = solver(f, Fraction(a), Fraction(b), tracer=None, policy=policy)
+
+        assert abs(float(solution) - root) < EPSILON
+
+    @pytest.mark.parametrize("policy", POLICIES, ids=lambda policy: policy.name)
+    @pytest.mark.parametrize("expression, a, b, root", EQUATIONS)
+    def test_newton_converges(self, expression, a, b, root, policy):
+        f, df = build_f_df(expression, policy.backend)
+
+        solution = newton(f, df, Fraction(b), tracer=None, policy=policy)
+
+        assert abs(float(solution) - root) < EPSILON
+
+    @pytest.mark.parametrize("policy", POLICIES, ids=lambda policy: policy.name)
+    @pytest.mark.parametrize("expression, a, b, root", EQUATIONS[:3])
+    def test_secant_converges(self, expression, a, b, root, policy):
+        # On the quintic the secant method leaves [a, b] for the root at 0
+        f, _ = build_f_df(expression, policy.backend)
+
+        solution = secant(f, Fraction(a), Fraction(b), tracer=None, policy=policy)
+
+        assert abs(float(solution) - root) < EPSILON
+
+    @pytest.mark.parametrize("solver", [bisection, regula_falsi, secant, brent])
+    def test_exact_fractions(self, solver):
+        f, _ = build_f_df("x**2 - 3*x - 4")
+
+        solution = solver(f, Fraction(0), Fraction(6), tracer=None)
+
+        assert isinstance(solution, Fraction)
+        assert abs(solution - 4) < EPSILON
+
+    @pytest.mark.parametrize("engine", [bisection_steps, secant_steps, brent_steps])
+    def test_engines_match_wrappers(self, engine):
+        f, _ = build_f_df("x - cos(x)")
+        solver = {bisection_steps: bisection, secant_steps: secant, brent_steps: brent}[engine]
+
+        _, solution = run_steps(engine(f, Fraction(0), Fraction(1)))
+
+        assert solution == solver(f, Fraction(0), Fraction(1), tracer=None)
+
+    def test_bisection_evaluates_f_once_per_step(self):
+        f, _ = build_f_df("x**2 - 3*x - 4")
+        counted_f = EvaluationCounter(f)
+
+        steps, _ = run_steps(bisection_steps(counted_f, Fraction(0), Fraction(6)))
+
+        assert counted_f.count == steps[-1].n + 1
+
+    def test_newton_evaluates_f_and_df_once_per_step(self):
+        f, df = build_f_df("x**2 - 3*x - 4")
+        counted_f = EvaluationCounter(f)
+        counted_df = EvaluationCounter(df)
+
+        steps, _ = run_steps(newton_steps(counted_f, counted_df, Fraction(6)))
+
+        assert counted_f.count == counted_df.count == steps[-1].n
+
+    def test_bisection_rejects_a_bad_bracket(self):
+        f, _ = build_f_df("x**2 - 3*x - 4")
+
+        with pytest.raises(ValueError):
+            bisection(f, Fraction(6), Fraction(0), tracer=None)
+
+
+# ──────────────────────────────────────────────
+# TestTracers
+# ──────────────────────────────────────────────
+class TestTracers:
+    def test_markdown_table_has_one_row_per_step(self):
+        f, _ = build_f_df("x**2 - 3*x - 4")
+        stream = io.StringIO()
+
+        bisection(f, Fraction(0), Fraction(6), tracer=MarkdownTracer(stream))
+        steps, _ = run_steps(bisection_steps(f, Fraction(0), Fraction(6)))
+
+        lines = stream.getvalue().splitlines()
+
+        assert lines[0] == MarkdownTracer.fmt_str_header.format(*BRACKET_HEADERS)
+        assert len(lines) == 2 + len(steps)
+        assert "$\\frac{9}{2}=4.500000$" in lines[4]
+
+    def test_csv_rows_hold_floats(self):
+        f, _ = build_f_df("x**2 - 3*x - 4")
+        stream = io.StringIO()
+
+        bisection(f, Fraction(0), Fraction(6), tracer=CSVTracer(stream))
+
+        lines = stream.getvalue().splitlines()
+
+        assert lines[:3] == ["n,a_n,b_n,x_n,f(x_n)", "0,0.0,6.0,,", "1,3.0,6.0,3.0,-4.0"]
+
+    def test_no_tracer_prints_nothing(self, capsys):
+        f, _ = build_f_df("x**2 - 3*x - 4")
+
+        brent(f, Fraction(0), Fraction(6), tracer=None)
+
+        assert capsys.readouterr().out == ""
+
+
+# ──────────────────────────────────────────────
+# TestPrecisionPolicies
+# ──────────────────────────────────────────────
+class TestPrecisionPolicies:
+    @pytest.mark.parametrize("text", ["exact", "float", "fraction:1000", "decimal:20"])
+    def test_parse_policy(self, text):
+        assert parse_policy(text).name == text
+
+    @pytest.mark.parametrize("text", ["fraction", "decimal:x", "exact:3", "double"])
+    def test_parse_policy_rejects_unknown_text(self, text):
+        with pytest.raises(ValueError):
+            parse_policy(text)
+
+    def test_limited_denominator_caps_every_iterate(self):
+        f, df = build_f_df("x - cos(x)")
+
+        steps, _ = run_steps(newton_steps(f, df, Fraction(1), limited_denominator(1000)))
+
+        assert all(step.x_n_plus_1.denominator <= 1000 for step in steps)
+
+    def test_decimal_precision_uses_decimals(self):
+        f, _ = build_f_df("x**2 - 1", "decimal")
+
+        steps, solution = run_steps(secant_steps(f, Fraction(0), Fraction(3),
+                                                 decimal_precision(12)))
+
+        assert isinstance(solution, Decimal)
+        assert all(len(step.x_n.as_tuple().digits) <= 12 for step in steps)
+
+    def test_compare_policies_counts_an_exact_root_as_converged(self):
+        # Brent lands on x = 4 exactly while the bracket is still wide
+        f, _ = build_f_df("x**2 - 3*x - 4")
+
+        result, = compare_policies(brent_steps, (f, Fraction(0), Fraction(6)), [EXACT])
+
+        assert result.solution == 4
+        assert result.converged
+
+    def test_compare_policies(self):
+        results = [compare_policies(newton_steps, (*build_f_df("x**2 - 1", policy.backend),
+                                                   Fraction(3)), [policy])[0]
+                   for policy in (EXACT, *POLICIES)]
+
+        assert [result.policy for result in results] == ["exact", "float", "fraction:1000000",
+                                                         "decimal:30"]
+        assert all(result.converged for result in results)
+        assert all(abs(float(result.solution) - 1) < EPSILON for result in results)
+
+
+# ──────────────────────────────────────────────
+# TestBrent
+# ──────────────────────────────────────────────
+class TestBrent:
+    def test_exact_fractions_stay_small_near_a_triple_root(self):
+        # Without rounding the iterates, step 18 alone took seconds and the
+        # denominators passed 800,000 bits
+        f, _ = build_f_df("(x-1)**3", "fraction")
+
+        steps, solution = run_steps(brent_steps(f, Fraction(0), Fraction(3)))
+
+        assert steps[-1].n < MAX_ITERATIONS - 1
+        assert abs(solution - 1) < EPSILON
+        assert max(step.x_n.denominator.bit_length() for step in steps[1:]) <= 32
+
+    def test_multiple_root_costs_at_most_three_bisections(self):
+        f, _ = build_f_df("(x-1)**3", "float")
+
+        brent_run, _ = run_steps(brent_steps(f, 0, 3, policy=FLOAT))
+        bisection_run, _ = run_steps(bisection_steps(f, 0, 3, policy=FLOAT))
+
+        assert brent_run[-1].n <= 3 * bisection_run[-1].n
+
+    @pytest.mark.parametrize("max_denominator", [1000, 1000000])
+    def test_limited_denominator(self, max_denominator):
+        # policy.convert(EPSILON) is 0 for these, which used to end in a
+        # ZeroDivisionError before the first step
+        policy = limited_denominator(max_denominator)
+        f, _ = build_f_df("x**2 - 3*x - 4")
+
+        steps, solution = run_steps(brent_steps(f, Fraction(0), Fraction(10), policy))
+
+        assert steps[-1].n < MAX_ITERATIONS - 1
+        assert solution == 4
+        assert all(step.b_n.denominator <= max_denominator for step in steps)
+
+    @pytest.mark.parametrize("expression, a, b", [
+        ("x**2 - 3*x - 4", 0, 6),
+        ("x**3 - 2*x - 5", 2, 3),
+        ("x - cos(x)", 0, 1),
+    ])
+    def test_faster_than_bisection_on_simple_roots(self, expression, a, b):
+        f, _ = build_f_df(expression, "fraction")
+
+        brent_run, solution = run_steps(brent_steps(f, Fraction(a), Fraction(b)))
+        bisection_run, _ = run_steps(bisection_steps(f, Fraction(a), Fraction(b)))
+
+        assert brent_run[-1].n < bisection_run[-1].n
+        assert abs(float(f(solution))) < 1e-6
+
+
+# ──────────────────────────────────────────────
+# TestVectorizedRegulaFalsi
+# ──────────────────────────────────────────────
+class TestVectorizedRegulaFalsi:
+    @pytest.mark.parametrize("f, a, b, root", [
+        (lambda x: x**10 - 1, 0.0, 1.3, 1.0),
+        (lambda x: np.exp(5 * x) - 1, -1.0, 3.0, 0.0),
+        (lambda x: x**2 - 2, 0.0, 2.0, np.sqrt(2)),
+    ])
+    def test_convex_functions_converge_to_tol(self, f, a, b, root):
+        # Plain false position keeps one end fixed on these, and used to
+        # report convergence with errors of up to 1.0
+        result = vectorized_solvers.regula_falsi(f, a, b)
+
+        assert result.converged
+        assert abs(result.roots - root) < EPSILON
+
+    def test_many_lanes(self):
+        c = np.linspace(0.1, 100, 1000)
+
+        result = vectorized_solvers.regula_falsi(lambda x, c: x**2 - c, 0, 11, args=(c,))
+
+        assert result.converged.all()
+        assert np.abs(result.roots - np.sqrt(c)).max() < EPSILON
+
+    def test_triple_root_is_not_reported_as_converged(self):
+        result = vectorized_solvers.regula_falsi(lambda x: (x - 1)**3, 0.0, 3.0)
+
+        assert not result.converged
+
+    def test_bracket_without_a_sign_change_fails(self):
+        # x^2 + 1 has no root; without the check the [2, 3] lane walked
+        # along the secant to x = 3 and was reported as converged
+        result = vectorized_solvers.regula_falsi(lambda x: x**2 + 1, np.array([-1.0, 2.0]),
+                                                 np.array([1.0, 3.0]))
+
+        assert not result.converged.any()
+        assert np.isnan(result.roots).all()
+        assert (result.iterations == 0).all()
+
+
+# ──────────────────────────────────────────────
+# TestVectorizedSolvers
+# ──────────────────────────────────────────────
+class TestVectorizedSolvers:
+    C = np.linspace(0.1, 100, 1000)
+
+    def test_bisection(self):
+        result = vectorized_solvers.bisection(lambda x, c: x**2 - c, 0, 11, args=(self.C,))
+
+        assert result.converged.all()
+        assert np.abs(result.roots - np.sqrt(self.C)).max() < EPSILON
+
+    def test_secant(self):
+        result = vectorized_solvers.secant(lambda x, c: x**2 - c, 10, 11, args=(self.C,))
+
+        assert result.converged.all()
+        assert np.abs(result.roots - np.sqrt(self.C)).max() < EPSILON
+
+    def test_newton(self):
+        result = vectorized_solvers.newton(lambda x, c: x**2 - c, lambda x, c: 2 * x, 11,
+                                           args=(self.C,))
+
+        assert result.converged.all()
+        assert np.abs(result.roots - np.sqrt(self.C)).max() < EPSILON
+
+    def test_newton_fails_where_the_derivative_is_zero(self):
+        result = vectorized_solvers.newton(lambda x: x**2 - 1, lambda x: 2 * x,
+                                           np.array([0.0, 3.0]))
+
+        assert result.converged.tolist() == [False, True]
+        assert np.isnan(result.roots[0])
+
+    def test_result_keeps_broadcast_shape(self):
+        result = vectorized_solvers.bisection(lambda x, c: x**2 - c, 0, 11,
+                                              args=(self.C.reshape(50, 20),))
+
+        assert result.roots.shape == result.iterations.shape == (50, 20)
+
+
+# ──────────────────────────────────────────────
+# TestFindRoots
+# ──────────────────────────────────────────────
+class TestFindRoots:
+    @pytest.mark.parametrize("method", METHODS)
+    def test_all_roots_of_a_cubic(self, method):
+        # (x + 3)(x - 1)(x - 2)
+        f, df = build_f_df("x**3 - 7*x + 6", "numpy")
+
+        roots = find_roots(f, -5, 5, method=method, df=df)
+
+        assert roots.size == 3
+        assert np.abs(roots - [-3, 1, 2]).max() < EPSILON
+
+    def test_roots_on_the_grid_are_found(self):
+        f, _ = build_f_df("x**2 - 3*x - 4", "numpy")
+
+        assert find_roots(f, -10, 10, samples=20).tolist() == [-1.0, 4.0]
+
+    def test_newton_needs_df(self):
+        f, _ = build_f_df("x**2 - 1", "numpy")
+
+        with pytest.raises(ValueError):
+            find_roots(f, -2, 2, method="newton")
+
+    def test_unknown_method(self):
+        f, _ = build_f_df("x**2 - 1", "numpy")
+
+        with pytest.raises(ValueError):
+            find_roots(f, -2, 2, method="brent")
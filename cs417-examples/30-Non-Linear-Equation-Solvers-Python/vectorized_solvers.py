@@ -0,0 +1,275 @@
+"""
+NumPy versions of the solvers in solvers.py that find many roots at once.
+
+Each function takes arrays of brackets (or starting points) and solves every
+element (lane) simultaneously. f (and df) must accept NumPy arrays. Extra
+per-lane parameters can be passed through args, e.g., to solve
+x^2 - c = 0 for 10^5 values of c:
+
+    result = bisection(lambda x, c: x**2 - c, 0, 10, args=(c_values,))
+
+All inputs are broadcast against each other. Lanes that have converged (or
+failed) are frozen: later iterations only gather, evaluate and update the
+lanes that are still active.
+
+Every function returns a BatchResult of arrays with the broadcast shape:
+
+  - roots       the last iterate of each lane (nan if the lane failed)
+  - iterations  the number of iterations each lane ran
+  - converged   True where the stop condition of the method was met
+"""
+
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+from solvers import EPSILON, MAX_ITERATIONS
+
+
+class BatchResult(NamedTuple):
+    roots: np.ndarray
+    iterations: np.ndarray
+    converged: np.ndarray
+
+
+def __lanes(*values) -> tuple:
+    """
+    Broadcast values against each other and return (shape, flat float64
+    copies of every value).
+    """
+
+    arrays = np.broadcast_arrays(*(np.asarray(value, dtype=np.float64) for value in values))
+    shape = arrays[0].shape
+
+    return shape, [array.ravel().copy() for array in arrays]
+
+
+def __result(shape: tuple,
+             roots: np.ndarray,
+             iterations: np.ndarray,
+             converged: np.ndarray) -> BatchResult:
+    return BatchResult(roots.reshape(shape), iterations.reshape(shape), converged.reshape(shape))
+
+
+def bisection(f: Callable,
+              a,
+              b,
+              args: tuple = (),
+              tol: float = EPSILON,
+              max_iterations: int = MAX_ITERATIONS) -> BatchResult:
+    """
+    Vectorized bisection method.
+
+    Unlike solvers.bisection, f(a) and f(b) may have either sign as long as
+    they differ; lanes whose bracket does not change sign fail immediately.
+    A lane stops once |b_n - a_n| < tol (or f(x_n) == 0).
+    """
+
+    shape, (a_n, b_n, *params) = __lanes(a, b, *args)
+
+    fa_n = f(a_n, *params)
+    fb_n = f(b_n, *params)
+
+    roots = np.full(a_n.size, np.nan)
+    iterations = np.zeros(a_n.size, dtype=np.int64)
+    converged = np.zeros(a_n.size, dtype=bool)
+
+    active = np.flatnonzero(np.sign(fa_n) * np.sign(fb_n) <= 0)
+
+    for _ in range(1, max_iterations):
+        if active.size == 0:
+            break
+
+        x_n = (a_n[active] + b_n[active]) / 2
+        fx_n = f(x_n, *(p[active] for p in params))
+
+        # Replace the end point whose f has the same sign as f(x_n)
+        left = np.sign(fx_n) == np.sign(fa_n[active])
+
+        a_n[active[left]] = x_n[left]
+        fa_n[active[left]] = fx_n[left]
+        b_n[active[~left]] = x_n[~left]
+
+        roots[active] = x_n
+        iterations[active] += 1
+
+        done = (np.abs(b_n[active] - a_n[active]) < tol) | (fx_n == 0)
+        converged[active[done]] = True
+        active = active[~done]
+
+    return __result(shape, roots, iterations, converged)
+
+
+def regula_falsi(f: Callable,
+                 a,
+                 b,
+                 args: tuple = (),
+                 tol: float = EPSILON,
+                 max_iterations: int = MAX_ITERATIONS) -> BatchResult:
+    """
+    Vectorized false position method, with the Illinois modification.
+
+    Plain false position often moves only one end of the bracket (e.g., for
+    convex f), so |b_n - a_n| never shrinks. Whenever the same end is kept
+    twice in a row, its f value is halved, which pulls the next iterate
+    across the root and closes the bracket from both sides.
+
+    As in bisection, lanes whose bracket does not change sign fail
+    immediately. A lane stops once |b_n - a_n| < tol (the condition
+    solvers.regula_falsi uses) or f(x_n) == 0. Lanes where f(a_n) == f(b_n)
+    fail. Near roots of multiplicity 3 or more, f shrinks faster than the
+    halving, so (like solvers.regula_falsi) the bracket does not close and
+    the lane is reported as not converged.
+    """
+
+    shape, (a_n, b_n, *params) = __lanes(a, b, *args)
+
+    fa_n = f(a_n, *params)
+    fb_n = f(b_n, *params)
+
+    roots = np.full(a_n.size, np.nan)
+    iterations = np.zeros(a_n.size, dtype=np.int64)
+    converged = np.zeros(a_n.size, dtype=bool)
+
+    # End replaced by the previous iteration: 1 for a_n, -1 for b_n
+    replaced = np.zeros(a_n.size, dtype=np.int8)
+    active = np.flatnonzero(np.sign(fa_n) * np.sign(fb_n) <= 0)
+
+    for _ in range(1, max_iterations):
+        if active.size == 0:
+            break
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_n = (a_n[active]
+                   - ((a_n[active] - b_n[active]) / (fa_n[active] - fb_n[active])) * fa_n[active])
+
+        # Division by zero: freeze the lane as failed
+        failed = ~np.isfinite(x_n)
+        roots[active[failed]] = np.nan
+        active, x_n = active[~failed], x_n[~failed]
+
+        fx_n = f(x_n, *(p[active] for p in params))
+
+        left = fx_n * fa_n[active] > 0
+
+        # Illinois: halve f at the end that is kept for a second time
+        fb_n[active[left & (replaced[active] == 1)]] /= 2
+        fa_n[active[~left & (replaced[active] == -1)]] /= 2
+
+        a_n[active[left]] = x_n[left]
+        fa_n[active[left]] = fx_n[left]
+        b_n[active[~left]] = x_n[~left]
+        fb_n[active[~left]] = fx_n[~left]
+        replaced[active] = np.where(left, 1, -1)
+
+        roots[active] = x_n
+        iterations[active] += 1
+
+        done = (np.abs(b_n[active] - a_n[active]) < tol) | (fx_n == 0)
+
+        converged[active[done]] = True
+        active = active[~done]
+
+    return __result(shape, roots, iterations, converged)
+
+
+def secant(f: Callable,
+           x_n_minus_1,
+           x_n,
+           args: tuple = (),
+           tol: float = EPSILON,
+           max_iterations: int = MAX_ITERATIONS) -> BatchResult:
+    """
+    Vectorized secant method.
+
+    A lane stops once |x_{n+1} - x_n| < tol. Lanes where
+    f(x_n) == f(x_{n-1}) (or whose iterates stop being finite) fail.
+    """
+
+    shape, (x_prev, x_curr, *params) = __lanes(x_n_minus_1, x_n, *args)
+
+    f_prev = f(x_prev, *params)
+    f_curr = f(x_curr, *params)
+
+    roots = np.full(x_curr.size, np.nan)
+    iterations = np.zeros(x_curr.size, dtype=np.int64)
+    converged = np.zeros(x_curr.size, dtype=bool)
+
+    active = np.arange(x_curr.size)
+
+    for _ in range(2, max_iterations):
+        if active.size == 0:
+            break
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            next_x_n = (x_curr[active]
+                        - ((x_curr[active] - x_prev[active])
+                           / (f_curr[active] - f_prev[active])) * f_curr[active])
+
+        failed = ~np.isfinite(next_x_n)
+        roots[active[failed]] = np.nan
+        active, next_x_n = active[~failed], next_x_n[~failed]
+
+        f_next = f(next_x_n, *(p[active] for p in params))
+
+        x_prev[active] = x_curr[active]
+        f_prev[active] = f_curr[active]
+        x_curr[active] = next_x_n
+        f_curr[active] = f_next
+
+        roots[active] = next_x_n
+        iterations[active] += 1
+
+        done = np.abs(x_curr[active] - x_prev[active]) < tol
+        converged[active[done]] = True
+        active = active[~done]
+
+    return __result(shape, roots, iterations, converged)
+
+
+def newton(f: Callable,
+           df: Callable,
+           x_n,
+           args: tuple = (),
+           tol: float = EPSILON,
+           max_iterations: int = MAX_ITERATIONS) -> BatchResult:
+    """
+    Vectorized Newton's method.
+
+    A lane stops once |x_{n+1} - x_n| < tol; its root is x_{n+1} (the most
+    accurate iterate). Lanes where df(x_n) == 0 (or whose iterates stop
+    being finite) fail.
+    """
+
+    shape, (x_curr, *params) = __lanes(x_n, *args)
+
+    roots = np.full(x_curr.size, np.nan)
+    iterations = np.zeros(x_curr.size, dtype=np.int64)
+    converged = np.zeros(x_curr.size, dtype=bool)
+
+    active = np.arange(x_curr.size)
+
+    for _ in range(1, max_iterations):
+        if active.size == 0:
+            break
+
+        lane_params = [p[active] for p in params]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            next_x_n = (x_curr[active]
+                        - f(x_curr[active], *lane_params) / df(x_curr[active], *lane_params))
+
+        failed = ~np.isfinite(next_x_n)
+        roots[active[failed]] = np.nan
+        active, next_x_n = active[~failed], next_x_n[~failed]
+
+        done = np.abs(next_x_n - x_curr[active]) < tol
+
+        x_curr[active] = next_x_n
+        roots[active] = next_x_n
+        iterations[active] += 1
+
+        converged[active[done]] = True
+        active = active[~done]
+
+    return __result(shape, roots, iterations, converged)
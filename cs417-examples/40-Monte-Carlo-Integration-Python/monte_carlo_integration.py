@@ -1,14 +1,31 @@
 #! /usr/bin/env python3
 
+import math
+import os
 import random
 import sys
 import time
-from typing import Callable, Generator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Generator, NamedTuple
 
 import numpy as np
 
 Point = tuple[float, float]
 
+DEFAULT_CHUNK_SIZE = 2 ** 20
+
+# Number of independent random streams the points of integrate_parallel are
+# split into, whatever the number of worker processes. Each stream runs on
+# one worker, so with more workers than streams the extra workers sit idle
+# (main_parallel raises the count to a multiple of os.cpu_count()).
+DEFAULT_STREAMS = 64
+
+
+class MonteCarloResult(NamedTuple):
+    num_points: int
+    estimate: float
+    standard_error: float
+
 def simple_timer(function):
     """
     This is a simple timer meant to be used as a decorator.
@@ -51,6 +68,189 @@ def generate_random_points(f: Callable[[float], float],
         yield (x, y)
 
 
+def square(x):
+    """
+    f(x) = x**2, defined at module level (unlike a lambda) so that it can be
+    sent to worker processes
+    """
+
+    return x**2
+
+
+def __draw_chunks(rng: np.random.Generator,
+                  lower_limit: float,
+                  upper_limit: float,
+                  num_points: int,
+                  chunk_size: int) -> Generator[tuple[int, np.ndarray], None, None]:
+    """
+    Draw num_points uniform x values, chunk_size at a time, into one reused
+    buffer.
+
+    Yields:
+        (index of the first point, chunk of x values); each chunk is
+        overwritten by the next one
+    """
+
+    width = upper_limit - lower_limit
+    x_values = np.empty(min(chunk_size, num_points))
+
+    for start in range(0, num_points, chunk_size):
+        # Fill the chunk in place: x = a + (b - a) * U[0, 1)
+        chunk = x_values[:min(chunk_size, num_points - start)]
+        rng.random(out=chunk)
+        chunk *= width
+        chunk += lower_limit
+
+        yield (start, chunk)
+
+
+def integrate_in_chunks(f: Callable[[np.ndarray], np.ndarray],
+                        lower_limit: float,
+                        upper_limit: float,
+                        max_magnitude: int,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        rng: np.random.Generator | None = None) -> Generator[tuple[int, float], None, None]:
+    """
+    Estimate the integral of f over [lower_limit, upper_limit] using
+    2**max_magnitude random points, drawn chunk_size points at a time.
+
+    Only one chunk of x values (and f(x) values) exists at any time, and
+    the sum of f(x) is accumulated as the chunks are drawn, so memory use
+    does not depend on max_magnitude.
+
+    Args:
+        f: mathematical function that accepts (and returns) NumPy arrays
+        lower_limit: 'a' the lower bound
+        upper_limit: 'b' the upper bound
+        max_magnitude: the largest number of points is 2**max_magnitude
+        chunk_size: number of points drawn (and evaluated) at once
+        rng: source of random numbers (a new default_rng() if None)
+
+    Yields:
+        (number of points, estimate) for 1, 2, 4, ..., 2**max_magnitude
+        points
+    """
+
+    if rng is None:
+        rng = np.random.default_rng()
+
+    width = upper_limit - lower_limit
+    max_num_points = 2 ** max_magnitude
+
+    next_checkpoint = 1
+    running_sum = 0.0
+
+    for start, chunk in __draw_chunks(rng, lower_limit, upper_limit, max_num_points, chunk_size):
+        f_of_x_values = f(chunk)
+
+        # Checkpoints that land inside this chunk need a partial sum
+        while next_checkpoint <= start + chunk.size:
+            partial_sum = running_sum + float(f_of_x_values[:next_checkpoint - start].sum())
+
+            yield (next_checkpoint, width / float(next_checkpoint) * partial_sum)
+
+            next_checkpoint *= 2
+
+        running_sum += float(f_of_x_values.sum())
+
+
+def __sum_worker(f: Callable[[np.ndarray], np.ndarray],
+                 lower_limit: float,
+                 upper_limit: float,
+                 num_points: int,
+                 seed: np.random.SeedSequence,
+                 chunk_size: int) -> tuple[list[float], list[float]]:
+    """
+    Evaluate f at num_points random points drawn from seed's stream.
+
+    Returns:
+        (sum of f(x), sum of f(x)**2) for every chunk, in order
+    """
+
+    rng = np.random.default_rng(seed)
+
+    sums = []
+    sums_of_squares = []
+
+    for _, chunk in __draw_chunks(rng, lower_limit, upper_limit, num_points, chunk_size):
+        f_of_x_values = f(chunk)
+        sums.append(float(f_of_x_values.sum()))
+
+        np.square(f_of_x_values, out=f_of_x_values)
+        sums_of_squares.append(float(f_of_x_values.sum()))
+
+    return (sums, sums_of_squares)
+
+
+def integrate_parallel(f: Callable[[np.ndarray], np.ndarray],
+                       lower_limit: float,
+                       upper_limit: float,
+                       num_points: int,
+                       workers: int | None = None,
+                       seed: int | np.random.SeedSequence | None = None,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       streams: int = DEFAULT_STREAMS) -> MonteCarloResult:
+    """
+    Estimate the integral of f over [lower_limit, upper_limit] with
+    num_points random points, split across worker processes.
+
+    The points are split into a fixed number of streams, spawned from one
+    SeedSequence, so the streams are independent. The worker processes
+    share out the streams, and the per-chunk sums of every stream are
+    combined with math.fsum, which rounds only once. The result is
+    therefore the same bit for bit for a given seed, number of streams and
+    chunk size, on any number of workers.
+
+    Args:
+        f: mathematical function that accepts (and returns) NumPy arrays;
+           it must be defined at module level (not a lambda) so that it can
+           be sent to the workers
+        lower_limit: 'a' the lower bound
+        upper_limit: 'b' the upper bound
+        num_points: total number of points
+        workers: number of processes (os.cpu_count() if None); with one
+                 worker everything runs in this process
+        seed: entropy for the SeedSequence (fresh entropy if None)
+        chunk_size: number of points each stream draws at once
+        streams: number of independent streams (at least the number of
+                 workers, to keep every worker busy)
+
+    Returns:
+        the number of points, the estimate and its standard error
+    """
+
+    if num_points < 2:
+        raise ValueError("At least 2 points are needed")
+
+    workers = workers or os.cpu_count() or 1
+    seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+
+    # The first (num_points % streams) streams take one extra point
+    points_per_stream = [num_points // streams + (1 if i < num_points % streams else 0)
+                         for i in range(streams)]
+
+    stream_args = [(f, lower_limit, upper_limit, n, child, chunk_size)
+                   for n, child in zip(points_per_stream, seed_sequence.spawn(streams))]
+
+    if workers == 1:
+        partial_sums = [__sum_worker(*args) for args in stream_args]
+
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partial_sums = list(executor.map(__sum_worker, *zip(*stream_args)))
+
+    total = math.fsum(value for sums, _ in partial_sums for value in sums)
+    total_of_squares = math.fsum(value for _, squares in partial_sums for value in squares)
+
+    width = upper_limit - lower_limit
+    mean = total / num_points
+    variance = max(total_of_squares / num_points - mean**2, 0.0) * num_points / (num_points - 1)
+
+    return MonteCarloResult(num_points,
+                            width * mean,
+                            width * math.sqrt(variance / num_points))
+
+
 def __parse_cmd_line_args() -> tuple[int, float, float, int | None]:
     """
     This is a helper/utility function to parse command line arguments, 3 of
@@ -205,9 +405,59 @@ def main_with_numpy_better():
         print(f"| {num_points:>16} | {integral_result:^20.8f} |")
 
 
+@simple_timer
+def main_with_numpy_chunks():
+    """
+    This main produces the same table as main_with_numpy, but draws the
+    points in fixed-size chunks so that 2**30 (or more) points fit in memory
+    """
+
+    _, limit_a, limit_b, max_magnitude = __parse_cmd_line_args()
+
+    if not max_magnitude:
+        raise ValueError("No 'max_magnitude' was provided")
+
+    math_f = lambda x: x**2
+
+    print("| {:^16} | {:^20} |".format("# Points", "Est. f(x)"))
+
+    for num_points, integral_result in integrate_in_chunks(math_f, limit_a, limit_b, max_magnitude):
+        print(f"| {num_points:>16} | {integral_result:^20.8f} |")
+
+
+@simple_timer
+def main_parallel():
+    """
+    This main splits num_points across every core. The points are drawn
+    from at least DEFAULT_STREAMS streams, rounded up to a multiple of the
+    number of cores so that every core gets the same number of streams.
+
+    The result depends on the seed and the number of streams, not on the
+    number of cores: passing the seed and stream count it prints (as the
+    5th and 6th arguments) reproduces the run exactly, on any machine.
+    """
+
+    num_points, limit_a, limit_b, _ = __parse_cmd_line_args()
+    seed = int(sys.argv[5]) if len(sys.argv) >= 6 else None
+
+    seed_sequence = np.random.SeedSequence(seed)
+    workers = os.cpu_count() or 1
+    streams = (int(sys.argv[6]) if len(sys.argv) >= 7
+               else -(-DEFAULT_STREAMS // workers) * workers)
+
+    result = integrate_parallel(square, limit_a, limit_b, num_points,
+                                workers=workers, seed=seed_sequence, streams=streams)
+
+    print("| {:^16} | {:^8} | {:^20} | {:^14} |".format("# Points", "Workers", "Est. f(x)", "Std. Error"))
+    print(f"| {result.num_points:>16} | {workers:>8} | {result.estimate:^20.8f} | {result.standard_error:^14.4e} |")
+    print(f"Seed: {seed_sequence.entropy} ({streams} streams)")
+
+
 if __name__ == "__main__":
     #  naive_main()
     #  not_so_naive_main()
     main_without_a_table_flip()
     main_with_numpy()
     main_with_numpy_better()
+    main_with_numpy_chunks()
+    main_parallel()
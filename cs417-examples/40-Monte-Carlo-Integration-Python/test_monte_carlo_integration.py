@@ -0,0 +1,91 @@
+"""
+Test suite for monte_carlo_integration.py
+
+Tests cover:
+  - Chunked integration: checkpoints, chunk size independence and
+    reproducibility with a fixed seed
+  - Parallel integration: reproducibility with a fixed seed, independence
+    from the number of workers and the standard error
+"""
+
+import numpy as np
+import pytest
+
+from monte_carlo_integration import integrate_in_chunks, integrate_parallel, square
+
+SEED = 417
+
+
+# ──────────────────────────────────────────────
+# TestIntegrateInChunks
+# ──────────────────────────────────────────────
+class TestIntegrateInChunks:
+    def test_checkpoints_double(self):
+        estimates = list(integrate_in_chunks(square, 0, 1, 10, chunk_size=100,
+                                             rng=np.random.default_rng(SEED)))
+
+        assert [n for n, _ in estimates] == [2 ** k for k in range(11)]
+
+    def test_fixed_seed_is_reproducible(self):
+        first = list(integrate_in_chunks(square, 0, 1, 12, rng=np.random.default_rng(SEED)))
+        second = list(integrate_in_chunks(square, 0, 1, 12, rng=np.random.default_rng(SEED)))
+
+        assert first == second
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1000, 2 ** 12])
+    def test_chunk_size_does_not_change_the_points(self, chunk_size):
+        whole = list(integrate_in_chunks(square, 0, 1, 12, chunk_size=2 ** 12,
+                                         rng=np.random.default_rng(SEED)))
+        chunked = list(integrate_in_chunks(square, 0, 1, 12, chunk_size=chunk_size,
+                                           rng=np.random.default_rng(SEED)))
+
+        assert [n for n, _ in chunked] == [n for n, _ in whole]
+        assert [estimate for _, estimate in chunked] == pytest.approx(
+            [estimate for _, estimate in whole], rel=1e-12)
+
+    def test_estimate_converges(self):
+        *_, (n, estimate) = integrate_in_chunks(square, -1, 2, 20,
+                                                rng=np.random.default_rng(SEED))
+
+        assert n == 2 ** 20
+        assert estimate == pytest.approx(3.0, abs=0.01)
+
+
+# ──────────────────────────────────────────────
+# TestIntegrateParallel
+# ──────────────────────────────────────────────
+class TestIntegrateParallel:
+    def test_fixed_seed_is_reproducible(self):
+        first = integrate_parallel(square, 0, 1, 10 ** 5, workers=1, seed=SEED)
+        second = integrate_parallel(square, 0, 1, 10 ** 5, workers=1, seed=SEED)
+
+        assert first == second
+
+    def test_different_seeds_differ(self):
+        first = integrate_parallel(square, 0, 1, 10 ** 5, workers=1, seed=SEED)
+        second = integrate_parallel(square, 0, 1, 10 ** 5, workers=1, seed=SEED + 1)
+
+        assert first.estimate != second.estimate
+
+    def test_result_does_not_depend_on_workers(self):
+        serial = integrate_parallel(square, 0, 1, 10 ** 5, workers=1, seed=SEED, streams=8)
+        parallel = integrate_parallel(square, 0, 1, 10 ** 5, workers=2, seed=SEED, streams=8)
+
+        assert parallel == serial
+
+    def test_uneven_split_uses_every_point(self):
+        result = integrate_parallel(square, 0, 1, 1001, workers=1, seed=SEED, streams=64)
+
+        assert result.num_points == 1001
+
+    def test_estimate_is_within_the_standard_error(self):
+        result = integrate_parallel(square, 0, 1, 10 ** 6, workers=1, seed=SEED,
+                                    chunk_size=10 ** 5)
+
+        # Var(x^2) for x ~ U[0, 1) is 4/45
+        assert result.standard_error == pytest.approx((4 / 45 / 10 ** 6) ** 0.5, rel=0.01)
+        assert abs(result.estimate - 1 / 3) < 5 * result.standard_error
+
+    def test_needs_two_points(self):
+        with pytest.raises(ValueError):
+            integrate_parallel(square, 0, 1, 1, workers=1)